@@ -0,0 +1,592 @@
+"""
+An asyncio-compatible client for the Airtable API, built on
+`httpx <https://www.python-httpx.org/>`__. Install it with:
+
+.. code-block:: shell
+
+    pip install 'pyairtable[async]'
+
+These classes mirror a subset of :class:`~pyairtable.Api`, :class:`~pyairtable.Base`,
+and :class:`~pyairtable.Table`. URL building, request parameters, and response
+handling are delegated to those synchronous classes; only the network I/O differs.
+"""
+
+import asyncio
+from functools import partialmethod
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+import requests
+from urllib3.exceptions import MaxRetryError
+
+from pyairtable.api import retrying
+from pyairtable.api.api import Api, TimeoutTuple, _next_offset
+from pyairtable.api.ratelimit import RateLimiter, base_id_from_url
+from pyairtable.api.table import Table, _validate_upsert_records
+from pyairtable.api.types import (
+    FieldName,
+    RecordDeletedDict,
+    RecordDict,
+    RecordId,
+    UpdateRecordDict,
+    UpsertResultDict,
+    ValidationMode,
+    WritableFields,
+    assert_typed_dict,
+    assert_typed_dicts,
+)
+from pyairtable.formulas import Formula, to_formula_str
+
+try:
+    import httpx
+except ImportError as exc:  # pragma: no cover
+    raise ImportError(
+        "pyairtable.api.aio requires httpx; install it with `pip install 'pyairtable[async]'`"
+    ) from exc
+
+T = TypeVar("T")
+
+
+class AsyncApi:
+    """
+    Represents an Airtable API, with methods that must be awaited.
+
+    Usage:
+        >>> async with AsyncApi('auth_token') as api:
+        ...     table = api.table('base_id', 'table_name')
+        ...     records = await table.all()
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        *,
+        timeout: Optional[TimeoutTuple] = None,
+        retry_strategy: Optional[Union[bool, retrying.Retry]] = True,
+        endpoint_url: str = "https://api.airtable.com",
+        client: Optional["httpx.AsyncClient"] = None,
+        rate_limit: Optional[Union[bool, float, RateLimiter]] = None,
+        json_decoder: Optional[Callable[[bytes], Any]] = None,
+        validate_responses: ValidationMode = "full",
+    ):
+        """
+        Args:
+            api_key: An Airtable API key or personal access token.
+            timeout: A tuple indicating a connect and read timeout.
+                Default is ``None`` (no timeout).
+            retry_strategy: An instance of
+                `urllib3.util.Retry <https://urllib3.readthedocs.io/en/stable/reference/urllib3.util.html#urllib3.util.Retry>`_.
+                Only status-based retries are applied.
+                If ``None`` or ``False``, requests will not be retried.
+                If ``True``, the default strategy will be applied
+                (see :func:`~pyairtable.retry_strategy` for details).
+            endpoint_url: The API endpoint to use. Override this if you are using
+                a debugging or caching proxy.
+            client: An ``httpx.AsyncClient`` to send requests with.
+                If not provided, one will be created and closed by :meth:`aclose`.
+            rate_limit: Limits how quickly requests are sent to each base.
+                See :class:`~pyairtable.Api` for details.
+            json_decoder: A function which accepts the ``bytes`` of a response
+                body and returns the decoded JSON.
+                See :class:`~pyairtable.Api` for details.
+            validate_responses: How thoroughly to check records received from the API.
+                See :class:`~pyairtable.Api` for details.
+        """
+        if retry_strategy is True:
+            retry_strategy = retrying.retry_strategy()
+        self.retry_strategy = retry_strategy or None
+
+        #: The synchronous :class:`~pyairtable.Api` used to build URLs and requests.
+        #: It never sends any requests on behalf of this instance.
+        self.sync = Api(
+            api_key,
+            timeout=timeout,
+            retry_strategy=None,
+            endpoint_url=endpoint_url,
+            rate_limit=rate_limit,
+            json_decoder=json_decoder,
+            validate_responses=validate_responses,
+        )
+
+        self._owns_client = client is None
+        self.client = client or httpx.AsyncClient()
+
+    @property
+    def api_key(self) -> str:
+        """
+        Airtable API key or access token to use on all connections.
+        """
+        return self.sync.api_key
+
+    @api_key.setter
+    def api_key(self, value: str) -> None:
+        self.sync.api_key = value
+
+    @property
+    def timeout(self) -> Optional[TimeoutTuple]:
+        return self.sync.timeout
+
+    @property
+    def rate_limiter(self) -> Optional[RateLimiter]:
+        return self.sync.rate_limiter
+
+    @property
+    def json_decoder(self) -> Callable[[bytes], Any]:
+        return self.sync.json_decoder
+
+    @property
+    def validate_responses(self) -> ValidationMode:
+        return self.sync.validate_responses
+
+    def __repr__(self) -> str:
+        return "<pyairtable.AsyncApi>"
+
+    async def __aenter__(self) -> "AsyncApi":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """
+        Close the underlying ``httpx.AsyncClient``, unless it was provided by the caller.
+        """
+        if self._owns_client:
+            await self.client.aclose()
+
+    def base(self, base_id: str) -> "AsyncBase":
+        """
+        Return a new :class:`AsyncBase` instance that uses this instance of :class:`AsyncApi`.
+
+        Args:
+            base_id: |arg_base_id|
+        """
+        return AsyncBase(self, base_id)
+
+    def table(self, base_id: str, table_name: str) -> "AsyncTable":
+        """
+        Build a new :class:`AsyncTable` instance that uses this instance of :class:`AsyncApi`.
+
+        Args:
+            base_id: |arg_base_id|
+            table_name: The Airtable table's ID or name.
+        """
+        return self.base(base_id).table(table_name)
+
+    def build_url(self, *components: str) -> str:
+        """
+        Build a URL to the Airtable API endpoint with the given URL components,
+        including the API version number.
+        """
+        return self.sync.build_url(*components)
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        fallback: Optional[Tuple[str, str]] = None,
+        options: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        json: Optional[Dict[str, Any]] = None,
+    ) -> Any:
+        """
+        Make a request to the Airtable API. Accepts the same arguments
+        as :meth:`Api.request <pyairtable.Api.request>`.
+        """
+        prepared = self.sync._prepare_request(
+            method=method,
+            url=url,
+            fallback=fallback,
+            options=options,
+            params=params,
+            json=json,
+        )
+        retry = self.retry_strategy
+        base_id = base_id_from_url(str(prepared.url))
+        while True:
+            if self.rate_limiter and base_id:
+                # Reserve a token without blocking the event loop.
+                await asyncio.sleep(self.rate_limiter.reserve(base_id))
+            response = await self._send(prepared)
+            if not retry or not retry.is_retry(
+                str(prepared.method),
+                response.status_code,
+                "Retry-After" in response.headers,
+            ):
+                break
+            try:
+                retry = retry.increment(str(prepared.method), str(prepared.url))
+            except MaxRetryError as exc:
+                raise requests.exceptions.RetryError(exc, request=prepared)
+            retry_after = response.headers.get("Retry-After")
+            await asyncio.sleep(retrying.get_sleep_time(retry, retry_after))
+
+        return self.sync._process_response(response)
+
+    get = partialmethod(request, "GET")
+    post = partialmethod(request, "POST")
+    patch = partialmethod(request, "PATCH")
+    delete = partialmethod(request, "DELETE")
+
+    async def _send(self, prepared: requests.PreparedRequest) -> requests.Response:
+        """
+        Send a prepared request via httpx, and convert the result into
+        a :class:`requests.Response` so it can be handled by the synchronous API.
+        """
+        timeout = self.timeout
+        sent = await self.client.request(
+            str(prepared.method),
+            str(prepared.url),
+            content=prepared.body,
+            headers=dict(prepared.headers),
+            timeout=(
+                httpx.Timeout(None, connect=timeout[0], read=timeout[1])
+                if timeout
+                else None
+            ),
+        )
+        response = requests.Response()
+        response.status_code = sent.status_code
+        response.reason = sent.reason_phrase
+        response.headers.update(sent.headers)
+        response.url = str(sent.url)
+        response.encoding = sent.encoding
+        response.request = prepared
+        response._content = sent.content
+        return response
+
+    async def iterate_requests(
+        self,
+        method: str,
+        url: str,
+        fallback: Optional[Tuple[str, str]] = None,
+        options: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        offset_field: str = "offset",
+    ) -> AsyncIterator[Any]:
+        """
+        Make one or more requests and iterate through each result. Accepts the same
+        arguments as :meth:`Api.iterate_requests <pyairtable.Api.iterate_requests>`.
+        """
+        # Choose between GET and the fallback once, rather than again for each page.
+        method, url, params, json = self.sync._choose_method(
+            method=method,
+            url=url,
+            fallback=fallback,
+            options=options,
+            params=params,
+            reserve=self.sync.OFFSET_RESERVE,
+        )
+        while True:
+            response = await self.request(
+                method=method,
+                url=url,
+                params=params,
+                json=json,
+            )
+            yield response
+            if not (offset := _next_offset(response, offset_field)):
+                return
+            params = {**params, offset_field: offset}
+
+    def chunked(self, iterable: Sequence[T]) -> Iterable[Sequence[T]]:
+        """
+        Iterate through chunks of the given sequence that are equal in size
+        to the maximum number of records per request allowed by the API.
+        """
+        return self.sync.chunked(iterable)
+
+
+class AsyncBase:
+    """
+    Represents an Airtable base, with methods that must be awaited.
+    """
+
+    #: The connection to the Airtable API.
+    api: AsyncApi
+
+    #: The base ID, in the format ``appXXXXXXXXXXXXXX``
+    id: str
+
+    def __init__(self, api: AsyncApi, base_id: str):
+        self.api = api
+        self.id = base_id
+
+    def __repr__(self) -> str:
+        return f"<pyairtable.AsyncBase base_id={self.id!r}>"
+
+    def table(self, table_name: str) -> "AsyncTable":
+        """
+        Build a new :class:`AsyncTable` instance that uses this instance of :class:`AsyncBase`.
+
+        Args:
+            table_name: The Airtable table's ID or name.
+        """
+        return AsyncTable(self, table_name)
+
+
+class AsyncTable:
+    """
+    Represents an Airtable table, with methods that must be awaited.
+
+    Usage:
+        >>> table = async_api.table("base_id", "table_name")
+        >>> async for page in table.iterate():
+        ...     for record in page:
+        ...         print(record["id"])
+    """
+
+    #: The base that this table belongs to.
+    base: AsyncBase
+
+    #: Can be either the table name or the table ID (``tblXXXXXXXXXXXXXX``).
+    name: str
+
+    def __init__(self, base: AsyncBase, table_name: str):
+        self.base = base
+        self.name = table_name
+        # The synchronous table is only used for building URLs.
+        self._sync = Table(None, base.api.sync.base(base.id), table_name)
+
+    def __repr__(self) -> str:
+        return f"<AsyncTable base={self.base.id!r} name={self.name!r}>"
+
+    @property
+    def api(self) -> AsyncApi:
+        """
+        The API connection used by the table's :class:`AsyncBase`.
+        """
+        return self.base.api
+
+    @property
+    def url(self) -> str:
+        """
+        Build the URL for this table.
+        """
+        return self._sync.url
+
+    def record_url(self, record_id: RecordId, *components: str) -> str:
+        """
+        Build the URL for the given record ID, with optional trailing components.
+        """
+        return self._sync.record_url(record_id, *components)
+
+    async def get(self, record_id: RecordId, **options: Any) -> RecordDict:
+        """
+        Retrieve a record by its ID. See :meth:`Table.get <pyairtable.Table.get>`.
+        """
+        record = await self.api.get(self.record_url(record_id), options=options)
+        return assert_typed_dict(RecordDict, record, mode=self.api.validate_responses)
+
+    async def iterate(self, **options: Any) -> AsyncIterator[List[RecordDict]]:
+        """
+        Iterate through each page of results from `List records <https://airtable.com/developers/web/api/list-records>`_.
+        Accepts the same keyword arguments as :meth:`Table.iterate <pyairtable.Table.iterate>`.
+
+        >>> async for page in table.iterate(page_size=10):
+        ...     print(len(page))
+        10
+        10
+        3
+        """
+        if isinstance(formula := options.get("formula"), Formula):
+            options["formula"] = to_formula_str(formula)
+        async for page in self.api.iterate_requests(
+            method="get",
+            url=self.url,
+            fallback=("post", f"{self.url}/listRecords"),
+            options=options,
+        ):
+            yield assert_typed_dicts(
+                RecordDict, page.get("records", []), mode=self.api.validate_responses
+            )
+
+    async def all(self, **options: Any) -> List[RecordDict]:
+        """
+        Retrieve all matching records in a single list.
+        See :meth:`Table.all <pyairtable.Table.all>`.
+        """
+        return [record async for page in self.iterate(**options) for record in page]
+
+    async def first(self, **options: Any) -> Optional[RecordDict]:
+        """
+        Retrieve the first matching record, or ``None`` if no records are returned.
+        See :meth:`Table.first <pyairtable.Table.first>`.
+        """
+        options.update(dict(page_size=1, max_records=1))
+        async for page in self.iterate(**options):
+            for record in page:
+                return record
+        return None
+
+    async def create(
+        self,
+        fields: WritableFields,
+        typecast: bool = False,
+        use_field_ids: bool = False,
+    ) -> RecordDict:
+        """
+        Create a new record. See :meth:`Table.create <pyairtable.Table.create>`.
+        """
+        created = await self.api.post(
+            url=self.url,
+            json={
+                "fields": fields,
+                "typecast": typecast,
+                "returnFieldsByFieldId": use_field_ids,
+            },
+        )
+        return assert_typed_dict(RecordDict, created, mode=self.api.validate_responses)
+
+    async def batch_create(
+        self,
+        records: Iterable[WritableFields],
+        typecast: bool = False,
+        use_field_ids: bool = False,
+    ) -> List[RecordDict]:
+        """
+        Create a number of new records in batches.
+        See :meth:`Table.batch_create <pyairtable.Table.batch_create>`.
+        """
+        inserted_records = []
+        for chunk in self.api.chunked(list(records)):
+            response = await self.api.post(
+                url=self.url,
+                json={
+                    "records": [{"fields": fields} for fields in chunk],
+                    "typecast": typecast,
+                    "returnFieldsByFieldId": use_field_ids,
+                },
+            )
+            inserted_records += assert_typed_dicts(
+                RecordDict, response["records"], mode=self.api.validate_responses
+            )
+        return inserted_records
+
+    async def update(
+        self,
+        record_id: RecordId,
+        fields: WritableFields,
+        replace: bool = False,
+        typecast: bool = False,
+        use_field_ids: bool = False,
+    ) -> RecordDict:
+        """
+        Update a particular record ID with the given fields.
+        See :meth:`Table.update <pyairtable.Table.update>`.
+        """
+        updated = await self.api.request(
+            method="put" if replace else "patch",
+            url=self.record_url(record_id),
+            json={
+                "fields": fields,
+                "typecast": typecast,
+                "returnFieldsByFieldId": use_field_ids,
+            },
+        )
+        return assert_typed_dict(RecordDict, updated, mode=self.api.validate_responses)
+
+    async def batch_update(
+        self,
+        records: Iterable[UpdateRecordDict],
+        replace: bool = False,
+        typecast: bool = False,
+        use_field_ids: bool = False,
+    ) -> List[RecordDict]:
+        """
+        Update several records in batches.
+        See :meth:`Table.batch_update <pyairtable.Table.batch_update>`.
+        """
+        updated_records = []
+        for chunk in self.api.chunked(list(records)):
+            response = await self.api.request(
+                method="put" if replace else "patch",
+                url=self.url,
+                json={
+                    "records": [{"id": x["id"], "fields": x["fields"]} for x in chunk],
+                    "typecast": typecast,
+                    "returnFieldsByFieldId": use_field_ids,
+                },
+            )
+            updated_records += assert_typed_dicts(
+                RecordDict, response["records"], mode=self.api.validate_responses
+            )
+        return updated_records
+
+    async def batch_upsert(
+        self,
+        records: Iterable[Dict[str, Any]],
+        key_fields: List[FieldName],
+        replace: bool = False,
+        typecast: bool = False,
+        use_field_ids: bool = False,
+    ) -> UpsertResultDict:
+        """
+        Update or create records in batches.
+        See :meth:`Table.batch_upsert <pyairtable.Table.batch_upsert>`.
+        """
+        records = list(records)
+        _validate_upsert_records(records, key_fields)
+        result: UpsertResultDict = {
+            "updatedRecords": [],
+            "createdRecords": [],
+            "records": [],
+        }
+        for chunk in self.api.chunked(records):
+            response = await self.api.request(
+                method="put" if replace else "patch",
+                url=self.url,
+                json={
+                    "records": [
+                        {k: v for (k, v) in record.items() if k in ("id", "fields")}
+                        for record in chunk
+                    ],
+                    "typecast": typecast,
+                    "returnFieldsByFieldId": use_field_ids,
+                    "performUpsert": {"fieldsToMergeOn": key_fields},
+                },
+            )
+            result["updatedRecords"].extend(response["updatedRecords"])
+            result["createdRecords"].extend(response["createdRecords"])
+            result["records"].extend(
+                assert_typed_dicts(
+                    RecordDict, response["records"], mode=self.api.validate_responses
+                )
+            )
+        return result
+
+    async def delete(self, record_id: RecordId) -> RecordDeletedDict:
+        """
+        Delete the given record. See :meth:`Table.delete <pyairtable.Table.delete>`.
+        """
+        return assert_typed_dict(
+            RecordDeletedDict,
+            await self.api.delete(self.record_url(record_id)),
+            mode=self.api.validate_responses,
+        )
+
+    async def batch_delete(
+        self, record_ids: Iterable[RecordId]
+    ) -> List[RecordDeletedDict]:
+        """
+        Delete the given records, operating in batches.
+        See :meth:`Table.batch_delete <pyairtable.Table.batch_delete>`.
+        """
+        deleted_records = []
+        for chunk in self.api.chunked(list(record_ids)):
+            result = await self.api.delete(self.url, params={"records[]": chunk})
+            deleted_records += assert_typed_dicts(
+                RecordDeletedDict, result["records"], mode=self.api.validate_responses
+            )
+        return deleted_records
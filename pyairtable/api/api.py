@@ -1,6 +1,19 @@
 import posixpath
-from functools import partialmethod
-from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, TypeVar, Union
+import threading
+from functools import partialmethod, wraps
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
 import requests
 from requests.sessions import Session
@@ -8,11 +21,26 @@ from typing_extensions import TypeAlias
 
 from pyairtable.api import retrying
 from pyairtable.api.enterprise import Enterprise
-from pyairtable.api.params import options_to_json_and_params, options_to_params
-from pyairtable.api.types import UserAndScopesDict, assert_typed_dict
+from pyairtable.api.params import (
+    estimate_url_length,
+    options_to_json_and_params,
+    options_to_params,
+)
+from pyairtable.api.pool import (
+    DEFAULT_POOL_CONNECTIONS,
+    DEFAULT_POOL_MAXSIZE,
+    PoolingAdapter,
+    PoolStats,
+)
+from pyairtable.api.ratelimit import RateLimiter, base_id_from_url
+from pyairtable.api.types import (
+    UserAndScopesDict,
+    ValidationMode,
+    assert_typed_dict,
+)
 from pyairtable.api.workspace import Workspace
 from pyairtable.models.schema import Bases
-from pyairtable.utils import cache_unless_forced, chunked, enterprise_only
+from pyairtable.utils import cache_unless_forced, chunked, enterprise_only, json_loads
 
 T = TypeVar("T")
 TimeoutTuple: TypeAlias = Tuple[int, int]
@@ -38,6 +66,10 @@ class Api:
     #: Airtable-imposed limit on the length of a URL (including query parameters).
     MAX_URL_LENGTH = 16000
 
+    #: Number of characters to leave free in a URL for the pagination offset
+    #: when deciding whether to paginate a request via GET or POST.
+    OFFSET_RESERVE = 100
+
     # Cached metadata to reduce API calls
     _bases: Optional[Dict[str, "pyairtable.api.base.Base"]] = None
 
@@ -48,6 +80,14 @@ class Api:
         timeout: Optional[TimeoutTuple] = None,
         retry_strategy: Optional[Union[bool, retrying.Retry]] = True,
         endpoint_url: str = "https://api.airtable.com",
+        rate_limit: Optional[Union[bool, float, RateLimiter]] = None,
+        json_decoder: Optional[Callable[[bytes], Any]] = None,
+        validate_responses: ValidationMode = "full",
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        pool_block: bool = False,
+        tcp_keepalive: bool = False,
+        session: Optional[Session] = None,
     ):
         """
         Args:
@@ -63,14 +103,66 @@ class Api:
                 (see :func:`~pyairtable.retry_strategy` for details).
             endpoint_url: The API endpoint to use. Override this if you are using
                 a debugging or caching proxy.
+            rate_limit: Limits how quickly requests are sent to each base.
+                Accepts an instance of :class:`~pyairtable.api.ratelimit.RateLimiter`,
+                or a number of requests per second.
+                If ``True``, requests will be limited to Airtable's documented
+                limit of five requests per second per base.
+                If ``None`` or ``False`` (the default), requests are not limited,
+                except for requests sent concurrently by methods which accept
+                ``workers=``, which always use a default limiter.
+            json_decoder: A function which accepts the ``bytes`` of a response
+                body and returns the decoded JSON. Defaults to
+                :func:`~pyairtable.utils.json_loads`, which uses
+                `orjson <https://github.com/ijl/orjson>`__ if it is installed.
+            validate_responses: How thoroughly to check that records received
+                from the API have the expected structure. ``"full"`` (the default)
+                checks every record, ``"sample"`` checks the first record of each
+                page or batch, and ``"off"`` skips these checks entirely.
+            pool_connections: The number of hosts to keep connection pools for.
+            pool_maxsize: The maximum number of connections to keep open to each
+                host. Increase this if many threads share one instance of :class:`Api`.
+            pool_block: If ``True``, threads will wait for a connection to become
+                available rather than opening more than ``pool_maxsize`` connections.
+            tcp_keepalive: If ``True``, enable TCP keep-alive probes on each connection,
+                so that idle connections are not silently dropped by the network.
+            session: A ``requests.Session`` to share with other instances of :class:`Api`.
+                If provided, it is used as-is, and ``retry_strategy``, ``pool_*`` and
+                ``tcp_keepalive`` are ignored; configure the session's adapters instead,
+                or pass the :attr:`session` of another :class:`Api`.
         """
-        if retry_strategy is True:
-            retry_strategy = retrying.retry_strategy()
-        if not retry_strategy:
-            self.session = Session()
-        else:
-            self.session = retrying._RetryingSession(retry_strategy)
-
+        if validate_responses not in ("off", "sample", "full"):
+            raise ValueError(f"invalid validate_responses={validate_responses!r}")
+
+        self._owns_session = session is None
+        if session is None:
+            if retry_strategy is True:
+                retry_strategy = retrying.retry_strategy()
+            adapter = PoolingAdapter(
+                pool_connections=pool_connections,
+                pool_maxsize=pool_maxsize,
+                pool_block=pool_block,
+                max_retries=retry_strategy or None,
+                tcp_keepalive=tcp_keepalive,
+            )
+            session = Session()
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+        self.session = session
+
+        if rate_limit is True:
+            rate_limit = RateLimiter()
+        elif rate_limit is not None and not isinstance(rate_limit, (bool, RateLimiter)):
+            rate_limit = RateLimiter(rate_limit)
+
+        #: Shared by every :class:`Base` and :class:`Table` created from this instance.
+        self.rate_limiter: Optional[RateLimiter] = rate_limit or None
+        #: Used instead of :attr:`rate_limiter` (if there is none) by requests
+        #: which are sent concurrently on worker threads.
+        self._default_rate_limiter = RateLimiter()
+        self._worker_state = threading.local()
+        self.json_decoder = json_decoder or json_loads
+        self.validate_responses = validate_responses
         self.endpoint_url = endpoint_url
         self.timeout = timeout
         self.api_key = api_key
@@ -84,9 +176,22 @@ class Api:
 
     @api_key.setter
     def api_key(self, value: str) -> None:
-        self.session.headers.update({"Authorization": "Bearer {}".format(value)})
+        # A shared session may be used by instances with different tokens,
+        # so _prepare_request() also sets this header on each request.
+        if self._owns_session:
+            self.session.headers.update({"Authorization": "Bearer {}".format(value)})
         self._api_key = value
 
+    @property
+    def pool_stats(self) -> Optional[PoolStats]:
+        """
+        Connection pool usage for this instance's session, or ``None`` if
+        the session was not configured by :class:`Api`. If the session is shared
+        between several instances, so are these statistics.
+        """
+        adapter = self.session.get_adapter(self.endpoint_url)
+        return getattr(adapter, "pool_stats", None)
+
     def __repr__(self) -> str:
         return "<pyairtable.Api>"
 
@@ -233,40 +338,137 @@ class Api:
             params: Additional query params to append to the URL as-is.
             json: The JSON payload for a POST/PUT/PATCH/DELETE request.
         """
-        # Convert Airtable-specific options to query params, but give priority to query params
-        # that are explicitly passed via `params=`. This is to preserve backwards-compatibility for
-        # any library users who might be calling `self._request` directly.
-        request_params = {
-            **options_to_params(options or {}),
-            **(params or {}),
-        }
+        response = self._send_request(
+            method=method,
+            url=url,
+            fallback=fallback,
+            options=options,
+            params=params,
+            json=json,
+        )
+        return self._process_response(response)
+
+    def _send_request(
+        self,
+        method: str,
+        url: str,
+        fallback: Optional[Tuple[str, str]] = None,
+        options: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        json: Optional[Dict[str, Any]] = None,
+    ) -> requests.Response:
+        """
+        Send a request to the Airtable API and return the unprocessed response.
+        Accepts the same arguments as :meth:`request`.
+        """
+        prepared = self._prepare_request(
+            method=method,
+            url=url,
+            fallback=fallback,
+            options=options,
+            params=params,
+            json=json,
+        )
+        limiter = self.rate_limiter or getattr(self._worker_state, "rate_limiter", None)
+        if limiter and (base_id := base_id_from_url(str(prepared.url))):
+            limiter.acquire(base_id)
+        return self.session.send(prepared, timeout=self.timeout)
+
+    def _worker(self, func: Callable[..., T]) -> Callable[..., T]:
+        """
+        Wrap a function which will be called on a worker thread, so that any
+        requests it sends stay within Airtable's per-base rate limit. If this
+        instance has no :attr:`rate_limiter`, a default one is used, which is
+        shared by every worker thread (but not by requests sent in other ways).
+        """
+        if self.rate_limiter:
+            return func
+        limiter = self._default_rate_limiter
+
+        @wraps(func)
+        def _wrapped(*args: Any, **kwargs: Any) -> T:
+            state = self._worker_state
+            previous = getattr(state, "rate_limiter", None)
+            state.rate_limiter = limiter
+            try:
+                return func(*args, **kwargs)
+            finally:
+                state.rate_limiter = previous
+
+        return _wrapped
 
-        # Build a requests.PreparedRequest so we can examine how long the URL is.
-        prepared = self.session.prepare_request(
+    def _prepare_request(
+        self,
+        method: str,
+        url: str,
+        fallback: Optional[Tuple[str, str]] = None,
+        options: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        json: Optional[Dict[str, Any]] = None,
+    ) -> requests.PreparedRequest:
+        """
+        Build the :class:`~requests.PreparedRequest` that :meth:`request` will send,
+        converting a GET to a POST if the URL would be too long.
+        Accepts the same arguments as :meth:`request`.
+        """
+        method, url, params, json = self._choose_method(
+            method=method,
+            url=url,
+            fallback=fallback,
+            options=options,
+            params=params,
+            json=json,
+        )
+        return self.session.prepare_request(
             requests.Request(
                 method,
                 url=url,
-                params=request_params,
+                params=params,
                 json=json,
+                headers={"Authorization": f"Bearer {self.api_key}"},
             )
         )
 
+    def _choose_method(
+        self,
+        method: str,
+        url: str,
+        fallback: Optional[Tuple[str, str]] = None,
+        options: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        json: Optional[Dict[str, Any]] = None,
+        reserve: int = 0,
+    ) -> Tuple[str, str, Dict[str, Any], Optional[Dict[str, Any]]]:
+        """
+        Convert Airtable-specific options into query params, or (if the URL would
+        be too long) into the JSON body of the fallback request. The length of the
+        URL is estimated from the params, without preparing a request.
+
+        Args:
+            reserve: Additional characters which will be added to the URL later,
+                such as a pagination offset.
+
+        Returns:
+            A 4-tuple of the method, URL, query params, and JSON body to send.
+        """
+        options = options or {}
+        params = params or {}
+        # Give priority to query params that are explicitly passed via `params=`.
+        # This is to preserve backwards-compatibility for any library users who
+        # might be calling `self._request` directly.
+        request_params = {**options_to_params(options), **params}
+
         # If our URL is too long, move *most* (not all) query params into a POST body.
         if (
             fallback
             and method.upper() == "GET"
-            and len(str(prepared.url)) >= self.MAX_URL_LENGTH
+            and estimate_url_length(url, request_params) + reserve
+            >= self.MAX_URL_LENGTH
         ):
-            json, spare_params = options_to_json_and_params(options or {})
-            return self.request(
-                method=fallback[0],
-                url=fallback[1],
-                params={**spare_params, **(params or {})},
-                json=json,
-            )
+            json, spare_params = options_to_json_and_params(options)
+            return (fallback[0], fallback[1], {**spare_params, **params}, json)
 
-        response = self.session.send(prepared, timeout=self.timeout)
-        return self._process_response(response)
+        return (method, url, request_params, json)
 
     get = partialmethod(request, "GET")
     post = partialmethod(request, "POST")
@@ -279,7 +481,7 @@ class Api:
         except requests.exceptions.HTTPError as exc:
             # Attempt to get Error message from response, Issue #16
             try:
-                error_dict = response.json()
+                error_dict = self.json_decoder(response.content)
             except ValueError:
                 pass
             else:
@@ -288,9 +490,10 @@ class Api:
             raise exc
 
         # Some Airtable endpoints will respond with an empty body and a 200.
-        if not response.text:
+        # Decode straight from bytes; response.text would decode the body twice.
+        if not (content := response.content):
             return None
-        return response.json()
+        return self.json_decoder(content)
 
     def iterate_requests(
         self,
@@ -321,36 +524,56 @@ class Api:
             offset_field: The key to use in the API response to determine whether
                 there are additional pages to retrieve.
         """
-        options = options or {}
-        params = params or {}
+        for _, data in self._iterate_responses(
+            method=method,
+            url=url,
+            fallback=fallback,
+            options=options,
+            params=params,
+            offset_field=offset_field,
+        ):
+            yield data
 
-        def _get_offset_field(response: Dict[str, Any]) -> Optional[str]:
-            value = response.get("pagination") or response  # see Enterprise.audit_log
-            field_names = offset_field.split(".")
-            while field_names:
-                if not (value := value.get(field_names.pop(0))):
-                    return None
-            return str(value)
+    def _iterate_responses(
+        self,
+        method: str,
+        url: str,
+        fallback: Optional[Tuple[str, str]] = None,
+        options: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        offset_field: str = "offset",
+    ) -> Iterator[Tuple[requests.Response, Any]]:
+        """
+        Like :meth:`iterate_requests`, but yields each raw response
+        alongside its parsed JSON payload.
+        """
+        # Choose between GET and the fallback once, rather than again for each page.
+        method, url, params, json = self._choose_method(
+            method=method,
+            url=url,
+            fallback=fallback,
+            options=options,
+            params=params,
+            reserve=self.OFFSET_RESERVE,
+        )
 
         while True:
-            response = self.request(
+            response = self._send_request(
                 method=method,
                 url=url,
-                fallback=fallback,
-                options=options,
                 params=params,
+                json=json,
             )
-            yield response
-            if not isinstance(response, dict):
-                return
-            if not (offset := _get_offset_field(response)):
+            data = self._process_response(response)
+            yield (response, data)
+            if not (offset := _next_offset(data, offset_field)):
                 return
             params = {**params, offset_field: offset}
 
-    def chunked(self, iterable: Sequence[T]) -> Iterator[Sequence[T]]:
+    def chunked(self, iterable: Iterable[T]) -> Iterator[Sequence[T]]:
         """
-        Iterate through chunks of the given sequence that are equal in size
-        to the maximum number of records per request allowed by the API.
+        Iterate through chunks of the given sequence or iterable that are equal
+        in size to the maximum number of records per request allowed by the API.
         """
         return chunked(iterable, self.MAX_RECORDS_PER_REQUEST)
 
@@ -362,5 +585,25 @@ class Api:
         return Enterprise(self, enterprise_account_id)
 
 
+def _next_offset(response: Any, offset_field: str = "offset") -> Optional[str]:
+    """
+    Find the value that should be passed to the API to retrieve the next page
+    of results, or ``None`` if the response was the last page.
+
+    Args:
+        response: The parsed JSON response from the API.
+        offset_field: The key to look for in the response. Dotted paths are
+            followed through nested dicts (e.g. ``"pagination.next"``).
+    """
+    if not isinstance(response, dict):
+        return None
+    value = response.get("pagination") or response  # see Enterprise.audit_log
+    field_names = offset_field.split(".")
+    while field_names:
+        if not (value := value.get(field_names.pop(0))):
+            return None
+    return str(value)
+
+
 import pyairtable.api.base  # noqa
 import pyairtable.api.table  # noqa
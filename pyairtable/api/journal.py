@@ -0,0 +1,99 @@
+import hashlib
+import json
+import os
+import threading
+from typing import Any, Dict, Sequence, Tuple, Union
+
+PathType = Union[str, "os.PathLike[str]"]
+
+
+class Journal:
+    """
+    An append-only record of which chunks of a batch operation have been completed,
+    stored as one line of JSON per chunk. This is used by the ``resume=`` argument
+    of :meth:`Table.batch_create <pyairtable.Table.batch_create>` and similar methods.
+
+    Each line records the chunk's position, a digest of the records that were sent,
+    and the API's response for that chunk:
+
+    .. code-block:: json
+
+        {"chunk": 0, "digest": "9f86d081884c7d65", "result": [...]}
+
+    A line which could not be parsed (for example, because the process was killed
+    while writing it) is ignored, and the chunk it describes will be sent again.
+    If the last line of the file is incomplete, it is removed when the file is opened.
+    """
+
+    def __init__(self, path: PathType):
+        """
+        Args:
+            path: The file to read completed chunks from and append new ones to.
+                It will be created if it does not exist.
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._completed: Dict[int, Tuple[str, Any]] = {}
+        if os.path.exists(path):
+            with open(path, "rb+") as fp:
+                data = fp.read()
+                if data and not data.endswith(b"\n"):
+                    # Discard a line which was only partly written, so that
+                    # the next entry is not appended to the end of it.
+                    data = data[: data.rfind(b"\n") + 1]
+                    fp.truncate(len(data))
+            for line in data.splitlines():
+                try:
+                    entry = json.loads(line)
+                    self._completed[entry["chunk"]] = (entry["digest"], entry["result"])
+                except (ValueError, KeyError, TypeError):
+                    continue
+
+    def __repr__(self) -> str:
+        return (
+            f"<Journal path={os.fspath(self.path)!r} completed={len(self._completed)}>"
+        )
+
+    def __contains__(self, index: int) -> bool:
+        return index in self._completed
+
+    @staticmethod
+    def digest(chunk: Sequence[Any]) -> str:
+        """
+        Build a short fingerprint of the records in a chunk.
+        """
+        data = json.dumps(chunk, sort_keys=True, default=str).encode()
+        return hashlib.sha256(data).hexdigest()[:16]
+
+    def check(self, index: int, chunk: Sequence[Any]) -> None:
+        """
+        Raise ``ValueError`` if the journal has a different set of records
+        for the given chunk, which means it was written by a different operation.
+        """
+        if index in self._completed and self._completed[index][0] != self.digest(chunk):
+            raise ValueError(
+                f"chunk {index} does not match journal {os.fspath(self.path)!r};"
+                " was it written by a different operation?"
+            )
+
+    def result(self, index: int) -> Any:
+        """
+        Return the API's response for a chunk which has already been completed.
+        """
+        return self._completed[index][1]
+
+    def add(self, index: int, chunk: Sequence[Any], result: Any) -> None:
+        """
+        Record that a chunk was completed, and flush it to disk.
+        """
+        entry = {"chunk": index, "digest": self.digest(chunk), "result": result}
+        line = json.dumps(entry, separators=(",", ":")) + "\n"
+        with self._lock:
+            with open(self.path, "a", encoding="utf-8") as fp:
+                fp.write(line)
+                fp.flush()
+                os.fsync(fp.fileno())
+            self._completed[index] = (entry["digest"], result)
+
+
+__all__ = ["Journal"]
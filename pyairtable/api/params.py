@@ -1,3 +1,4 @@
+import urllib.parse
 from typing import Any, Dict, List, Tuple
 
 from pyairtable.exceptions import InvalidParameterError
@@ -141,3 +142,24 @@ def options_to_json_and_params(
         json["sort"] = field_names_to_sorting_dict(json.pop("sort"))
 
     return (json, params)
+
+
+def estimate_url_length(url: str, params: Dict[str, Any]) -> int:
+    """
+    Calculate how long a URL will be once the given query params are added to it,
+    without the overhead of building a request.
+
+    Args:
+        url: The URL, which may already contain a query string.
+        params: A dict of query parameters, as returned by :func:`options_to_params`.
+    """
+    # Like the requests library, we skip any params whose value is None.
+    pairs = [
+        (key, value)
+        for key, values in params.items()
+        for value in (values if isinstance(values, (list, tuple)) else [values])
+        if value is not None
+    ]
+    if not pairs:
+        return len(url)
+    return len(url) + 1 + len(urllib.parse.urlencode(pairs))
@@ -0,0 +1,180 @@
+import socket
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, List, Optional, Tuple
+
+from requests.adapters import DEFAULT_POOLBLOCK, DEFAULT_POOLSIZE, HTTPAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.poolmanager import PoolManager
+from urllib3.util.retry import Retry
+
+#: The default number of connection pools (one per host) to keep open.
+DEFAULT_POOL_CONNECTIONS = DEFAULT_POOLSIZE
+
+#: The default number of connections to keep open to any one host.
+DEFAULT_POOL_MAXSIZE = DEFAULT_POOLSIZE
+
+#: How long (in seconds) a connection can sit idle before the OS starts sending
+#: TCP keep-alive probes, how long to wait between probes, and how many probes
+#: can go unanswered before the connection is considered dead.
+KEEPALIVE_IDLE = 60
+KEEPALIVE_INTERVAL = 15
+KEEPALIVE_COUNT = 4
+
+SocketOption = Tuple[int, int, int]
+
+
+def keepalive_socket_options() -> List[SocketOption]:
+    """
+    Return urllib3's default socket options, plus options which enable TCP
+    keep-alive probes on whichever platforms support them. This prevents
+    idle connections from being silently dropped by proxies or NAT gateways.
+    """
+    options: List[SocketOption] = list(HTTPConnection.default_socket_options)
+    options.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+    for name, value in (
+        ("TCP_KEEPIDLE", KEEPALIVE_IDLE),
+        ("TCP_KEEPINTVL", KEEPALIVE_INTERVAL),
+        ("TCP_KEEPCNT", KEEPALIVE_COUNT),
+    ):
+        if hasattr(socket, name):
+            options.append((socket.IPPROTO_TCP, getattr(socket, name), value))
+    return options
+
+
+@dataclass
+class PoolStats:
+    """
+    Describes how connections have been used by :class:`PoolingAdapter`.
+    """
+
+    #: The number of connections which are currently checked out of the pool.
+    checked_out: int = 0
+    #: The largest number of connections checked out at the same time.
+    peak_checked_out: int = 0
+    #: The total number of times a connection was checked out of the pool.
+    checkouts: int = 0
+    #: The total number of seconds spent waiting for a connection to be available.
+    wait_time: float = 0.0
+
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, repr=False, compare=False
+    )
+
+    def _checkout(self, wait_time: float) -> None:
+        with self._lock:
+            self.checked_out += 1
+            self.peak_checked_out = max(self.peak_checked_out, self.checked_out)
+            self.checkouts += 1
+            self.wait_time += wait_time
+
+    def _checkin(self) -> None:
+        with self._lock:
+            self.checked_out = max(0, self.checked_out - 1)
+
+
+class _MeteredHTTPConnectionPool(HTTPConnectionPool):
+    pool_stats: Optional[PoolStats] = None
+
+    def _get_conn(self, timeout: Optional[float] = None) -> Any:
+        start = time.monotonic()
+        conn = super()._get_conn(timeout)
+        if self.pool_stats:
+            self.pool_stats._checkout(time.monotonic() - start)
+        return conn
+
+    def _put_conn(self, conn: Any) -> None:
+        if self.pool_stats:
+            self.pool_stats._checkin()
+        super()._put_conn(conn)
+
+
+class _MeteredHTTPSConnectionPool(_MeteredHTTPConnectionPool, HTTPSConnectionPool):
+    pass
+
+
+class _MeteredPoolManager(PoolManager):
+    def __init__(self, pool_stats: PoolStats, **kwargs: Any):
+        super().__init__(**kwargs)
+        self.pool_stats = pool_stats
+        self.pool_classes_by_scheme = {
+            "http": _MeteredHTTPConnectionPool,
+            "https": _MeteredHTTPSConnectionPool,
+        }
+
+    def _new_pool(self, *args: Any, **kwargs: Any) -> HTTPConnectionPool:
+        pool = super()._new_pool(*args, **kwargs)
+        if isinstance(pool, _MeteredHTTPConnectionPool):
+            pool.pool_stats = self.pool_stats
+        return pool
+
+
+class PoolingAdapter(HTTPAdapter):
+    """
+    An ``HTTPAdapter`` which can enable TCP keep-alive and which records
+    how its connection pools are being used in :attr:`pool_stats`.
+    :class:`~pyairtable.Api` creates one of these automatically.
+    """
+
+    __attrs__ = [*HTTPAdapter.__attrs__, "socket_options"]
+
+    def __init__(
+        self,
+        *,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        pool_block: bool = DEFAULT_POOLBLOCK,
+        max_retries: Optional[Retry] = None,
+        tcp_keepalive: bool = False,
+    ):
+        """
+        Args:
+            pool_connections: The number of hosts to keep connection pools for.
+            pool_maxsize: The maximum number of connections to keep open to each host.
+            pool_block: If ``True``, threads will wait for a connection to become
+                available rather than opening connections beyond ``pool_maxsize``
+                (which are then discarded after use).
+            max_retries: An instance of ``urllib3.util.Retry``, or ``None`` to disable retries.
+            tcp_keepalive: If ``True``, enable TCP keep-alive probes on each connection.
+        """
+        #: Connection pool usage for every host this adapter has connected to.
+        self.pool_stats = PoolStats()
+        self.socket_options = keepalive_socket_options() if tcp_keepalive else None
+        super().__init__(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+            max_retries=max_retries or 0,
+        )
+
+    def init_poolmanager(
+        self,
+        connections: int,
+        maxsize: int,
+        block: bool = DEFAULT_POOLBLOCK,
+        **pool_kwargs: Any,
+    ) -> None:
+        if not hasattr(self, "pool_stats"):  # after unpickling
+            self.pool_stats = PoolStats()
+        # save these values for pickling, as HTTPAdapter does
+        self._pool_connections = connections
+        self._pool_maxsize = maxsize
+        self._pool_block = block
+        if self.socket_options is not None:
+            pool_kwargs.setdefault("socket_options", self.socket_options)
+        self.poolmanager = _MeteredPoolManager(
+            self.pool_stats,
+            num_pools=connections,
+            maxsize=maxsize,
+            block=block,
+            **pool_kwargs,
+        )
+
+
+__all__ = [
+    "PoolStats",
+    "PoolingAdapter",
+    "keepalive_socket_options",
+]
@@ -0,0 +1,160 @@
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Optional
+
+#: Airtable's documented limit of requests per second, per base.
+#: See https://airtable.com/developers/web/api/rate-limits
+DEFAULT_REQUESTS_PER_SECOND = 5.0
+
+_BASE_ID_IN_URL = re.compile(r"/(app[A-Za-z0-9]{14})(?:[/?]|$)")
+
+
+def base_id_from_url(url: str) -> Optional[str]:
+    """
+    Find the base ID that a request URL refers to, or ``None`` if there is not one.
+
+    >>> base_id_from_url("https://api.airtable.com/v0/appLkNDICXNqxSDhG/Contacts")
+    'appLkNDICXNqxSDhG'
+    >>> base_id_from_url("https://api.airtable.com/v0/meta/whoami")
+    """
+    if match := _BASE_ID_IN_URL.search(url):
+        return match[1]
+    return None
+
+
+@dataclass
+class RateLimitStats:
+    """
+    Counters kept by :class:`RateLimiter`, either for a single base or for all bases.
+    """
+
+    #: Number of tokens handed out (i.e. requests allowed to proceed).
+    granted: int = 0
+
+    #: Number of requests which had to wait before proceeding.
+    delayed: int = 0
+
+    #: Total number of seconds that requests spent waiting for a token.
+    wait_time: float = 0.0
+
+    def _add(self, delay: float) -> None:
+        self.granted += 1
+        if delay > 0:
+            self.delayed += 1
+            self.wait_time += delay
+
+
+@dataclass
+class _Bucket:
+    tokens: float
+    updated: float
+    stats: RateLimitStats = field(default_factory=RateLimitStats)
+
+
+class RateLimiter:
+    """
+    A thread-safe token bucket which spaces out requests to each base so that
+    callers stay below Airtable's per-base rate limit, rather than relying
+    on retries after the API has returned a 429 error.
+
+    :class:`~pyairtable.Api` accepts this via the ``rate_limit=`` parameter,
+    and every :class:`~pyairtable.Base` and :class:`~pyairtable.Table`
+    built from that instance will share it.
+
+        >>> from pyairtable import Api
+        >>> from pyairtable.api.ratelimit import RateLimiter
+        >>> api = Api('auth_token', rate_limit=RateLimiter(4.5))
+        >>> api.table('base_id', 'table_name').all()
+        >>> api.rate_limiter.stats()
+        RateLimitStats(granted=12, delayed=7, wait_time=1.34)
+    """
+
+    def __init__(
+        self,
+        requests_per_second: float = DEFAULT_REQUESTS_PER_SECOND,
+        burst: float = 1,
+    ):
+        """
+        Args:
+            requests_per_second: The rate at which tokens are replenished for each base.
+            burst: The maximum number of tokens a base can accumulate while idle.
+                Defaults to ``1``, which spaces requests evenly so that no one-second
+                window has more than ``requests_per_second`` requests. Larger values
+                allow short bursts which may exceed Airtable's rate limit.
+        """
+        if requests_per_second <= 0:
+            raise ValueError("requests_per_second must be positive")
+        self.requests_per_second = requests_per_second
+        self.burst = max(1.0, burst)
+        self._buckets: Dict[str, _Bucket] = {}
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f"<RateLimiter requests_per_second={self.requests_per_second!r}>"
+
+    def reserve(self, key: str) -> float:
+        """
+        Take a token for the given key and return the number of seconds
+        the caller must wait before using it. Does not block.
+
+        Args:
+            key: The bucket to take a token from; usually a base ID.
+        """
+        with self._lock:
+            now = time.monotonic()
+            if not (bucket := self._buckets.get(key)):
+                bucket = self._buckets[key] = _Bucket(self.burst, now)
+            elapsed = now - bucket.updated
+            bucket.tokens = min(
+                self.burst,
+                bucket.tokens + elapsed * self.requests_per_second,
+            )
+            bucket.updated = now
+            # Tokens can go negative; each waiting caller reserves its own slot
+            # in the future, which keeps callers in order without holding the lock.
+            bucket.tokens -= 1
+            delay = max(0.0, -bucket.tokens / self.requests_per_second)
+            bucket.stats._add(delay)
+            return delay
+
+    def acquire(self, key: str) -> float:
+        """
+        Block until a token is available for the given key.
+
+        Args:
+            key: The bucket to take a token from; usually a base ID.
+
+        Returns:
+            The number of seconds spent waiting.
+        """
+        if (delay := self.reserve(key)) > 0:
+            time.sleep(delay)
+        return delay
+
+    def stats(self, key: Optional[str] = None) -> RateLimitStats:
+        """
+        Return a snapshot of the limiter's counters.
+
+        Args:
+            key: If provided, only return counters for this base ID.
+                Otherwise, return the totals across all bases.
+        """
+        with self._lock:
+            buckets = list(self._buckets.values())
+            if key is not None:
+                buckets = [self._buckets[key]] if key in self._buckets else []
+            total = RateLimitStats()
+            for bucket in buckets:
+                total.granted += bucket.stats.granted
+                total.delayed += bucket.stats.delayed
+                total.wait_time += bucket.stats.wait_time
+            return total
+
+
+__all__ = [
+    "RateLimiter",
+    "RateLimitStats",
+    "base_id_from_url",
+]
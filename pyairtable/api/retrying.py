@@ -1,20 +1,37 @@
+import random
+import time
+from itertools import takewhile
 from typing import Any, Collection, Optional, Tuple, Union
 
-from requests import Session
-from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
-DEFAULT_RETRIABLE_STATUS_CODES = (429,)
+DEFAULT_RETRIABLE_STATUS_CODES = (429, 500, 502, 503, 504)
 DEFAULT_BACKOFF_FACTOR = 0.1  # retry after 0.1, 0.2, 0.4, 0.8, 1.6 seconds
+DEFAULT_BACKOFF_JITTER = 0.5  # ...each multiplied by a random factor in [0.5, 1.5)
 DEFAULT_MAX_RETRIES = 5
 
+#: Methods which are safe to repeat after a server error or a dropped connection,
+#: because sending them twice has the same effect as sending them once.
+#: PATCH and PUT are used for both updates and upserts; repeating an upsert
+#: will match (via ``fieldsToMergeOn``) any records created by the first attempt,
+#: rather than creating them again. POST (create) is deliberately excluded.
+DEFAULT_IDEMPOTENT_METHODS = frozenset(
+    ["GET", "HEAD", "OPTIONS", "PATCH", "PUT", "DELETE"]
+)
+
+#: Status codes which indicate the request was rejected without being processed,
+#: so it can be retried regardless of the HTTP method.
+DEFAULT_ALWAYS_RETRIABLE_STATUS_CODES = (429,)
+
 
 def retry_strategy(
     *,
     status_forcelist: Tuple[int, ...] = DEFAULT_RETRIABLE_STATUS_CODES,
     backoff_factor: Union[int, float] = DEFAULT_BACKOFF_FACTOR,
     total: int = DEFAULT_MAX_RETRIES,
-    allowed_methods: Optional[Collection[str]] = None,
+    allowed_methods: Optional[Collection[str]] = DEFAULT_IDEMPOTENT_METHODS,
+    jitter: float = DEFAULT_BACKOFF_JITTER,
+    always_retry: Collection[int] = DEFAULT_ALWAYS_RETRIABLE_STATUS_CODES,
     **kwargs: Any,
 ) -> Retry:
     """
@@ -27,10 +44,10 @@ def retry_strategy(
         >>> from pyairtable import Api, retry_strategy
         >>> api = Api('auth_token', retry_strategy=retry_strategy(total=10))
 
-    Or to retry certain types of server errors in addition to rate limiting errors:
+    Or to only retry rate limiting errors, and not server errors:
 
         >>> from pyairtable import Api, retry_strategy
-        >>> retry = retry_strategy(status_forcelist=(429, 500, 502, 503, 504))
+        >>> retry = retry_strategy(status_forcelist=(429,))
         >>> api = Api('auth_token', retry_strategy=retry)
 
     You can also disable retries entirely:
@@ -38,41 +55,130 @@ def retry_strategy(
         >>> from pyairtable import Api
         >>> api = Api('auth_token', retry_strategy=None)
 
+    By default, server errors and dropped connections are only retried for
+    idempotent requests (reads, updates, upserts, and deletes), so that creating
+    records will never be repeated. Rate limiting errors are always retried.
+    If the API responds with a ``Retry-After`` header, it will be honored.
+
     .. versionadded:: 1.4.0
 
     Args:
         status_forcelist: Status codes which should be retried.
-        allowed_methods: HTTP methods which can be retried.
+        allowed_methods: HTTP methods which can be retried after a server
+            error or a dropped connection.
             If ``None``, then all HTTP methods will be retried.
         backoff_factor:
-            A backoff factor to apply between attempts after the second try.
+            A backoff factor to apply between attempts.
             Sleep time between each request will be calculated as
             ``backoff_factor * (2 ** (retry_count - 1))``
         total:
             Maximum number of retries. Note that ``0`` means no retries,
             whereas ``1`` will execute a total of two requests (original + 1 retry).
+        jitter: Randomizes each sleep time by up to this fraction in either
+            direction, so that many clients do not retry at the same moment.
+        always_retry: Status codes which will be retried for any HTTP method,
+            as long as they are also in ``status_forcelist``.
         **kwargs: Accepts any valid parameter to `Retry`_.
     """
-    return Retry(
+    return AdaptiveRetry(
         total=total,
         backoff_factor=backoff_factor,
         status_forcelist=status_forcelist,
         allowed_methods=allowed_methods,
+        jitter=jitter,
+        always_retry=always_retry,
         **kwargs,
     )
 
 
-class _RetryingSession(Session):
-    def __init__(self, retry_strategy: Retry):
-        super().__init__()
+def get_sleep_time(retry: Retry, retry_after: Optional[str] = None) -> float:
+    """
+    Return how long to wait before the next attempt, using the same rules as
+    ``Retry.sleep()``: the value of the ``Retry-After`` header if there is one
+    (and the strategy respects it), or otherwise the strategy's backoff time.
+    This lets callers which cannot block, like :class:`~pyairtable.api.aio.AsyncApi`,
+    back off exactly as :class:`~pyairtable.Api` would.
 
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+    Args:
+        retry: The retry strategy, after it has been incremented for the failed attempt.
+        retry_after: The value of the response's ``Retry-After`` header, if any.
+    """
+    if retry.respect_retry_after_header and retry_after is not None:
+        if seconds := retry.parse_retry_after(retry_after):
+            return float(seconds)
+    return max(0.0, float(retry.get_backoff_time()))
+
+
+class AdaptiveRetry(Retry):
+    """
+    A `Retry`_ which adds random jitter to its backoff, honors ``Retry-After``
+    headers, and retries some status codes (such as 429) for any HTTP method
+    even if that method is not in ``allowed_methods``.
+
+    Use :func:`~pyairtable.retry_strategy` to build an instance with sensible defaults.
+    """
 
-        self.mount("https://", adapter)
-        self.mount("http://", adapter)
+    def __init__(
+        self,
+        *args: Any,
+        jitter: float = 0.0,
+        always_retry: Collection[int] = (),
+        **kwargs: Any,
+    ):
+        super().__init__(*args, **kwargs)
+        self.jitter = jitter
+        self.always_retry = frozenset(always_retry)
+
+    def new(self, **kw: Any) -> "AdaptiveRetry":
+        kw.setdefault("jitter", self.jitter)
+        kw.setdefault("always_retry", self.always_retry)
+        return super().new(**kw)  # type: ignore[no-any-return, unused-ignore]
+
+    def is_retry(
+        self, method: str, status_code: int, has_retry_after: bool = False
+    ) -> bool:
+        if status_code in self.always_retry and status_code in self.status_forcelist:
+            return True
+        return super().is_retry(method, status_code, has_retry_after)
+
+    def _jittered(self, value: float) -> float:
+        if not self.jitter:
+            return value
+        return value * random.uniform(1 - self.jitter, 1 + self.jitter)
+
+    def get_backoff_time(self) -> float:
+        # Unlike urllib3, wait before the first retry too; retrying
+        # a rate limiting error immediately is almost never useful.
+        consecutive_errors = len(
+            list(
+                takewhile(lambda x: x.redirect_location is None, reversed(self.history))
+            )
+        )
+        if consecutive_errors == 0:
+            return 0
+        backoff = self._jittered(self.backoff_factor * (2 ** (consecutive_errors - 1)))
+        # urllib3 < 2.0 does not have a backoff_max parameter
+        backoff_max = float(
+            getattr(self, "backoff_max", 0) or getattr(self, "DEFAULT_BACKOFF_MAX", 120)
+        )
+        return max(0.0, min(backoff_max, backoff))
+
+    def sleep(self, response: Optional[Any] = None) -> None:
+        retry_after = None if response is None else response.headers.get("Retry-After")
+        if seconds := get_sleep_time(self, retry_after):
+            time.sleep(seconds)
+
+    def parse_retry_after(self, retry_after: str) -> float:
+        # Only ever add jitter to Retry-After, so we never retry earlier than asked.
+        seconds = super().parse_retry_after(retry_after)
+        if self.jitter:
+            seconds += random.uniform(0, self.jitter * self.backoff_factor)
+        return float(seconds)
 
 
 __all__ = [
+    "AdaptiveRetry",
     "Retry",
+    "get_sleep_time",
     "retry_strategy",
 ]
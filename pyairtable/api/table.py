@@ -1,9 +1,29 @@
+import heapq
 import posixpath
+import string
 import urllib.parse
 import warnings
-from typing import Any, Dict, Iterable, Iterator, List, Optional, Union, overload
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
+from functools import cmp_to_key, partial
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    TypeVar,
+    Union,
+    cast,
+    overload,
+)
 
 import pyairtable.models
+from pyairtable import utils
+from pyairtable.api.journal import Journal, PathType
 from pyairtable.api.retrying import Retry
 from pyairtable.api.types import (
     FieldName,
@@ -16,10 +36,14 @@ from pyairtable.api.types import (
     assert_typed_dict,
     assert_typed_dicts,
 )
-from pyairtable.formulas import Formula, to_formula_str
+from pyairtable.exceptions import BatchError, InvalidParameterError
+from pyairtable.formulas import AND, RECORD_ID, REGEX_MATCH, Formula, to_formula_str
 from pyairtable.models.schema import FieldSchema, TableSchema, parse_field_schema
 from pyairtable.utils import is_table_id
 
+T = TypeVar("T")
+R = TypeVar("R")
+
 
 class Table:
     """
@@ -198,9 +222,11 @@ class Table:
             use_field_ids: |kwarg_use_field_ids|
         """
         record = self.api.get(self.record_url(record_id), options=options)
-        return assert_typed_dict(RecordDict, record)
+        return assert_typed_dict(RecordDict, record, mode=self.api.validate_responses)
 
-    def iterate(self, **options: Any) -> Iterator[List[RecordDict]]:
+    def iterate(
+        self, *, prefetch: int = 0, **options: Any
+    ) -> Iterator[List[RecordDict]]:
         """
         Iterate through each page of results from `List records <https://airtable.com/developers/web/api/list-records>`_.
         To get all records at once, use :meth:`all`.
@@ -227,18 +253,27 @@ class Table:
             user_locale: |kwarg_user_locale|
             time_zone: |kwarg_time_zone|
             use_field_ids: |kwarg_use_field_ids|
+            prefetch: The number of pages to request on a background thread
+                before the caller asks for them. This allows network I/O to
+                overlap with whatever the caller does with each page.
+                Defaults to ``0`` (only request a page when the caller asks for it).
         """
         if isinstance(formula := options.get("formula"), Formula):
             options["formula"] = to_formula_str(formula)
-        for page in self.api.iterate_requests(
+        pages = self.api.iterate_requests(
             method="get",
             url=self.url,
             fallback=("post", f"{self.url}/listRecords"),
             options=options,
-        ):
-            yield assert_typed_dicts(RecordDict, page.get("records", []))
+        )
+        if prefetch:
+            pages = utils.prefetch(pages, prefetch)
+        for page in pages:
+            yield assert_typed_dicts(
+                RecordDict, page.get("records", []), mode=self.api.validate_responses
+            )
 
-    def all(self, **options: Any) -> List[RecordDict]:
+    def all(self, *, parallel: int = 0, **options: Any) -> List[RecordDict]:
         """
         Retrieve all matching records in a single list.
 
@@ -248,6 +283,25 @@ class Table:
         >>> table.all(max_records=50)
         [{'fields': ...}, ...]
 
+        Large tables can be retrieved faster by splitting them into several
+        partitions which are paginated concurrently. Each partition is selected
+        by adding a condition on the last character of ``RECORD_ID()`` to the
+        formula, so partitions never overlap. Requests stay within Airtable's
+        per-base rate limit, even if the :class:`~pyairtable.Api` has no ``rate_limit=``.
+
+        >>> table.all(parallel=4)
+        [{'fields': ...}, ...]
+
+        Without ``sort=``, records are grouped by partition. With ``sort=``, each
+        partition is sorted by the API and the partitions are then merged in order.
+        The merge compares the values returned by the API, with empty values first,
+        so it will not match Airtable's own order for fields whose values do not
+        compare naturally in Python (like single selects, which Airtable sorts by
+        the order of their choices). ``parallel=`` cannot be combined with ``max_records=``.
+
+        >>> table.all(parallel=4, sort=["Last Name", "-Age"])
+        [{'fields': ...}, ...]
+
         Keyword Args:
             view: |kwarg_view|
             page_size: |kwarg_page_size|
@@ -259,9 +313,109 @@ class Table:
             user_locale: |kwarg_user_locale|
             time_zone: |kwarg_time_zone|
             use_field_ids: |kwarg_use_field_ids|
+            parallel: The number of partitions to retrieve concurrently.
+                Defaults to ``0`` (retrieve all records with a single cursor).
         """
+        if parallel > 1:
+            return self._all_parallel(parallel, **options)
         return [record for page in self.iterate(**options) for record in page]
 
+    def stream(
+        self,
+        *,
+        progress: Optional[Callable[["StreamProgress"], None]] = None,
+        prefetch: int = 0,
+        **options: Any,
+    ) -> Iterator[RecordDict]:
+        """
+        Yield each matching record one at a time, without retaining pages
+        of results after the caller has moved past them. This is useful for
+        exporting very large tables, where :meth:`all` would hold every record
+        in memory at once.
+
+        >>> for record in table.stream(view="MyView"):
+        ...     export(record)
+
+        If a ``progress`` callback is provided, it will be called after each
+        page is received with a :class:`StreamProgress` describing the total
+        number of pages, records, and bytes received so far.
+
+        >>> table.stream(progress=print)
+
+        Keyword Args:
+            view: |kwarg_view|
+            page_size: |kwarg_page_size|
+            max_records: |kwarg_max_records|
+            fields: |kwarg_fields|
+            sort: |kwarg_sort|
+            formula: |kwarg_formula|
+            cell_format: |kwarg_cell_format|
+            user_locale: |kwarg_user_locale|
+            time_zone: |kwarg_time_zone|
+            use_field_ids: |kwarg_use_field_ids|
+            progress: A function to call after each page is received.
+            prefetch: The number of pages to request on a background thread
+                before the caller asks for them. See :meth:`iterate`.
+        """
+        if isinstance(formula := options.get("formula"), Formula):
+            options["formula"] = to_formula_str(formula)
+        responses = self.api._iterate_responses(
+            method="get",
+            url=self.url,
+            fallback=("post", f"{self.url}/listRecords"),
+            options=options,
+        )
+        if prefetch:
+            responses = utils.prefetch(responses, prefetch)
+
+        status = StreamProgress()
+        for response, data in responses:
+            records = assert_typed_dicts(
+                RecordDict, data.get("records", []), mode=self.api.validate_responses
+            )
+            del data
+            status.pages += 1
+            status.records += len(records)
+            status.bytes += len(response.content)
+            del response
+            if progress:
+                progress(replace(status))
+            # Hand records over one at a time, so that each can be garbage
+            # collected as soon as the caller is finished with it.
+            records.reverse()
+            while records:
+                yield records.pop()
+
+    def _all_parallel(self, partitions: int, **options: Any) -> List[RecordDict]:
+        """
+        Retrieve all records by splitting the table into non-overlapping partitions
+        and paginating through each of them on a separate thread.
+        """
+        if "max_records" in options:
+            raise InvalidParameterError("parallel= does not support max_records=")
+
+        formula = options.pop("formula", None)
+        if formula and not isinstance(formula, Formula):
+            formula = Formula(str(formula))
+
+        def _fetch(partition: Formula) -> List[RecordDict]:
+            partition_formula = AND(formula, partition) if formula else partition
+            return [
+                record
+                for page in self.iterate(formula=partition_formula, **options)
+                for record in page
+            ]
+
+        with ThreadPoolExecutor(max_workers=partitions) as executor:
+            results = list(
+                executor.map(
+                    self.api._worker(_fetch), _record_id_partitions(partitions)
+                )
+            )
+        if sort := options.get("sort"):
+            return list(heapq.merge(*results, key=_sort_key(sort)))
+        return [record for partition in results for record in partition]
+
     def first(self, **options: Any) -> Optional[RecordDict]:
         """
         Retrieve the first matching record.
@@ -312,13 +466,15 @@ class Table:
                 "returnFieldsByFieldId": use_field_ids,
             },
         )
-        return assert_typed_dict(RecordDict, created)
+        return assert_typed_dict(RecordDict, created, mode=self.api.validate_responses)
 
     def batch_create(
         self,
         records: Iterable[WritableFields],
         typecast: bool = False,
         use_field_ids: bool = False,
+        workers: int = 0,
+        resume: Optional[PathType] = None,
     ) -> List[RecordDict]:
         """
         Create a number of new records in batches.
@@ -341,25 +497,71 @@ class Table:
             records: Iterable of dicts representing records to be created.
             typecast: |kwarg_typecast|
             use_field_ids: |kwarg_use_field_ids|
+            workers: |kwarg_workers|
+            resume: |kwarg_resume|
         """
-        inserted_records = []
 
-        # If we got an iterator, exhaust it and collect it into a list.
-        records = list(records)
+        create = partial(
+            self._create_chunk,
+            typecast=typecast,
+            use_field_ids=use_field_ids,
+        )
+        return [
+            record
+            for created in self._map_chunks(create, records, workers, resume)
+            for record in created
+        ]
+
+    def iter_batch_create(
+        self,
+        records: Iterable[WritableFields],
+        typecast: bool = False,
+        use_field_ids: bool = False,
+    ) -> Iterator[List[RecordDict]]:
+        """
+        Like :meth:`batch_create`, but consumes ``records`` lazily and yields
+        the records created by each request as soon as it has been sent.
+        Only one batch of records is held in memory at a time, so this can be
+        used with generators that produce very large numbers of records.
+
+        Nothing is sent to the API until the caller starts iterating.
+
+        >>> rows = ({"Name": line.strip()} for line in open("names.txt"))
+        >>> for created in table.iter_batch_create(rows):
+        ...     print(len(created))
 
+        Args:
+            records: Iterable of dicts representing records to be created.
+            typecast: |kwarg_typecast|
+            use_field_ids: |kwarg_use_field_ids|
+        """
         for chunk in self.api.chunked(records):
-            new_records = [{"fields": fields} for fields in chunk]
-            response = self.api.post(
-                url=self.url,
-                json={
-                    "records": new_records,
-                    "typecast": typecast,
-                    "returnFieldsByFieldId": use_field_ids,
-                },
+            yield self._create_chunk(
+                chunk,
+                typecast=typecast,
+                use_field_ids=use_field_ids,
             )
-            inserted_records += assert_typed_dicts(RecordDict, response["records"])
 
-        return inserted_records
+    def _create_chunk(
+        self,
+        chunk: Sequence[WritableFields],
+        typecast: bool = False,
+        use_field_ids: bool = False,
+    ) -> List[RecordDict]:
+        """
+        Create one batch of records with a single request.
+        """
+        response = self.api.post(
+            url=self.url,
+            json={
+                "records": [{"fields": fields} for fields in chunk],
+                "typecast": typecast,
+                "returnFieldsByFieldId": use_field_ids,
+            },
+        )
+        return assert_typed_dicts(
+            RecordDict, response["records"], mode=self.api.validate_responses
+        )
 
     def update(
         self,
@@ -394,7 +596,7 @@ class Table:
                 "returnFieldsByFieldId": use_field_ids,
             },
         )
-        return assert_typed_dict(RecordDict, updated)
+        return assert_typed_dict(RecordDict, updated, mode=self.api.validate_responses)
 
     def batch_update(
         self,
@@ -402,6 +604,8 @@ class Table:
         replace: bool = False,
         typecast: bool = False,
         use_field_ids: bool = False,
+        workers: int = 0,
+        resume: Optional[PathType] = None,
     ) -> List[RecordDict]:
         """
         Update several records in batches.
@@ -411,17 +615,15 @@ class Table:
             replace: |kwarg_replace|
             typecast: |kwarg_typecast|
             use_field_ids: |kwarg_use_field_ids|
+            workers: |kwarg_workers|
+            resume: |kwarg_resume|
 
         Returns:
             The list of updated records.
         """
-        updated_records = []
         method = "put" if replace else "patch"
 
-        # If we got an iterator, exhaust it and collect it into a list.
-        records = list(records)
-
-        for chunk in self.api.chunked(records):
+        def _update(chunk: Sequence[UpdateRecordDict]) -> List[RecordDict]:
             chunk_records = [{"id": x["id"], "fields": x["fields"]} for x in chunk]
             response = self.api.request(
                 method=method,
@@ -432,9 +634,15 @@ class Table:
                     "returnFieldsByFieldId": use_field_ids,
                 },
             )
-            updated_records += assert_typed_dicts(RecordDict, response["records"])
+            return assert_typed_dicts(
+                RecordDict, response["records"], mode=self.api.validate_responses
+            )
 
-        return updated_records
+        return [
+            record
+            for updated in self._map_chunks(_update, records, workers, resume)
+            for record in updated
+        ]
 
     def batch_upsert(
         self,
@@ -443,6 +651,8 @@ class Table:
         replace: bool = False,
         typecast: bool = False,
         use_field_ids: bool = False,
+        workers: int = 0,
+        resume: Optional[PathType] = None,
     ) -> UpsertResultDict:
         """
         Update or create records in batches, either using ``id`` (if given) or using a set of
@@ -458,6 +668,8 @@ class Table:
             replace: |kwarg_replace|
             typecast: |kwarg_typecast|
             use_field_ids: |kwarg_use_field_ids|
+            workers: |kwarg_workers|
+            resume: |kwarg_resume|
 
         Returns:
             Lists of created/updated record IDs, along with the list of all records affected.
@@ -469,41 +681,216 @@ class Table:
         # but we might not reach that error until we've done several batch operations.
         # To spare implementers from having to recover from a partially applied upsert,
         # and to simplify our API, we will raise an exception before any network calls.
-        for record in records:
-            if "id" in record:
-                continue
-            missing = set(key_fields) - set(record.get("fields", []))
-            if missing:
-                raise ValueError(f"missing {missing!r} in {record['fields'].keys()!r}")
+        _validate_upsert_records(records, key_fields)
 
-        method = "put" if replace else "patch"
         result: UpsertResultDict = {
             "updatedRecords": [],
             "createdRecords": [],
             "records": [],
         }
+        upsert = partial(
+            self._upsert_chunk,
+            key_fields=key_fields,
+            replace=replace,
+            typecast=typecast,
+            use_field_ids=use_field_ids,
+        )
+        for chunk_result in self._map_chunks(upsert, records, workers, resume):
+            result["updatedRecords"].extend(chunk_result["updatedRecords"])
+            result["createdRecords"].extend(chunk_result["createdRecords"])
+            result["records"].extend(chunk_result["records"])
+
+        return result
 
+    def iter_batch_upsert(
+        self,
+        records: Iterable[Dict[str, Any]],
+        key_fields: List[FieldName],
+        replace: bool = False,
+        typecast: bool = False,
+        use_field_ids: bool = False,
+    ) -> Iterator[UpsertResultDict]:
+        """
+        Like :meth:`batch_upsert`, but consumes ``records`` lazily and yields
+        the result of each request as soon as it has been sent.
+        Only one batch of records is held in memory at a time, so this can be
+        used with generators that produce very large numbers of records.
+
+        Unlike :meth:`batch_upsert`, records can only be checked for missing
+        ``key_fields`` one batch at a time. If a record is invalid, a ``ValueError``
+        will be raised before its batch is sent, but after any previous batches.
+
+        >>> rows = csv.DictReader(open("people.csv"))
+        >>> for result in table.iter_batch_upsert(
+        ...     ({"fields": row} for row in rows),
+        ...     key_fields=["Email"],
+        ... ):
+        ...     print(len(result["createdRecords"]), len(result["updatedRecords"]))
+
+        Args:
+            records: Records to update.
+            key_fields: List of field names that Airtable should use to match
+                records in the input with existing records on the server.
+            replace: |kwarg_replace|
+            typecast: |kwarg_typecast|
+            use_field_ids: |kwarg_use_field_ids|
+        """
         for chunk in self.api.chunked(records):
-            formatted_records = [
-                {k: v for (k, v) in record.items() if k in ("id", "fields")}
-                for record in chunk
-            ]
-            response = self.api.request(
-                method=method,
-                url=self.url,
-                json={
-                    "records": formatted_records,
-                    "typecast": typecast,
-                    "returnFieldsByFieldId": use_field_ids,
-                    "performUpsert": {"fieldsToMergeOn": key_fields},
-                },
-            )
-            result["updatedRecords"].extend(response["updatedRecords"])
-            result["createdRecords"].extend(response["createdRecords"])
-            result["records"].extend(
-                assert_typed_dicts(RecordDict, response["records"])
+            _validate_upsert_records(chunk, key_fields)
+            yield self._upsert_chunk(
+                chunk,
+                key_fields=key_fields,
+                replace=replace,
+                typecast=typecast,
+                use_field_ids=use_field_ids,
             )
 
+    def _upsert_chunk(
+        self,
+        chunk: Sequence[Dict[str, Any]],
+        key_fields: List[FieldName],
+        replace: bool = False,
+        typecast: bool = False,
+        use_field_ids: bool = False,
+    ) -> UpsertResultDict:
+        """
+        Upsert one batch of records with a single request.
+        """
+        formatted_records = [
+            {k: v for (k, v) in record.items() if k in ("id", "fields")}
+            for record in chunk
+        ]
+        response = self.api.request(
+            method="put" if replace else "patch",
+            url=self.url,
+            json={
+                "records": formatted_records,
+                "typecast": typecast,
+                "returnFieldsByFieldId": use_field_ids,
+                "performUpsert": {"fieldsToMergeOn": key_fields},
+            },
+        )
+        return {
+            "createdRecords": response["createdRecords"],
+            "updatedRecords": response["updatedRecords"],
+            "records": assert_typed_dicts(
+                RecordDict, response["records"], mode=self.api.validate_responses
+            ),
+        }
+
+    def sync(
+        self,
+        records: Iterable[WritableFields],
+        key_fields: List[FieldName],
+        *,
+        delete_missing: bool = False,
+        dry_run: bool = False,
+        typecast: bool = False,
+        use_field_ids: bool = False,
+        workers: int = 0,
+        **options: Any,
+    ) -> "SyncResult":
+        """
+        Make the table match ``records``, sending only what has changed.
+
+        This fetches the existing records once (retrieving only the fields that appear
+        in ``records``) and matches them to the input using ``key_fields``. Records
+        with no match are created; matched records are updated with only the fields
+        whose values differ; and records which match exactly are left alone.
+        If ``delete_missing=True``, existing records which do not match any of the
+        input will be deleted.
+
+        >>> result = table.sync(
+        ...     [{"Email": "alice@example.com", "Name": "Alice"}, ...],
+        ...     key_fields=["Email"],
+        ...     dry_run=True,
+        ... )
+        >>> result
+        SyncResult(created=[...], updated=[...], deleted=[], unchanged=29712, ...)
+
+        Empty values (such as ``None``, ``""``, ``[]``, or ``False``) are treated as
+        equal to a field which is missing from an existing record, since the API does
+        not return empty fields. Values are compared as-is, so if you rely on
+        ``typecast=True`` to convert values, those records may always appear changed.
+        Existing records whose ``key_fields`` are all empty (such as the blank rows
+        in a new table) are ignored, and will not be deleted by ``delete_missing``.
+
+        Args:
+            records: Iterable of dicts representing each record's fields.
+            key_fields: List of field names used to match records in the input
+                with existing records in the table.
+            delete_missing: If ``True``, delete existing records which do not
+                match any record in the input.
+            dry_run: If ``True``, compute the changes without sending them.
+            typecast: |kwarg_typecast|
+            use_field_ids: |kwarg_use_field_ids|
+            workers: |kwarg_workers|
+            options: Passed to :meth:`all` to limit which existing records are
+                considered, such as ``view=`` or ``formula=``. If ``fields=`` is
+                provided, those fields are retrieved in addition to the ones
+                that appear in ``records``.
+
+        Raises:
+            ValueError: If any record in the input is missing one of ``key_fields``
+                or has empty values for all of them, or if more than one record
+                (in the input or in the table) has the same values for ``key_fields``.
+        """
+        records = list(records)
+        _validate_upsert_records([{"fields": r} for r in records], key_fields)
+        empty_key = _sync_key({}, key_fields)
+        if any(_sync_key(r, key_fields) == empty_key for r in records):
+            raise ValueError(f"a record in the input has no value for {key_fields!r}")
+        field_names = sorted(
+            {name for r in records for name in r}
+            | set(key_fields)
+            | set(options.pop("fields", None) or ())
+        )
+
+        existing: Dict[Any, RecordDict] = {}
+        for record in self.all(
+            **options, fields=field_names, use_field_ids=use_field_ids
+        ):
+            key = _sync_key(record["fields"], key_fields)
+            if key == empty_key:
+                continue
+            if key in existing:
+                raise ValueError(f"multiple records in {self.name!r} match {key!r}")
+            existing[key] = record
+
+        result = SyncResult(dry_run=dry_run)
+        seen = set()
+        for fields in records:
+            key = _sync_key(fields, key_fields)
+            if key in seen:
+                raise ValueError(f"multiple records in the input match {key!r}")
+            seen.add(key)
+            if not (match := existing.pop(key, None)):
+                result.created.append(fields)
+            elif changed := _sync_changes(fields, match["fields"]):
+                result.updated.append(UpdateRecordDict(id=match["id"], fields=changed))
+            else:
+                result.unchanged += 1
+
+        if delete_missing:
+            result.deleted = [record["id"] for record in existing.values()]
+        if dry_run:
+            return result
+
+        result.records = [
+            *self.batch_create(
+                result.created,
+                typecast=typecast,
+                use_field_ids=use_field_ids,
+                workers=workers,
+            ),
+            *self.batch_update(
+                result.updated,
+                typecast=typecast,
+                use_field_ids=use_field_ids,
+                workers=workers,
+            ),
+        ]
+        self.batch_delete(result.deleted, workers=workers)
         return result
 
     def delete(self, record_id: RecordId) -> RecordDeletedDict:
@@ -522,9 +909,15 @@ class Table:
         return assert_typed_dict(
             RecordDeletedDict,
             self.api.delete(self.record_url(record_id)),
+            mode=self.api.validate_responses,
         )
 
-    def batch_delete(self, record_ids: Iterable[RecordId]) -> List[RecordDeletedDict]:
+    def batch_delete(
+        self,
+        record_ids: Iterable[RecordId],
+        workers: int = 0,
+        resume: Optional[PathType] = None,
+    ) -> List[RecordDeletedDict]:
         """
         Delete the given records, operating in batches.
 
@@ -536,20 +929,128 @@ class Table:
 
         Args:
             record_ids: Record IDs to delete
+            workers: |kwarg_workers|
+            resume: |kwarg_resume|
 
         Returns:
             Confirmation that the records were deleted.
         """
-        deleted_records = []
 
-        # If we got an iterator, exhaust it and collect it into a list.
-        record_ids = list(record_ids)
-
-        for chunk in self.api.chunked(record_ids):
+        def _delete(chunk: Sequence[RecordId]) -> List[RecordDeletedDict]:
             result = self.api.delete(self.url, params={"records[]": chunk})
-            deleted_records += assert_typed_dicts(RecordDeletedDict, result["records"])
+            return assert_typed_dicts(
+                RecordDeletedDict, result["records"], mode=self.api.validate_responses
+            )
 
-        return deleted_records
+        return [
+            record
+            for deleted in self._map_chunks(_delete, record_ids, workers, resume)
+            for record in deleted
+        ]
+
+    def buffered_writer(
+        self,
+        *,
+        flush_interval: float = 1.0,
+        max_batch: Optional[int] = None,
+        typecast: bool = False,
+    ) -> "pyairtable.api.writer.BufferedWriter":
+        """
+        Create a :class:`~pyairtable.api.writer.BufferedWriter`, which collects
+        individual creates, updates, and deletes from any number of threads and
+        sends them to the API in batches. Each change returns a
+        :class:`~concurrent.futures.Future` for its result.
+
+        >>> with table.buffered_writer(flush_interval=0.5) as writer:
+        ...     created = writer.create({"Name": "Alice"})
+        ...     updated = writer.update("recAdw9EjV90xbW", {"Status": "Done"})
+        ...     deleted = writer.delete("recAdw9EjV90xbX")
+        ...
+        >>> created.result()
+        {'id': 'recAdw9EjV90xbZ', 'createdTime': ..., 'fields': {'Name': 'Alice'}}
+
+        Leaving the ``with`` block (or calling ``close()``) will send any changes
+        which are still waiting.
+
+        Args:
+            flush_interval: The maximum number of seconds a change will be held
+                before it is sent to the API.
+            max_batch: The number of records to send in each request.
+                Defaults to the maximum allowed by the API.
+            typecast: |kwarg_typecast|
+        """
+        return pyairtable.api.writer.BufferedWriter(
+            self,
+            flush_interval=flush_interval,
+            max_batch=max_batch,
+            typecast=typecast,
+        )
+
+    def _map_chunks(
+        self,
+        func: Callable[[Sequence[T]], R],
+        items: Iterable[T],
+        workers: int = 0,
+        resume: Optional[PathType] = None,
+    ) -> List[R]:
+        """
+        Call ``func`` with each chunk of ``items`` (sized for a single API request)
+        and return the results in order.
+
+        If ``workers`` is greater than 1, chunks are sent concurrently on a thread pool,
+        and failures are collected into a single :class:`~pyairtable.exceptions.BatchError`
+        once every chunk has been attempted. Otherwise, chunks are sent one at a time,
+        and the first failure is raised immediately.
+
+        If ``resume`` is a path, each completed chunk is recorded there, and any chunks
+        already recorded there are skipped (returning the result that was recorded).
+        """
+        # If we got an iterator, exhaust it and collect it into a list.
+        chunks = list(self.api.chunked(items))
+        journal = Journal(resume) if resume is not None else None
+        if journal is not None:
+            for index, chunk in enumerate(chunks):
+                journal.check(index, chunk)
+        run = partial(self._run_chunk, func, journal)
+
+        if workers <= 1 or len(chunks) <= 1:
+            return [run(index, chunk) for index, chunk in enumerate(chunks)]
+
+        worker = self.api._worker(run)
+        results: Dict[int, R] = {}
+        errors: Dict[int, Exception] = {}
+        with ThreadPoolExecutor(max_workers=min(workers, len(chunks))) as executor:
+            futures = [
+                executor.submit(worker, index, chunk)
+                for index, chunk in enumerate(chunks)
+            ]
+            for index, future in enumerate(futures):
+                try:
+                    results[index] = future.result()
+                except Exception as exc:
+                    errors[index] = exc
+
+        if errors:
+            raise BatchError(chunks, results, errors) from next(iter(errors.values()))
+        return [results[index] for index in range(len(chunks))]
+
+    @staticmethod
+    def _run_chunk(
+        func: Callable[[Sequence[T]], R],
+        journal: Optional[Journal],
+        index: int,
+        chunk: Sequence[T],
+    ) -> R:
+        """
+        Call ``func`` with a chunk, unless the journal shows it was already completed.
+        """
+        if journal is None:
+            return func(chunk)
+        if index in journal:
+            return cast(R, journal.result(index))
+        result = func(chunk)
+        journal.add(index, chunk, result)
+        return result
 
     def comments(self, record_id: RecordId) -> List["pyairtable.models.Comment"]:
         """
@@ -677,6 +1178,133 @@ class Table:
         return field_schema
 
 
+#: Characters that can appear at the end of an Airtable record ID.
+_RECORD_ID_CHARACTERS = string.digits + string.ascii_uppercase + string.ascii_lowercase
+
+
+@dataclass
+class StreamProgress:
+    """
+    Describes how much data has been received by :meth:`Table.stream`.
+    """
+
+    #: The number of pages received so far.
+    pages: int = 0
+    #: The number of records received so far.
+    records: int = 0
+    #: The total size (in bytes) of the response bodies received so far.
+    bytes: int = 0
+
+
+@dataclass
+class SyncResult:
+    """
+    Describes the changes made by :meth:`Table.sync`, or the changes
+    it would have made if called with ``dry_run=True``.
+    """
+
+    #: The fields of each record which was created.
+    created: List[WritableFields] = field(default_factory=list)
+    #: The ID of each record which was updated, along with only the fields that changed.
+    updated: List[UpdateRecordDict] = field(default_factory=list)
+    #: The ID of each record which was deleted.
+    deleted: List[RecordId] = field(default_factory=list)
+    #: The number of records which already matched the input.
+    unchanged: int = 0
+    #: Whether the changes were computed but not sent.
+    dry_run: bool = False
+    #: The records returned by the API after being created or updated.
+    records: List[RecordDict] = field(default_factory=list, repr=False)
+
+
+def _sync_key(fields: Dict[FieldName, Any], key_fields: List[FieldName]) -> Any:
+    return tuple(_sync_value(fields.get(name)) for name in key_fields)
+
+
+def _sync_value(value: Any) -> Any:
+    """
+    Normalize a field value for comparison, treating all empty values as ``None``
+    (since the API omits empty fields from the records it returns).
+    """
+    if value is None or value is False or value == "" or value == []:
+        return None
+    return value
+
+
+def _sync_changes(
+    new: WritableFields, old: Dict[FieldName, Any]
+) -> Dict[FieldName, Any]:
+    """
+    Return only the fields in ``new`` whose values differ from ``old``.
+    """
+    return {
+        name: value
+        for (name, value) in new.items()
+        if _sync_value(value) != _sync_value(old.get(name))
+    }
+
+
+def _record_id_partitions(count: int) -> List[Formula]:
+    """
+    Build formulas which split a table into ``count`` disjoint groups
+    based on the last character of each record's ID.
+
+    >>> [str(f) for f in _record_id_partitions(2)]
+    ["REGEX_MATCH(RECORD_ID(), '[0123456789ABCDEFGHIJKLMNOPQRSTU]$')",
+     "REGEX_MATCH(RECORD_ID(), '[VWXYZabcdefghijklmnopqrstuvwxyz]$')"]
+    """
+    count = max(1, min(count, len(_RECORD_ID_CHARACTERS)))
+    size, remainder = divmod(len(_RECORD_ID_CHARACTERS), count)
+    partitions: List[Formula] = []
+    start = 0
+    for n in range(count):
+        end = start + size + (1 if n < remainder else 0)
+        chars = _RECORD_ID_CHARACTERS[start:end]
+        partitions.append(REGEX_MATCH(RECORD_ID(), f"[{chars}]$"))
+        start = end
+    return partitions
+
+
+def _sort_key(sort: Sequence[str]) -> Callable[[RecordDict], Any]:
+    """
+    Build a key function which orders records (approximately) the way the API
+    orders them for the given ``sort=`` parameter, so that lists of records
+    which were each sorted by the API can be merged. Empty values come first.
+
+    >>> key = _sort_key(["-Age"])
+    >>> sorted([{"fields": {"Age": 1}}, {"fields": {"Age": 2}}], key=key)
+    [{'fields': {'Age': 2}}, {'fields': {'Age': 1}}]
+    """
+    columns = [(name.lstrip("-"), name.startswith("-")) for name in sort]
+
+    def _compare(a: RecordDict, b: RecordDict) -> int:
+        for name, descending in columns:
+            x, y = a["fields"].get(name), b["fields"].get(name)
+            if x == y:
+                continue
+            result = -1 if x is None or (y is not None and x < y) else 1
+            return -result if descending else result
+        return 0
+
+    return cmp_to_key(_compare)
+
+
+def _validate_upsert_records(
+    records: Iterable[Dict[str, Any]],
+    key_fields: List[FieldName],
+) -> None:
+    """
+    Raise ``ValueError`` if any record without an ID is missing one of ``key_fields``.
+    """
+    for record in records:
+        if "id" in record:
+            continue
+        missing = set(key_fields) - set(record.get("fields", []))
+        if missing:
+            raise ValueError(f"missing {missing!r} in {record['fields'].keys()!r}")
+
+
 # These are at the bottom of the module to avoid circular imports
 import pyairtable.api.api  # noqa
 import pyairtable.api.base  # noqa
+import pyairtable.api.writer  # noqa
@@ -4,9 +4,19 @@ and return values to various pyAirtable methods.
 """
 
 from functools import lru_cache
-from typing import Any, Dict, List, Optional, Type, TypeVar, Union, cast
-
-from typing_extensions import Required, TypeAlias, TypedDict
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+)
+
+from typing_extensions import Literal, Required, TypeAlias, TypedDict
 
 from pyairtable._compat import pydantic
 
@@ -350,6 +360,51 @@ class UserAndScopesDict(TypedDict, total=False):
     scopes: List[str]
 
 
+#: How thoroughly to check the structure of data received from the API.
+#:
+#: * ``"full"`` checks every object.
+#: * ``"sample"`` checks only the first object in each list (such as a page of records).
+#: * ``"off"`` skips all checks.
+ValidationMode: TypeAlias = Literal["off", "sample", "full"]
+
+
+def _is_record_dict(obj: Dict[str, Any]) -> bool:
+    # Keys in decoded JSON are always strings, so we don't check inside "fields".
+    return (
+        isinstance(obj.get("id"), str)
+        and isinstance(obj.get("createdTime"), str)
+        and isinstance(obj.get("fields"), dict)
+    )
+
+
+def _is_record_deleted_dict(obj: Dict[str, Any]) -> bool:
+    return isinstance(obj.get("id"), str) and isinstance(obj.get("deleted"), bool)
+
+
+def _is_str_list(obj: Any) -> bool:
+    return isinstance(obj, list) and all(isinstance(item, str) for item in obj)
+
+
+def _is_upsert_result_dict(obj: Dict[str, Any]) -> bool:
+    return (
+        _is_str_list(obj.get("createdRecords"))
+        and _is_str_list(obj.get("updatedRecords"))
+        and isinstance(records := obj.get("records"), list)
+        and all(isinstance(r, dict) and _is_record_dict(r) for r in records)
+    )
+
+
+#: Hand-written checks for the TypedDicts we receive most often, which are much
+#: faster than building a pydantic model. Each returns ``True`` only if the object
+#: definitely conforms; otherwise we fall back to pydantic, which will either
+#: accept the object or raise a detailed ValidationError.
+_STRUCTURAL_CHECKS: Dict[Any, Callable[[Dict[str, Any]], bool]] = {
+    RecordDict: _is_record_dict,
+    RecordDeletedDict: _is_record_deleted_dict,
+    UpsertResultDict: _is_upsert_result_dict,
+}
+
+
 @lru_cache
 def _create_model_from_typeddict(cls: Type[T]) -> Type[pydantic.BaseModel]:
     """
@@ -360,7 +415,7 @@ def _create_model_from_typeddict(cls: Type[T]) -> Type[pydantic.BaseModel]:
     return pydantic.create_model_from_typeddict(cls)  # type: ignore[no-any-return, operator, unused-ignore]
 
 
-def assert_typed_dict(cls: Type[T], obj: Any) -> T:
+def assert_typed_dict(cls: Type[T], obj: Any, *, mode: ValidationMode = "full") -> T:
     """
     Raises a TypeError if the given object is not a dict, or raises
     pydantic.ValidationError if the given object does not conform
@@ -369,6 +424,8 @@ def assert_typed_dict(cls: Type[T], obj: Any) -> T:
     Args:
         cls: The TypedDict class.
         obj: The object that should be a TypedDict.
+        mode: If ``"off"``, the object is returned without being checked.
+            See :data:`~pyairtable.api.types.ValidationMode`.
 
     Usage:
         >>> assert_typed_dict(
@@ -395,24 +452,39 @@ def assert_typed_dict(cls: Type[T], obj: Any) -> T:
         fields
           field required (type=value_error.missing)
     """
+    if mode == "off":
+        return cast(T, obj)
     if not isinstance(obj, dict):
         raise TypeError(f"expected dict, got {type(obj)}")
+    if (check := _STRUCTURAL_CHECKS.get(cls)) and check(obj):
+        return cast(T, obj)
     # mypy complains cls isn't Hashable, but it is; see https://github.com/python/mypy/issues/2412
     model = _create_model_from_typeddict(cls)  # type: ignore
     model(**obj)
     return cast(T, obj)
 
 
-def assert_typed_dicts(cls: Type[T], objects: Any) -> List[T]:
+def assert_typed_dicts(
+    cls: Type[T], objects: Any, *, mode: ValidationMode = "full"
+) -> List[T]:
     """
     Like :func:`~pyairtable.api.types.assert_typed_dict` but for a list of dicts.
 
     Args:
         cls: The TypedDict class.
         objects: The object that should be a list of TypedDicts.
+        mode: If ``"sample"``, only the first object in the list is checked.
+            If ``"off"``, none of them are.
+            See :data:`~pyairtable.api.types.ValidationMode`.
     """
     if not isinstance(objects, list):
         raise TypeError(f"expected list, got {type(objects)}")
+    if mode == "off":
+        return objects
+    if mode == "sample":
+        for obj in objects[:1]:
+            assert_typed_dict(cls, obj)
+        return objects
     return [assert_typed_dict(cls, obj) for obj in objects]
 
 
@@ -0,0 +1,266 @@
+import threading
+from concurrent.futures import Future
+from contextlib import contextmanager
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
+
+from pyairtable.api.types import (
+    RecordDeletedDict,
+    RecordDict,
+    RecordId,
+    UpdateRecordDict,
+    WritableFields,
+)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class BufferedWriter:
+    """
+    Collects individual creates, updates, and deletes and sends them to the API
+    in batches, from a background thread. Each call returns a
+    :class:`~concurrent.futures.Future` which resolves once the change has been sent.
+
+    Use :meth:`Table.buffered_writer <pyairtable.Table.buffered_writer>` to create one.
+
+    >>> with table.buffered_writer(flush_interval=0.5) as writer:
+    ...     future = writer.update("recAdw9EjV90xbW", {"Status": "Done"})
+    ...     writer.update("recAdw9EjV90xbW", {"Reviewed": True})
+    ...
+    >>> future.result()
+    {'id': 'recAdw9EjV90xbW', 'fields': {'Status': 'Done', 'Reviewed': True, ...}, ...}
+
+    Successive updates to the same record are merged into a single update.
+    Within each flush, creates are sent first, then updates, then deletes,
+    regardless of the order in which they were queued. For example, if a record
+    is deleted and then updated before the next flush, the update will be sent
+    (and will succeed) before the record is deleted. If one change depends on
+    another having been sent, wait for the first change's future before
+    queueing the second, or call :meth:`flush` in between.
+    """
+
+    def __init__(
+        self,
+        table: "pyairtable.api.table.Table",
+        *,
+        flush_interval: float = 1.0,
+        max_batch: Optional[int] = None,
+        typecast: bool = False,
+    ):
+        """
+        Args:
+            table: The table to write to.
+            flush_interval: The maximum number of seconds a change will be held
+                before it is sent to the API.
+            max_batch: The number of records to send in each request. Once this many
+                changes of one kind are waiting, they are sent without waiting for
+                ``flush_interval``. Defaults to the maximum allowed by the API.
+            typecast: |kwarg_typecast|
+        """
+        if max_batch is None:
+            max_batch = table.api.MAX_RECORDS_PER_REQUEST
+        if not 1 <= max_batch <= table.api.MAX_RECORDS_PER_REQUEST:
+            raise ValueError(
+                f"max_batch must be between 1 and {table.api.MAX_RECORDS_PER_REQUEST}"
+            )
+        self.table = table
+        self.flush_interval = flush_interval
+        self.max_batch = max_batch
+        self.typecast = typecast
+
+        self._creates: List[Tuple[WritableFields, "Future[RecordDict]"]] = []
+        self._updates: Dict[
+            RecordId, Tuple[WritableFields, List["Future[RecordDict]"]]
+        ] = {}
+        self._deletes: Dict[RecordId, List["Future[RecordDeletedDict]"]] = {}
+        self._condition = threading.Condition()
+        self._flushing = threading.Lock()
+        self._closed = False
+        self._thread = threading.Thread(
+            target=self._run,
+            name="pyairtable-writer",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def __repr__(self) -> str:
+        return f"<BufferedWriter table={self.table.name!r}>"
+
+    def __enter__(self) -> "BufferedWriter":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def create(self, fields: WritableFields) -> "Future[RecordDict]":
+        """
+        Queue a new record to be created.
+
+        Args:
+            fields: The fields of the new record.
+        """
+        future: "Future[RecordDict]" = Future()
+        with self._changing():
+            self._creates.append((dict(fields), future))
+        return future
+
+    def update(
+        self, record_id: RecordId, fields: WritableFields
+    ) -> "Future[RecordDict]":
+        """
+        Queue an update to an existing record. If an update to the same record
+        is already waiting to be sent, the two will be merged, and both futures
+        will resolve with the same result.
+
+        Args:
+            record_id: |arg_record_id|
+            fields: The fields to update.
+        """
+        future: "Future[RecordDict]" = Future()
+        with self._changing():
+            if record_id in self._updates:
+                self._updates[record_id][0].update(fields)
+                self._updates[record_id][1].append(future)
+            else:
+                self._updates[record_id] = (dict(fields), [future])
+        return future
+
+    def delete(self, record_id: RecordId) -> "Future[RecordDeletedDict]":
+        """
+        Queue a record to be deleted.
+
+        Args:
+            record_id: |arg_record_id|
+        """
+        future: "Future[RecordDeletedDict]" = Future()
+        with self._changing():
+            self._deletes.setdefault(record_id, []).append(future)
+        return future
+
+    def flush(self) -> None:
+        """
+        Send all pending changes to the API, blocking until they have been sent.
+        """
+        with self._flushing:
+            creates, updates, deletes = self._take()
+            table, typecast = self.table, self.typecast
+            self._send(
+                [(fields, [future]) for (fields, future) in creates],
+                lambda chunk: table.batch_create(chunk, typecast=typecast),
+            )
+            self._send(
+                [
+                    (UpdateRecordDict(id=record_id, fields=fields), futures)
+                    for record_id, (fields, futures) in updates.items()
+                ],
+                lambda chunk: table.batch_update(chunk, typecast=typecast),
+            )
+            self._send(list(deletes.items()), table.batch_delete)
+
+    def close(self) -> None:
+        """
+        Send all pending changes and stop the background thread.
+        No more changes can be queued once this has been called.
+        """
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        self._thread.join()
+        self.flush()
+
+    @contextmanager
+    def _changing(self) -> Iterator[None]:
+        """
+        Hold the lock while a change is queued, then wake up the
+        background thread if a full batch is ready to be sent.
+        """
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("cannot queue changes after the writer is closed")
+            yield
+            if self._is_full():
+                self._condition.notify_all()
+
+    def _is_full(self) -> bool:
+        return any(
+            len(pending) >= self.max_batch
+            for pending in (self._creates, self._updates, self._deletes)
+        )
+
+    def _take(
+        self,
+    ) -> Tuple[
+        List[Tuple[WritableFields, "Future[RecordDict]"]],
+        Dict[RecordId, Tuple[WritableFields, List["Future[RecordDict]"]]],
+        Dict[RecordId, List["Future[RecordDeletedDict]"]],
+    ]:
+        """
+        Remove all pending changes from the buffer, skipping any whose
+        futures have been cancelled.
+        """
+        with self._condition:
+            creates, self._creates = self._creates, []
+            updates, self._updates = self._updates, {}
+            deletes, self._deletes = self._deletes, {}
+
+        creates = [
+            (f, fut) for (f, fut) in creates if fut.set_running_or_notify_cancel()
+        ]
+        updates = {
+            record_id: (fields, running)
+            for record_id, (fields, futures) in updates.items()
+            if (running := [f for f in futures if f.set_running_or_notify_cancel()])
+        }
+        deletes = {
+            record_id: pending
+            for record_id, futures in deletes.items()
+            if (pending := [f for f in futures if f.set_running_or_notify_cancel()])
+        }
+        return (creates, updates, deletes)
+
+    def _send(
+        self,
+        items: Sequence[Tuple[T, List["Future[R]"]]],
+        send: Callable[[List[T]], List[R]],
+    ) -> None:
+        """
+        Send items in chunks of ``max_batch`` and resolve the futures
+        that are waiting on each item with its result.
+        """
+        for start in range(0, len(items), self.max_batch):
+            chunk = items[start : start + self.max_batch]
+            try:
+                results = send([item for (item, _) in chunk])
+            except Exception as exc:
+                for _, futures in chunk:
+                    for future in futures:
+                        future.set_exception(exc)
+                continue
+            for (_, futures), result in zip(chunk, results):
+                for future in futures:
+                    future.set_result(result)
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                self._condition.wait_for(
+                    lambda: self._closed or self._is_full(),
+                    timeout=self.flush_interval,
+                )
+                if self._closed:
+                    return
+            self.flush()
+
+
+# These are at the bottom of the module to avoid circular imports
+import pyairtable.api.table  # noqa
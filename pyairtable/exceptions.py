@@ -1,9 +1,49 @@
+from typing import Any, Dict, List, Sequence
+
+
 class PyAirtableError(Exception):
     """
     Base class for all exceptions raised by PyAirtable.
     """
 
 
+class BatchError(PyAirtableError):
+    """
+    Raised by batch operations which send several requests concurrently
+    (such as ``Table.batch_create(records, workers=4)``) when one or more of
+    those requests failed. Every other request will still have been sent.
+    """
+
+    def __init__(
+        self,
+        chunks: Sequence[Sequence[Any]],
+        results: Dict[int, Any],
+        errors: Dict[int, Exception],
+    ):
+        super().__init__(f"{len(errors)} of {len(chunks)} batches failed")
+        #: The items passed to the batch operation, split into one chunk per request.
+        self.chunks = list(chunks)
+        #: The result of each chunk that succeeded, keyed by the chunk's index.
+        self.results = results
+        #: The exception raised by each chunk that failed, keyed by the chunk's index.
+        self.errors = errors
+
+    @property
+    def succeeded(self) -> List[Any]:
+        """
+        All items from chunks which succeeded, in their original order.
+        """
+        return [item for n in sorted(self.results) for item in self.chunks[n]]
+
+    @property
+    def failed(self) -> List[Any]:
+        """
+        All items from chunks which failed, in their original order.
+        These can be passed to the same batch operation to retry them.
+        """
+        return [item for n in sorted(self.errors) for item in self.chunks[n]]
+
+
 class CircularFormulaError(PyAirtableError, RecursionError):
     """
     A circular dependency was encountered when flattening nested conditions.
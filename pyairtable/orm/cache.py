@@ -0,0 +1,152 @@
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Iterator, MutableMapping, Optional, Tuple
+
+from pyairtable.api.types import RecordId
+
+
+@dataclass
+class CacheStats:
+    """
+    Describes how an :class:`IdentityMap` has been used.
+    """
+
+    #: The number of lookups which found an instance.
+    hits: int = 0
+    #: The number of lookups which did not find an instance (including expired ones).
+    misses: int = 0
+    #: The number of instances removed to stay within ``max_size``.
+    evictions: int = 0
+    #: The number of instances removed because they were older than ``ttl``.
+    expirations: int = 0
+
+
+class IdentityMap(MutableMapping[RecordId, Any]):
+    """
+    Holds the model instances which have been memoized for one
+    :class:`~pyairtable.orm.Model` class, keyed by record ID.
+    See :ref:`Memoizing linked records` for more information.
+
+    By default, instances are kept until they are invalidated. If ``max_size``
+    is set, the least recently used instances will be discarded once there are
+    too many; if ``ttl`` is set, instances will be discarded once they are too old.
+    Discarding an instance means the next lookup for that record will create
+    a new instance, rather than reusing the old one.
+
+    Each model's identity map is available as ``Model.meta.identity_map``:
+
+    >>> Contact.meta.identity_map.stats
+    CacheStats(hits=120, misses=8, evictions=0, expirations=0)
+    >>> Contact.meta.identity_map.invalidate("recS6qSLw0OCA6Xul")
+    """
+
+    def __init__(self, *, max_size: Optional[int] = None, ttl: Optional[float] = None):
+        """
+        Args:
+            max_size: The maximum number of instances to keep.
+            ttl: The maximum number of seconds to keep each instance.
+        """
+        if max_size is not None and max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        self.max_size = max_size
+        self.ttl = ttl
+        #: Statistics about how this identity map has been used.
+        self.stats = CacheStats()
+        self._entries: "OrderedDict[RecordId, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.RLock()
+
+    def __repr__(self) -> str:
+        return (
+            f"<{self.__class__.__name__} size={len(self)}"
+            f" max_size={self.max_size!r} ttl={self.ttl!r}>"
+        )
+
+    def __getitem__(self, record_id: RecordId) -> Any:
+        with self._lock:
+            if (instance := self._get(record_id)) is None:
+                self.stats.misses += 1
+                raise KeyError(record_id)
+            self.stats.hits += 1
+            self._entries.move_to_end(record_id)
+            return instance
+
+    def __setitem__(self, record_id: RecordId, instance: Any) -> None:
+        expires = time.monotonic() + self.ttl if self.ttl is not None else 0.0
+        with self._lock:
+            # Storing the same instance again does not extend its lifetime;
+            # otherwise an instance which is used often would never expire.
+            if self._get(record_id) is instance:
+                expires = self._entries[record_id][0]
+            self._entries[record_id] = (expires, instance)
+            self._entries.move_to_end(record_id)
+            while self.max_size is not None and len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.stats.evictions += 1
+
+    def __delitem__(self, record_id: RecordId) -> None:
+        with self._lock:
+            del self._entries[record_id]
+
+    def __contains__(self, record_id: object) -> bool:
+        with self._lock:
+            return isinstance(record_id, str) and self._get(record_id) is not None
+
+    def __iter__(self) -> Iterator[RecordId]:
+        with self._lock:
+            self._expire()
+            return iter(list(self._entries))
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._expire()
+            return len(self._entries)
+
+    def __bool__(self) -> bool:
+        # Unlike len(), this does not discard expired instances first, so it is cheap
+        # enough to check before every lookup; it may be True even if they have all expired.
+        return bool(self._entries)
+
+    def invalidate(self, *record_ids: RecordId) -> None:
+        """
+        Discard the instances for the given record IDs, if there are any,
+        so that they will not be reused.
+        """
+        with self._lock:
+            for record_id in record_ids:
+                self._entries.pop(record_id, None)
+
+    def clear(self) -> None:
+        """
+        Discard all instances.
+        """
+        with self._lock:
+            self._entries.clear()
+
+    def _get(self, record_id: RecordId) -> Any:
+        """
+        Return the instance for a record ID without affecting statistics
+        or LRU order, or ``None`` if it is missing or has expired.
+        """
+        try:
+            expires, instance = self._entries[record_id]
+        except KeyError:
+            return None
+        if self.ttl is not None and expires <= time.monotonic():
+            del self._entries[record_id]
+            self.stats.expirations += 1
+            return None
+        return instance
+
+    def _expire(self) -> None:
+        if self.ttl is None:
+            return
+        for record_id in list(self._entries):
+            self._get(record_id)
+
+
+__all__ = [
+    "CacheStats",
+    "IdentityMap",
+]
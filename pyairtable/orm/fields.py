@@ -27,16 +27,21 @@ which allows us to define methods and type annotations for getting and setting a
 
 import abc
 import importlib
+import threading
 from datetime import date, datetime, timedelta
 from enum import Enum
 from typing import (
     TYPE_CHECKING,
     Any,
     ClassVar,
+    Dict,
     Generic,
     List,
     Literal,
+    Mapping,
     Optional,
+    Sequence,
+    Set,
     Tuple,
     Type,
     TypeVar,
@@ -71,6 +76,11 @@ T_ORM = TypeVar("T_ORM")  # type used to store values internally
 T_Missing = TypeVar("T_Missing")  # type returned when Airtable has no value
 
 
+#: Held while converting a value for a model with ``Meta.lazy_conversion``,
+#: so that concurrent readers of the same field do not convert it twice.
+_conversion_lock = threading.Lock()
+
+
 class Field(Generic[T_API, T_ORM, T_Missing], metaclass=abc.ABCMeta):
     """
     A generic class for an Airtable field descriptor that will be
@@ -167,7 +177,7 @@ class Field(Generic[T_API, T_ORM, T_Missing], metaclass=abc.ABCMeta):
         if not instance:
             return self
         try:
-            value = instance._fields[self.field_name]
+            value = self._stored_value(instance)
         except (KeyError, AttributeError):
             return cast(T_Missing, self.missing_value)
         if value is None:
@@ -178,9 +188,37 @@ class Field(Generic[T_API, T_ORM, T_Missing], metaclass=abc.ABCMeta):
         self._raise_if_readonly()
         if not hasattr(instance, "_fields"):
             instance._fields = {}
+        if not isinstance(changed := getattr(instance, "_changed", None), set):
+            changed = instance._changed = set()
         if self.validate_type and value is not None:
             self.valid_or_raise(value)
         instance._fields[self.field_name] = value
+        changed.add(self.field_name)
+        if self.field_name in getattr(instance, "_unconverted", ()):
+            cast(Set[str], instance._unconverted).discard(self.field_name)
+        if self.field_name in getattr(instance, "_deferred", ()):
+            instance._deferred = instance._deferred - {self.field_name}
+
+    def _stored_value(self, instance: "Model") -> Any:
+        """
+        Retrieve the field's value from the instance, first converting it
+        from its API representation if that has not happened yet.
+        Raises ``KeyError`` if the instance has no value for this field.
+        """
+        if self.field_name in getattr(instance, "_deferred", ()):
+            instance._load_deferred()
+        if self.field_name in getattr(instance, "_unconverted", ()):
+            with _conversion_lock:
+                # Another thread may have converted it while we waited. Store the
+                # converted value before marking it as converted, so readers which
+                # skip the lock never see the API's value.
+                if self.field_name in instance._unconverted:
+                    value = instance._fields[self.field_name]
+                    if value is not None:
+                        value = self.to_internal_value(value)
+                        instance._fields[self.field_name] = value
+                    cast(Set[str], instance._unconverted).discard(self.field_name)
+        return instance._fields[self.field_name]
 
     def __delete__(self, instance: "Model") -> None:
         raise AttributeError(f"cannot delete {self._description}")
@@ -486,7 +524,19 @@ class _ListField(Generic[T_API, T_ORM], Field[List[T_API], List[T_ORM], List[T_O
         return self._get_list_value(instance)
 
     def _get_list_value(self, instance: "Model") -> List[T_ORM]:
-        value = cast(List[T_ORM], instance._fields.get(self.field_name))
+        value = self._stored_list(instance)
+        # Keep a copy of the list so that Model.save() can tell if it is modified in place.
+        if not self.readonly:
+            if not isinstance(snapshots := getattr(instance, "_snapshots", None), dict):
+                snapshots = instance._snapshots = {}
+            snapshots.setdefault(self.field_name, list(value))
+        return value
+
+    def _stored_list(self, instance: "Model") -> List[T_ORM]:
+        try:
+            value = cast(List[T_ORM], self._stored_value(instance))
+        except KeyError:
+            value = None
         # If Airtable returns no value, substitute an empty list.
         if value is None:
             value = []
@@ -641,7 +691,7 @@ class LinkField(_ListField[RecordId, T_Linked]):
                 f"populate() got {type(instance)}; expected {self._model}"
             )
         lazy = lazy if lazy is not None else self._lazy
-        if not (records := super()._get_list_value(instance)):
+        if not (records := self._stored_list(instance)):
             return
         # If there are any values which are IDs rather than instances,
         # retrieve their values in bulk, and store them keyed by ID
@@ -658,11 +708,55 @@ class LinkField(_ListField[RecordId, T_Linked]):
                     fetch=(not lazy),
                 )
             }
-        # If the list contains record IDs, replace the contents with instances.
-        # Other code may already have references to this specific list, so
-        # we replace the existing list's values.
+        self._replace_ids(records, new_records)
+
+    def _populate_many(
+        self,
+        instances: Sequence["Model"],
+        *,
+        memoize: Optional[bool] = None,
+    ) -> List[T_Linked]:
+        """
+        Populate this field on several instances at once, retrieving all of their
+        linked records with as few API calls as possible.
+
+        Returns:
+            Every distinct linked model instance, across all of ``instances``.
+        """
+        lists: List[List[Any]] = [self._stored_list(i) for i in instances]
+        record_ids = {
+            value
+            for records in lists
+            for value in records[: self._max_retrieve]
+            if isinstance(value, RecordId)
+        }
+        new_records = {}
+        if record_ids:
+            new_records = {
+                record.id: record
+                for record in self.linked_model.from_ids(
+                    sorted(record_ids), memoize=memoize
+                )
+            }
+        linked: Dict[int, T_Linked] = {}
+        for records in lists:
+            self._replace_ids(records, new_records)
+            for record in records[: self._max_retrieve]:
+                linked.setdefault(id(record), record)
+        return list(linked.values())
+
+    def _replace_ids(
+        self,
+        records: List[Any],
+        new_records: Mapping[RecordId, T_Linked],
+    ) -> None:
+        """
+        Replace any record IDs in the list with instances from ``new_records``.
+        Other code may already have references to this specific list, so
+        we replace the existing list's values.
+        """
         records[: self._max_retrieve] = [
-            new_records[cast(RecordId, value)] if isinstance(value, RecordId) else value
+            new_records[value] if isinstance(value, RecordId) else value
             for value in records[: self._max_retrieve]
         ]
 
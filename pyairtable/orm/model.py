@@ -1,42 +1,53 @@
 import datetime
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from functools import cached_property
+from functools import cached_property, partial
+from types import MappingProxyType
 from typing import (
     TYPE_CHECKING,
+    AbstractSet,
     Any,
+    Callable,
     ClassVar,
     Dict,
     Iterable,
+    Iterator,
     List,
     Mapping,
+    MutableMapping,
     Optional,
+    Sequence,
+    Set,
+    Tuple,
     Type,
     Union,
     cast,
 )
 
+import requests
 from typing_extensions import Self as SelfType
 
 from pyairtable.api import retrying
 from pyairtable.api.api import Api, TimeoutTuple
 from pyairtable.api.base import Base
 from pyairtable.api.table import Table
-from pyairtable.api.types import (
-    FieldName,
-    RecordDict,
-    RecordId,
-    UpdateRecordDict,
-    WritableFields,
-)
-from pyairtable.formulas import EQ, OR, RECORD_ID
+from pyairtable.api.types import FieldName, RecordDict, RecordId, UpdateRecordDict
+from pyairtable.exceptions import BatchError
+from pyairtable.formulas import EQ, OR, RECORD_ID, Formula
 from pyairtable.models import Comment
-from pyairtable.orm.fields import AnyField, Field
+from pyairtable.orm.cache import IdentityMap
+from pyairtable.orm.fields import AnyField, Field, LinkField, SingleLinkField
+from pyairtable.orm.query import QuerySetDescriptor
 from pyairtable.utils import datetime_from_iso_str, datetime_to_iso_str
 
 if TYPE_CHECKING:
     from builtins import _ClassInfo
 
 
+#: The maximum length of each formula built by :meth:`Model.from_ids`.
+MAX_FORMULA_LENGTH = 8000
+
+
 class Model:
     """
     Supports creating ORM-style classes representing Airtable tables.
@@ -57,6 +68,23 @@ class Model:
         * ``use_field_ids`` - Whether fields will be defined by ID, rather than name. Defaults to ``False``.
         * ``memoize`` - Whether the model should reuse models it creates between requests.
           See :ref:`Memoizing linked records` for more information.
+        * ``lazy_conversion`` - If ``True``, values retrieved from the API are
+          converted (for example, from ISO 8601 strings into ``datetime`` objects)
+          the first time each field is accessed, rather than when each record is
+          retrieved. This can save a lot of time when retrieving many records
+          but only reading a few of their fields. Fields can safely be read
+          from several threads at once, but (as with any model) an instance
+          should not be modified or saved by one thread while others use it.
+          Defaults to ``False``.
+        * ``memoize_max_size`` - The maximum number of memoized instances to keep.
+          Defaults to no limit.
+        * ``memoize_ttl`` - The maximum number of seconds to keep each memoized instance.
+          Defaults to no limit.
+        * ``identity_map`` - An :class:`~pyairtable.orm.cache.IdentityMap` to hold
+          memoized instances. Overrides ``memoize_max_size`` and ``memoize_ttl``.
+        * ``compact`` - If ``True``, each instance stores its field values in a
+          fixed-size array rather than a dict, which uses less memory when holding
+          many instances of a model with many fields. Defaults to ``False``.
 
     For example, the following two are equivalent:
 
@@ -122,17 +150,80 @@ class Model:
     #: A wrapper allowing type-annotated access to ORM configuration.
     meta: ClassVar["_Meta"]
 
+    #: A lazy :class:`~pyairtable.orm.query.QuerySet` for all of the model's records.
+    objects = QuerySetDescriptor()
+
     _deleted: bool = False
     _fetched: bool = False
-    _fields: Dict[FieldName, Any]
-    _memoized: ClassVar[Dict[RecordId, SelfType]]
+    # Field values in internal (not API) representation
+    _fields: MutableMapping[FieldName, Any]
+    # Names of fields which were set since the last fetch or save
+    _changed: AbstractSet[FieldName] = frozenset()
+    # Names of fields whose values in _fields have not yet been converted
+    # from their API representation (see Meta.lazy_conversion)
+    _unconverted: AbstractSet[FieldName] = frozenset()
+    # Copies of list values, used to detect when they are modified in place
+    _snapshots: Mapping[FieldName, List[Any]] = MappingProxyType({})
+    # Names of fields which were left out when the record was retrieved,
+    # and will be retrieved the first time any of them is accessed
+    _deferred: AbstractSet[FieldName] = frozenset()
+    _memoized: ClassVar[MutableMapping[RecordId, SelfType]]
+
+    # These are built once for each subclass, since they are needed for every record.
+    _descriptors_by_attribute: ClassVar[Dict[str, AnyField]]
+    _descriptors_by_field_name: ClassVar[Dict[FieldName, AnyField]]
+    _writable_field_names: ClassVar[AbstractSet[FieldName]]
+    _internal_converters: ClassVar[Dict[FieldName, Callable[[Any], Any]]]
+    _record_converters: ClassVar[Dict[FieldName, Callable[[Any], Any]]]
+    _field_positions: ClassVar[Optional[Dict[FieldName, int]]]
 
     def __init_subclass__(cls, **kwargs: Any):
         cls.meta = _Meta(cls)
-        cls._memoized = {}
         cls._validate_class()
+        cls._memoized = cls.meta._build_identity_map()
+        cls._build_descriptor_maps()
         super().__init_subclass__(**kwargs)
 
+    @classmethod
+    def _build_descriptor_maps(cls) -> None:
+        cls._descriptors_by_attribute = {
+            k: v for k, v in cls.__dict__.items() if isinstance(v, Field)
+        }
+        cls._descriptors_by_field_name = {
+            f.field_name: f for f in cls._descriptors_by_attribute.values()
+        }
+        cls._writable_field_names = frozenset(
+            name for name, f in cls._descriptors_by_field_name.items() if not f.readonly
+        )
+        # Only keep track of converters which actually do something,
+        # so that values for other fields can be used as-is.
+        cls._internal_converters = {
+            name: f.to_internal_value
+            for name, f in cls._descriptors_by_field_name.items()
+            if type(f).to_internal_value is not Field.to_internal_value
+        }
+        cls._record_converters = {
+            name: f.to_record_value
+            for name, f in cls._descriptors_by_field_name.items()
+            if type(f).to_record_value is not Field.to_record_value
+        }
+        cls._field_positions = (
+            {name: n for (n, name) in enumerate(cls._descriptors_by_field_name)}
+            if cls.meta.compact
+            else None
+        )
+
+    @classmethod
+    def _new_fields(
+        cls, values: Mapping[FieldName, Any] = MappingProxyType({})
+    ) -> MutableMapping[FieldName, Any]:
+        """
+        Build the mapping which will hold an instance's field values.
+        """
+        if cls._field_positions is None:
+            return dict(values)
+        return _CompactFields(cls._field_positions, values)
+
     def __repr__(self) -> str:
         if not self.id:
             return f"<unsaved {self.__class__.__name__}>"
@@ -141,7 +232,7 @@ class Model:
     @classmethod
     def _attribute_descriptor_map(cls) -> Dict[str, AnyField]:
         """
-        Build a mapping of the model's attribute names to field descriptor instances.
+        Return a mapping of the model's attribute names to field descriptor instances.
 
         >>> class Test(Model):
         ...     first_name = TextField("First Name")
@@ -153,12 +244,12 @@ class Model:
         ...     "another_Field": <NumberField field_name="Age">,
         ... }
         """
-        return {k: v for k, v in cls.__dict__.items() if isinstance(v, Field)}
+        return cls._descriptors_by_attribute
 
     @classmethod
     def _field_name_descriptor_map(cls) -> Dict[FieldName, AnyField]:
         """
-        Build a mapping of the model's field names to field descriptor instances.
+        Return a mapping of the model's field names to field descriptor instances.
 
         >>> class Test(Model):
         ...     first_name = TextField("First Name")
@@ -170,7 +261,7 @@ class Model:
         ...     "Age": <NumberField field_name="Age">,
         ... }
         """
-        return {f.field_name: f for f in cls._attribute_descriptor_map().values()}
+        return cls._descriptors_by_field_name
 
     def __init__(self, **fields: Any):
         """
@@ -190,8 +281,7 @@ class Model:
         except KeyError:
             pass
 
-        # Field values in internal (not API) representation
-        self._fields = {}
+        self._fields = self._new_fields()
 
         # Call __set__ on each field to set field values
         for key, value in fields.items():
@@ -221,12 +311,60 @@ class Model:
         """
         return bool(self.id)
 
-    def save(self) -> bool:
+    def is_dirty(self) -> bool:
+        """
+        Whether the instance has changes which have not been saved to the API.
+        This is always ``True`` for an instance which has never been saved.
+        """
+        return not self.id or bool(self._dirty_field_names())
+
+    def dirty_fields(self) -> Set[str]:
+        """
+        The attribute names of any fields which have been changed
+        since the instance was last fetched or saved.
+
+        >>> contact = Contact.from_id("recWPqD9izdsNvlE")
+        >>> contact.name = "Alice"
+        >>> contact.dirty_fields()
+        {'name'}
+        """
+        map_ = self._field_name_descriptor_map()
+        return {
+            map_[name]._attribute_name or name for name in self._dirty_field_names()
+        }
+
+    def _dirty_field_names(self) -> Set[FieldName]:
+        return {
+            name
+            for (name, snapshot) in self._snapshots.items()
+            if self._fields.get(name) != snapshot
+        } | self._changed
+
+    def _mark_clean(self) -> None:
+        """
+        Forget which fields have changed, so that only fields changed
+        from now on will be sent to the API by :meth:`save`.
+        """
+        names = set(self._snapshots) | self._changed
+        self._changed = frozenset()
+        self._snapshots = {
+            name: list(value)
+            for name in names
+            if isinstance(value := self._fields.get(name), list)
+        }
+
+    def save(self, *, force: bool = False) -> bool:
         """
         Save the model to the API.
 
         If the instance does not exist already, it will be created;
-        otherwise, the existing record will be updated.
+        otherwise, the existing record will be updated with only the fields
+        that have changed since it was fetched or last saved. If nothing
+        has changed, no request will be sent.
+
+        Args:
+            force: If ``True``, send every writable field to the API,
+                even if none have changed.
 
         Returns:
             ``True`` if a record was created, ``False`` if it was updated.
@@ -234,17 +372,22 @@ class Model:
         if self._deleted:
             raise RuntimeError(f"{self.id} was deleted")
         table = self.meta.table
-        fields = self.to_record(only_writable=True)["fields"]
 
         if not self.id:
+            fields = self.to_record(only_writable=True)["fields"]
             record = table.create(fields, typecast=self.meta.typecast)
             did_create = True
         else:
+            names = self._fields if force else self._dirty_field_names()
+            fields = self._record_fields(names, only_writable=True)
+            if not fields and not force:
+                return False
             record = table.update(self.id, fields, typecast=self.meta.typecast)
             did_create = False
 
         self.id = record["id"]
         self.created_time = datetime_from_iso_str(record["createdTime"])
+        self._mark_clean()
         return did_create
 
     def delete(self) -> bool:
@@ -259,23 +402,57 @@ class Model:
         table = self.meta.table
         result = table.delete(self.id)
         self._deleted = True
+        self._memoized.pop(self.id, None)
         # Is it even possible to get "deleted" False?
         return bool(result["deleted"])
 
     @classmethod
-    def all(cls, *, memoize: Optional[bool] = None, **kwargs: Any) -> List[SelfType]:
+    def all(
+        cls,
+        *,
+        memoize: Optional[bool] = None,
+        prefetch: Iterable[str] = (),
+        **kwargs: Any,
+    ) -> List[SelfType]:
         """
         Retrieve all records for this model. For all supported
         keyword arguments, see :meth:`Table.all <pyairtable.Table.all>`.
 
+        Only the fields defined by the model are requested from the API.
+        If ``fields=`` is provided, any of the model's other fields will be
+        retrieved the first time one of them is accessed on each instance.
+
         Args:
             memoize: |kwarg_orm_memoize|
+            prefetch: Linked records to retrieve along with these records.
+                See :meth:`prefetch` for details.
         """
         kwargs.update(cls.meta.request_kwargs)
-        return [
-            cls.from_record(record, memoize=memoize)
+        kwargs["fields"], deferred = cls._projection(kwargs.get("fields"))
+        instances = [
+            cls._from_projected(record, deferred, memoize)
             for record in cls.meta.table.all(**kwargs)
         ]
+        if prefetch:
+            cls.prefetch(instances, *prefetch, memoize=memoize)
+        return instances
+
+    @classmethod
+    def stream(
+        cls, *, memoize: Optional[bool] = None, **kwargs: Any
+    ) -> Iterator[SelfType]:
+        """
+        Yield each record for this model one at a time, without holding the
+        full result set in memory. For all supported keyword arguments
+        (including ``progress=``), see :meth:`Table.stream <pyairtable.Table.stream>`.
+
+        Args:
+            memoize: |kwarg_orm_memoize|
+        """
+        kwargs.update(cls.meta.request_kwargs)
+        kwargs["fields"], deferred = cls._projection(kwargs.get("fields"))
+        for record in cls.meta.table.stream(**kwargs):
+            yield cls._from_projected(record, deferred, memoize)
 
     @classmethod
     def first(
@@ -289,10 +466,158 @@ class Model:
             memoize: |kwarg_orm_memoize|
         """
         kwargs.update(cls.meta.request_kwargs)
+        kwargs["fields"], deferred = cls._projection(kwargs.get("fields"))
         if record := cls.meta.table.first(**kwargs):
-            return cls.from_record(record, memoize=memoize)
+            return cls._from_projected(record, deferred, memoize)
         return None
 
+    @classmethod
+    def _projection(
+        cls, fields: Optional[Iterable[FieldName]] = None
+    ) -> Tuple[List[FieldName], AbstractSet[FieldName]]:
+        """
+        Choose which fields to request from the API, and which of the model's
+        fields will need to be retrieved later if they are accessed.
+        By default, only the fields the model defines will be requested.
+        """
+        declared = cls._field_name_descriptor_map()
+        if fields is None:
+            return list(declared), frozenset()
+        fields = list(fields)
+        return fields, frozenset(declared.keys() - set(fields))
+
+    @classmethod
+    def _from_projected(
+        cls,
+        record: RecordDict,
+        deferred: AbstractSet[FieldName],
+        memoize: Optional[bool],
+    ) -> SelfType:
+        """
+        Create an instance from a record which was retrieved with only some of
+        the model's fields, so that the others are retrieved when accessed.
+        """
+        if not deferred:
+            return cls.from_record(record, memoize=memoize)
+        fields = {k: v for (k, v) in record["fields"].items() if k not in deferred}
+        instance = cls.from_record({**record, "fields": fields}, memoize=memoize)
+        instance._deferred = deferred
+        return instance
+
+    def _load_deferred(self) -> None:
+        """
+        Retrieve values for the fields which were left out
+        when this instance was retrieved from the API.
+        """
+        deferred, self._deferred = self._deferred, frozenset()
+        record = self.meta.table.get(self.id, **self.meta.request_kwargs)
+        loaded = self.from_record(record, memoize=False)
+        self._merge_deferred(loaded, deferred)
+
+    @classmethod
+    def _load_deferred_many(
+        cls,
+        instances: Iterable["Model"],
+        names: AbstractSet[FieldName],
+    ) -> None:
+        """
+        Retrieve values for any of the given fields which were left out when
+        these instances were retrieved from the API, using as few API calls
+        as possible rather than one call per instance.
+        """
+        pending = [instance for instance in instances if instance._deferred & names]
+        if not pending:
+            return
+        wanted = frozenset().union(
+            *(instance._deferred & names for instance in pending)
+        )
+        records = cls._fetch_records(
+            [instance.id for instance in pending],
+            fields=sorted(wanted),
+        )
+        loaded = {
+            record["id"]: cls.from_record(record, memoize=False) for record in records
+        }
+        for instance in pending:
+            if instance.id not in loaded:
+                continue
+            deferred = instance._deferred & wanted
+            instance._deferred = instance._deferred - deferred
+            instance._merge_deferred(loaded[instance.id], deferred)
+
+    def _merge_deferred(self, loaded: "Model", names: AbstractSet[FieldName]) -> None:
+        """
+        Copy values for the given (formerly deferred) fields from another
+        instance of the same record.
+        """
+        for name in names:
+            if name in loaded._fields:
+                self._fields[name] = loaded._fields[name]
+        if unconverted := names & loaded._unconverted:
+            self._unconverted = set(self._unconverted) | unconverted
+
+    @classmethod
+    def prefetch(
+        cls,
+        instances: Iterable[SelfType],
+        *paths: str,
+        memoize: Optional[bool] = None,
+    ) -> None:
+        """
+        Retrieve the linked records for several instances at once, rather than
+        making separate API calls for each instance when its link fields are accessed.
+
+        Each path is the name of a :class:`~pyairtable.orm.fields.LinkField` or
+        :class:`~pyairtable.orm.fields.SingleLinkField` on this model. Paths can
+        continue with a ``.`` to prefetch the linked model's own links as well.
+
+        >>> authors = Author.all()
+        >>> Author.prefetch(authors, "books", "books.publisher")
+        >>> authors[0].books[0].publisher.name  # no API calls here
+        'Penguin Random House'
+
+        Args:
+            instances: Instances of this model.
+            paths: Names of link fields to prefetch.
+            memoize: |kwarg_orm_memoize|
+
+        Raises:
+            ValueError: If a path does not refer to a link field.
+        """
+        instances = list(instances)
+        if not all(isinstance(instance, cls) for instance in instances):
+            raise TypeError(set(type(instance) for instance in instances))
+
+        # Group paths by their first component, so "a", "a.b", and "a.c"
+        # only need to retrieve the records linked by "a" once.
+        nested: Dict[str, List[str]] = {}
+        for path in paths:
+            name, _, rest = path.partition(".")
+            nested.setdefault(name, [])
+            if rest:
+                nested[name].append(rest)
+
+        descriptors = cls._attribute_descriptor_map()
+        link_fields: Dict[str, LinkField[Any]] = {}
+        for name in nested:
+            field = descriptors.get(name)
+            if isinstance(field, SingleLinkField):
+                field = field._link_field
+            if not isinstance(field, LinkField):
+                raise ValueError(f"{cls.__name__}.{name} is not a link field")
+            link_fields[name] = field
+
+        # Link fields which were left out of the projection that retrieved
+        # these instances are loaded together, not once per instance.
+        cls._load_deferred_many(
+            instances, {field.field_name for field in link_fields.values()}
+        )
+        for name, subpaths in nested.items():
+            field = link_fields[name]
+            linked = field._populate_many(instances, memoize=memoize)
+            if subpaths:
+                field.linked_model.prefetch(linked, *subpaths, memoize=memoize)
+
     @classmethod
     def _maybe_memoize(cls, instance: SelfType, memoize: Optional[bool]) -> None:
         """
@@ -314,15 +639,32 @@ class Model:
             only_writable: If ``True``, the result will exclude any
                 values which are associated with readonly fields.
         """
-        map_ = self._field_name_descriptor_map()
-        fields = {
-            field: None if value is None else map_[field].to_record_value(value)
-            for field, value in self._fields.items()
-            if not (map_[field].readonly and only_writable)
-        }
+        fields = self._record_fields(self._fields, only_writable)
         ct = datetime_to_iso_str(self.created_time) if self.created_time else ""
         return {"id": self.id, "createdTime": ct, "fields": fields}
 
+    def _record_fields(
+        self, names: Iterable[FieldName], only_writable: bool = False
+    ) -> Dict[FieldName, Any]:
+        """
+        Convert the internal values of the given fields into values expected by Airtable.
+        """
+        writable = self._writable_field_names
+        converters = self._record_converters
+        fields = {}
+        for field in names:
+            if only_writable and field not in writable:
+                continue
+            value = self._fields.get(field)
+            if (
+                value is not None
+                and field in converters
+                and field not in self._unconverted
+            ):
+                value = converters[field](value)
+            fields[field] = value
+        return fields
+
     @classmethod
     def from_record(
         cls, record: RecordDict, *, memoize: Optional[bool] = None
@@ -335,22 +677,35 @@ class Model:
             memoize: |kwarg_orm_memoize|
         """
         name_field_map = cls._field_name_descriptor_map()
-        # Convert Column Names into model field names
-        field_values = {
-            # Use field's to_internal_value to cast into model fields
-            field: (
-                name_field_map[field].to_internal_value(value)
-                if value is not None
-                else None
+        if cls.meta.lazy_conversion:
+            instance = cls(id=record["id"])
+            instance._fields = cls._new_fields(
+                {
+                    field: value
+                    for (field, value) in record["fields"].items()
+                    if field in name_field_map
+                }
             )
-            for (field, value) in record["fields"].items()
+            instance._unconverted = set(instance._fields)
+            instance._fetched = True
+            instance.created_time = datetime_from_iso_str(record["createdTime"])
+            cls._maybe_memoize(instance, memoize)
+            return instance
+
+        # Use each field's to_internal_value to cast into model fields
+        converters = cls._internal_converters
+        field_values = {}
+        for field, value in record["fields"].items():
             # Silently proceed if Airtable returns fields we don't recognize
-            if field in name_field_map
-        }
+            if field not in name_field_map:
+                continue
+            if value is not None and field in converters:
+                value = converters[field](value)
+            field_values[field] = value
         # Since instance(**field_values) will perform validation and fail on
         # any readonly fields, instead we directly set instance._fields.
         instance = cls(id=record["id"])
-        instance._fields = field_values
+        instance._fields = cls._new_fields(field_values)
         instance._fetched = True
         instance.created_time = datetime_from_iso_str(record["createdTime"])
         cls._maybe_memoize(instance, memoize)
@@ -376,9 +731,14 @@ class Model:
             instance = cast(SelfType, cls._memoized[record_id])
         except KeyError:
             instance = cls(id=record_id)
+            if fetch:
+                instance.fetch()
+            # Only memoize new instances, so that reading a memoized
+            # instance does not extend how long it will be kept.
+            cls._maybe_memoize(instance, memoize)
+            return instance
         if fetch and not instance._fetched:
             instance.fetch()
-        cls._maybe_memoize(instance, memoize)
         return instance
 
     def fetch(self) -> None:
@@ -391,8 +751,12 @@ class Model:
         record = self.meta.table.get(self.id)
         unused = self.from_record(record, memoize=False)
         self._fields = unused._fields
+        self._unconverted = unused._unconverted
+        self._deferred = frozenset()
         self._fetched = True
         self.created_time = unused.created_time
+        self._changed = frozenset()
+        self._snapshots = MappingProxyType({})
 
     @classmethod
     def from_ids(
@@ -401,16 +765,29 @@ class Model:
         *,
         fetch: bool = True,
         memoize: Optional[bool] = None,
+        workers: int = 0,
+        fields: Optional[Iterable[FieldName]] = None,
     ) -> List[SelfType]:
         """
         Create a list of instances from record IDs. If any record IDs returned
         are invalid this will raise a KeyError, but only *after* retrieving all
         other valid records from the API.
 
+        Records are retrieved using ``filterByFormula``, split into as many queries
+        as needed to keep each formula to a reasonable length. If ``workers`` is
+        greater than 1 and there are no more records to retrieve than ``workers``,
+        they will instead be retrieved individually and concurrently, which avoids
+        evaluating a formula against every record in the table.
+
         Args:
             record_ids: |arg_record_id|
             fetch: |kwarg_orm_fetch|
             memoize: |kwarg_orm_memoize|
+            workers: The number of queries to send concurrently.
+                Defaults to ``0`` (send one query at a time).
+            fields: The names of the fields to retrieve. Any other fields
+                defined by the model will be retrieved the first time they
+                are accessed. Defaults to all fields defined by the model.
         """
         if not fetch:
             return [cls.from_id(record_id, fetch=False) for record_id in record_ids]
@@ -427,11 +804,11 @@ class Model:
 
         if remaining := sorted(set(record_ids) - set(by_id)):
             # Only retrieve records that aren't already memoized
-            formula = OR(EQ(RECORD_ID(), record_id) for record_id in sorted(remaining))
+            projection, deferred = cls._projection(fields)
             by_id.update(
                 {
-                    record["id"]: cls.from_record(record, memoize=memoize)
-                    for record in cls.meta.table.all(formula=formula)
+                    record["id"]: cls._from_projected(record, deferred, memoize)
+                    for record in cls._fetch_records(remaining, workers, projection)
                 }
             )
 
@@ -439,34 +816,127 @@ class Model:
         return [by_id[record_id] for record_id in record_ids]
 
     @classmethod
-    def batch_save(cls, models: List[SelfType]) -> None:
+    def _fetch_records(
+        cls,
+        record_ids: List[RecordId],
+        workers: int = 0,
+        fields: Optional[List[FieldName]] = None,
+    ) -> List[RecordDict]:
+        """
+        Retrieve records by ID, either individually or using formula queries.
+        Any record IDs which do not exist will be omitted from the result.
+        """
+        table = cls.meta.table
+        options = cls.meta.request_kwargs
+        queries: List[Callable[[], List[RecordDict]]]
+        if 1 < workers and len(record_ids) <= workers:
+            queries = [
+                partial(_get_if_exists, table, id, **options) for id in record_ids
+            ]
+        else:
+            queries = [
+                partial(table.all, formula=formula, fields=fields, **options)
+                for formula in _record_id_formulas(record_ids)
+            ]
+        if workers <= 1 or len(queries) <= 1:
+            return [record for query in queries for record in query()]
+        with ThreadPoolExecutor(max_workers=min(workers, len(queries))) as executor:
+            futures = [executor.submit(table.api._worker(query)) for query in queries]
+            return [record for future in futures for record in future.result()]
+
+    @classmethod
+    def batch_save(cls, models: List[SelfType], *, workers: int = 0) -> None:
         """
         Save a list of model instances to the Airtable API with as few
         network requests as possible. Can accept a mixture of new records
         (which have not been saved yet) and existing records that have IDs.
+        Existing records will only send the fields which have changed, and
+        records with no changes will not be sent at all.
+
+        Each instance is updated (and new instances are given an ID) as soon as
+        the request which saved it has completed, so if a request fails, every
+        instance saved by an earlier request will still reflect that.
+
+        If ``workers`` is greater than 1, creates and updates are sent concurrently.
+        Every request will be attempted even if some fail; afterwards,
+        :class:`~pyairtable.exceptions.BatchError` will be raised with the
+        instances which were and were not saved:
+
+        >>> try:
+        ...     Contact.batch_save(contacts, workers=4)
+        ... except BatchError as exc:
+        ...     Contact.batch_save(exc.failed)
+
+        Args:
+            models: Instances of this model.
+            workers: |kwarg_workers|
         """
         if not all(isinstance(model, cls) for model in models):
             raise TypeError(set(type(model) for model in models))
 
         create_models = [model for model in models if not model.id]
         update_models = [model for model in models if model.id]
-        create_records: List[WritableFields] = [
-            record["fields"]
+        creates = [
+            (model, model.to_record(only_writable=True)["fields"])
             for model in create_models
-            if (record := model.to_record(only_writable=True))
-        ]
-        update_records: List[UpdateRecordDict] = [
-            {"id": record["id"], "fields": record["fields"]}
-            for model in update_models
-            if (record := model.to_record(only_writable=True))
         ]
+        updates: List[Tuple[SelfType, UpdateRecordDict]] = []
+        for model in update_models:
+            if fields := model._record_fields(
+                model._dirty_field_names(), only_writable=True
+            ):
+                updates.append((model, UpdateRecordDict(id=model.id, fields=fields)))
+            else:
+                model._mark_clean()
 
         table = cls.meta.table
-        table.batch_update(update_records, typecast=cls.meta.typecast)
-        created_records = table.batch_create(create_records, typecast=cls.meta.typecast)
-        for model, record in zip(create_models, created_records):
-            model.id = record["id"]
-            model.created_time = datetime_from_iso_str(record["createdTime"])
+        send_update = partial(table.batch_update, typecast=cls.meta.typecast)
+        send_create = partial(table.batch_create, typecast=cls.meta.typecast)
+        tasks: List[Tuple[Callable[[List[Any]], List[RecordDict]], Sequence[Any]]] = [
+            *((send_update, chunk) for chunk in table.api.chunked(updates)),
+            *((send_create, chunk) for chunk in table.api.chunked(creates)),
+        ]
+        if workers <= 1 or len(tasks) <= 1:
+            for send, chunk in tasks:
+                cls._batch_save_chunk(send, chunk)
+            return
+
+        worker = table.api._worker(cls._batch_save_chunk)
+        results: Dict[int, List[Model]] = {}
+        errors: Dict[int, Exception] = {}
+        with ThreadPoolExecutor(max_workers=min(workers, len(tasks))) as executor:
+            futures = [executor.submit(worker, send, chunk) for (send, chunk) in tasks]
+            for index, future in enumerate(futures):
+                try:
+                    results[index] = future.result()
+                except Exception as exc:
+                    errors[index] = exc
+
+        if errors:
+            raise BatchError(
+                [[model for (model, _) in chunk] for (_, chunk) in tasks],
+                results,
+                errors,
+            ) from next(iter(errors.values()))
+
+    @staticmethod
+    def _batch_save_chunk(
+        send: Callable[[List[Any]], List[RecordDict]],
+        chunk: Sequence[Tuple["Model", Any]],
+    ) -> List["Model"]:
+        """
+        Send one request's worth of creates or updates, then record
+        the result on each instance that was saved.
+        """
+        records = send([payload for (_, payload) in chunk])
+        models = [model for (model, _) in chunk]
+        for model, record in zip(models, records):
+            if not model.id:
+                model.id = record["id"]
+                model.created_time = datetime_from_iso_str(record["createdTime"])
+        for model in models:
+            model._mark_clean()
+        return models
 
     @classmethod
     def batch_delete(cls, models: List[SelfType]) -> None:
@@ -481,6 +951,8 @@ class Model:
         if not all(isinstance(model, cls) for model in models):
             raise TypeError(set(type(model) for model in models))
         cls.meta.table.batch_delete([model.id for model in models])
+        for model in models:
+            cls._memoized.pop(model.id, None)
 
     def comments(self) -> List[Comment]:
         """
@@ -497,6 +969,91 @@ class Model:
         return self.meta.table.add_comment(self.id, text)
 
 
+def _get_if_exists(
+    table: Table, record_id: RecordId, **options: Any
+) -> List[RecordDict]:
+    """
+    Retrieve a single record, returning an empty list if it does not exist.
+    """
+    try:
+        return [table.get(record_id, **options)]
+    except requests.HTTPError as exc:
+        if exc.response is not None and exc.response.status_code == 404:
+            return []
+        raise
+
+
+def _record_id_formulas(
+    record_ids: Iterable[RecordId],
+    max_length: int = MAX_FORMULA_LENGTH,
+) -> List[Formula]:
+    """
+    Build formulas which match the given record IDs, splitting them into as many
+    formulas as needed to keep each one no longer than ``max_length``.
+    """
+    formulas: List[Formula] = []
+    group: List[Formula] = []
+    length = 0
+    for record_id in record_ids:
+        condition = EQ(RECORD_ID(), record_id)
+        if group and length + len(str(condition)) > max_length:
+            formulas.append(OR(group))
+            group, length = [], 0
+        group.append(condition)
+        length += len(str(condition)) + 2  # separator
+    if group:
+        formulas.append(OR(group))
+    return formulas
+
+
+#: Marks a position in _CompactFields which has no value.
+_MISSING = object()
+
+
+class _CompactFields(MutableMapping[FieldName, Any]):
+    """
+    Holds an instance's field values in a list, with one position per field,
+    for models which set ``Meta.compact = True``. Positions are shared by
+    every instance of the model, so each instance only pays for the list.
+    """
+
+    __slots__ = ("_positions", "_values")
+
+    def __init__(
+        self,
+        positions: Dict[FieldName, int],
+        values: Mapping[FieldName, Any] = MappingProxyType({}),
+    ):
+        self._positions = positions
+        self._values: List[Any] = [_MISSING] * len(positions)
+        for name, value in values.items():
+            self[name] = value
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({dict(self)!r})"
+
+    def __getitem__(self, name: FieldName) -> Any:
+        if (value := self._values[self._positions[name]]) is _MISSING:
+            raise KeyError(name)
+        return value
+
+    def __setitem__(self, name: FieldName, value: Any) -> None:
+        self._values[self._positions[name]] = value
+
+    def __delitem__(self, name: FieldName) -> None:
+        self[name]  # raises KeyError if there is no value
+        self._values[self._positions[name]] = _MISSING
+
+    def __iter__(self) -> Iterator[FieldName]:
+        values = self._values
+        return (
+            name for (name, n) in self._positions.items() if values[n] is not _MISSING
+        )
+
+    def __len__(self) -> int:
+        return sum(1 for value in self._values if value is not _MISSING)
+
+
 @dataclass
 class _Meta:
     """
@@ -605,6 +1162,30 @@ class _Meta:
     def memoize(self) -> bool:
         return bool(self.get("memoize", default=False))
 
+    @property
+    def lazy_conversion(self) -> bool:
+        return bool(self.get("lazy_conversion", default=False))
+
+    @property
+    def compact(self) -> bool:
+        return bool(self.get("compact", default=False))
+
+    @property
+    def identity_map(self) -> IdentityMap:
+        """
+        The :class:`~pyairtable.orm.cache.IdentityMap` which holds memoized instances.
+        """
+        return cast(IdentityMap, self.model._memoized)
+
+    def _build_identity_map(self) -> IdentityMap:
+        identity_map = self.get("identity_map", check_types=(type(None), IdentityMap))
+        if identity_map is not None:
+            return cast(IdentityMap, identity_map)
+        return IdentityMap(
+            max_size=self.get("memoize_max_size", check_types=(type(None), int)),
+            ttl=self.get("memoize_ttl", check_types=(type(None), int, float)),
+        )
+
     @property
     def request_kwargs(self) -> Dict[str, Any]:
         return {
@@ -0,0 +1,246 @@
+import dataclasses
+from itertools import islice
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Generic,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    overload,
+)
+
+from pyairtable.api.types import FieldName, RecordDict
+from pyairtable.formulas import AND, Formula
+
+if TYPE_CHECKING:
+    from pyairtable.orm.model import Model  # noqa
+
+
+T_Model = TypeVar("T_Model", bound="Model")
+
+
+@dataclasses.dataclass(frozen=True)
+class QuerySet(Generic[T_Model]):
+    """
+    A lazy query for a model's records, which can be narrowed down by chaining
+    :meth:`filter`, :meth:`order_by`, :meth:`only`, and slicing. Nothing will be
+    retrieved from the API until the query set is iterated or evaluated.
+    Use ``Model.objects`` to create one.
+
+    >>> query = (
+    ...     Contact.objects
+    ...     .filter(Contact.age.gt(30), is_registered=True)
+    ...     .order_by("-last_name")
+    ...     .only("first_name", "last_name")
+    ... )
+    >>> for contact in query[:50]:
+    ...     print(contact.first_name)
+
+    Each query set is immutable; every method returns a new one. Iterating over
+    the same query set more than once will retrieve its records again.
+    """
+
+    model: Type[T_Model]
+    conditions: Tuple[Formula, ...] = ()
+    sort: Tuple[str, ...] = ()
+    fields: Optional[Tuple[FieldName, ...]] = None
+    start: int = 0
+    stop: Optional[int] = None
+
+    def __repr__(self) -> str:
+        return f"<QuerySet model={self.model.__name__} options={self._options()!r}>"
+
+    def filter(self, *conditions: Formula, **fields: Any) -> "QuerySet[T_Model]":
+        """
+        Return a query set which only includes records matching every condition.
+        Keyword arguments are model attribute names which must equal the given values.
+
+        >>> Contact.objects.filter(Contact.age.gte(21), last_name="Smith")
+
+        Args:
+            conditions: Formulas which records must match.
+            fields: Attribute names and the values they must equal.
+        """
+        descriptors = self.model._attribute_descriptor_map()
+        equals = [descriptors[self._check(name)].eq(v) for name, v in fields.items()]
+        return self._replace(conditions=(*self.conditions, *conditions, *equals))
+
+    def order_by(self, *names: str) -> "QuerySet[T_Model]":
+        """
+        Return a query set which is sorted by the given attribute names,
+        replacing any previous ordering. Prefix a name with ``-``
+        to sort in descending order.
+
+        >>> Contact.objects.order_by("last_name", "-age")
+        """
+        sort = tuple(
+            ("-" if name.startswith("-") else "") + self._field_name(name.lstrip("-"))
+            for name in names
+        )
+        return self._replace(sort=sort)
+
+    def only(self, *names: str) -> "QuerySet[T_Model]":
+        """
+        Return a query set which only retrieves values for the given attribute names.
+        Values for any other fields will be retrieved the first time one of them
+        is accessed on each instance.
+
+        >>> Contact.objects.only("first_name", "email")
+        """
+        return self._replace(fields=tuple(self._field_name(name) for name in names))
+
+    @overload
+    def __getitem__(self, key: int) -> T_Model: ...
+
+    @overload
+    def __getitem__(self, key: slice) -> "QuerySet[T_Model]": ...
+
+    def __getitem__(
+        self, key: Union[int, slice]
+    ) -> Union[T_Model, "QuerySet[T_Model]"]:
+        """
+        Slicing a query set limits the number of records retrieved using
+        ``max_records``, without sending any requests. Airtable does not
+        support skipping records, so any records before the start of
+        the slice are retrieved and then discarded.
+
+        Indexing a query set retrieves the record at that position.
+        """
+        if isinstance(key, int):
+            if key < 0:
+                raise ValueError("negative indexing is not supported")
+            for instance in self[key : key + 1]:
+                return instance
+            raise IndexError(key)
+
+        if key.step not in (None, 1):
+            raise ValueError("slicing with a step is not supported")
+        if (key.start or 0) < 0 or (key.stop or 0) < 0:
+            raise ValueError("negative slicing is not supported")
+        start = self.start + (key.start or 0)
+        stop = self.stop
+        if key.stop is not None:
+            stop = self.start + key.stop
+            stop = stop if self.stop is None else min(stop, self.stop)
+        return self._replace(
+            start=start, stop=stop if stop is None else max(stop, start)
+        )
+
+    def __iter__(self) -> Iterator[T_Model]:
+        return self.iterator()
+
+    def iterator(
+        self,
+        chunk_size: Optional[int] = None,
+        *,
+        memoize: Optional[bool] = None,
+    ) -> Iterator[T_Model]:
+        """
+        Yield each matching instance, retrieving one page of records at a time.
+
+        Args:
+            chunk_size: The number of records to retrieve with each request.
+                Defaults to the API's maximum page size.
+            memoize: |kwarg_orm_memoize|
+        """
+        options = {} if chunk_size is None else {"page_size": chunk_size}
+        _, deferred = self.model._projection(self.fields)
+        for record in self._records(**options):
+            yield self.model._from_projected(record, deferred, memoize)
+
+    def all(self, *, memoize: Optional[bool] = None) -> List[T_Model]:
+        """
+        Retrieve all matching instances.
+
+        Args:
+            memoize: |kwarg_orm_memoize|
+        """
+        return list(self.iterator(memoize=memoize))
+
+    def first(self, *, memoize: Optional[bool] = None) -> Optional[T_Model]:
+        """
+        Retrieve the first matching instance, or ``None`` if there are none.
+
+        Args:
+            memoize: |kwarg_orm_memoize|
+        """
+        return next(self[:1].iterator(memoize=memoize), None)
+
+    def count(self) -> int:
+        """
+        Count the matching records. Airtable has no API for counting records,
+        so this retrieves every matching record, but with as few fields as possible.
+        """
+        return sum(1 for _ in self._records(fields=self._narrowest_fields()))
+
+    def exists(self) -> bool:
+        """
+        Whether there are any matching records. This retrieves at most one record.
+        """
+        query = self[:1]
+        return any(True for _ in query._records(fields=query._narrowest_fields()))
+
+    def _records(self, **options: Any) -> Iterator[RecordDict]:
+        """
+        Retrieve matching records from the API, skipping any before the start of the slice.
+        """
+        if self.stop is not None and self.stop <= self.start:
+            return
+        options = {**self._options(), **options}
+        pages = self.model.meta.table.iterate(**options)
+        yield from islice((r for page in pages for r in page), self.start, None)
+
+    def _narrowest_fields(self) -> List[FieldName]:
+        """
+        Choose a single field to retrieve when only the number of records matters.
+        """
+        fields = self.fields or tuple(self.model._field_name_descriptor_map())
+        return list(fields[:1])
+
+    def _options(self) -> Dict[str, Any]:
+        """
+        Build the keyword arguments for :meth:`Table.iterate <pyairtable.Table.iterate>`.
+        """
+        options: Dict[str, Any] = dict(self.model.meta.request_kwargs)
+        if len(self.conditions) == 1:
+            options["formula"] = self.conditions[0]
+        elif self.conditions:
+            options["formula"] = AND(*self.conditions)
+        if self.sort:
+            options["sort"] = list(self.sort)
+        options["fields"], _ = self.model._projection(self.fields)
+        if self.stop is not None:
+            options["max_records"] = self.stop
+        return options
+
+    def _check(self, name: str) -> str:
+        if name not in self.model._attribute_descriptor_map():
+            raise ValueError(f"{self.model.__name__}.{name} is not a field")
+        return name
+
+    def _field_name(self, name: str) -> FieldName:
+        return self.model._attribute_descriptor_map()[self._check(name)].field_name
+
+    def _replace(self, **changes: Any) -> "QuerySet[T_Model]":
+        return dataclasses.replace(self, **changes)
+
+
+class QuerySetDescriptor:
+    """
+    Provides ``Model.objects``, which returns a new :class:`QuerySet`
+    for all of a model's records.
+    """
+
+    def __get__(self, instance: Any, owner: Type[T_Model]) -> QuerySet[T_Model]:
+        return QuerySet(owner)
+
+
+__all__ = [
+    "QuerySet",
+]
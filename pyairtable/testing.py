@@ -42,9 +42,11 @@ def fake_meta(
     typecast: bool = True,
     use_field_ids: bool = False,
     memoize: bool = False,
+    **kwargs: Any,
 ) -> type:
     """
     Generate a ``Meta`` class for inclusion in a ``Model`` subclass.
+    Any other keyword arguments will be added to the ``Meta`` class as-is.
     """
     attrs = {
         "base_id": base_id or fake_id("app"),
@@ -57,6 +59,7 @@ def fake_meta(
         "retry": retry,
         "use_field_ids": use_field_ids,
         "memoize": memoize,
+        **kwargs,
     }
     return type("Meta", (), attrs)
 
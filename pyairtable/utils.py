@@ -1,6 +1,10 @@
 import inspect
+import itertools
+import json
+import queue
 import re
 import textwrap
+import threading
 from datetime import date, datetime
 from functools import partial, wraps
 from typing import (
@@ -12,6 +16,7 @@ from typing import (
     List,
     Optional,
     Sequence,
+    Tuple,
     TypeVar,
     Union,
     cast,
@@ -109,16 +114,102 @@ def attachment(url: str, filename: str = "") -> CreateAttachmentDict:
     return {"url": url} if not filename else {"url": url, "filename": filename}
 
 
-def chunked(iterable: Sequence[T], chunk_size: int) -> Iterator[Sequence[T]]:
+def chunked(iterable: Iterable[T], chunk_size: int) -> Iterator[Sequence[T]]:
     """
-    Break a sequence into chunks.
+    Break a sequence or iterable into chunks.
+
+    Sequences are sliced. Any other iterable is consumed lazily, so that
+    no more than one chunk needs to be held in memory at a time.
 
     Args:
-        iterable: Any sequence.
+        iterable: Any sequence or iterable.
         chunk_size: Maximum items to yield per chunk.
     """
-    for i in range(0, len(iterable), chunk_size):
-        yield iterable[i : i + chunk_size]
+    if isinstance(iterable, Sequence):
+        for i in range(0, len(iterable), chunk_size):
+            yield iterable[i : i + chunk_size]
+        return
+    iterator = iter(iterable)
+    while chunk := list(itertools.islice(iterator, chunk_size)):
+        yield chunk
+
+
+def prefetch(iterator: Iterator[T], depth: int = 1) -> Iterator[T]:
+    """
+    Consume an iterator on a background thread, staying up to ``depth`` items
+    ahead of the caller. This allows slow work done by the caller (like processing
+    a page of records) to overlap with slow work done by the iterator (like
+    fetching the next page of records).
+
+    Exceptions raised by the iterator are re-raised to the caller in order.
+    If the caller stops iterating early, the background thread will stop
+    after it finishes retrieving whichever item it is currently working on.
+
+    Args:
+        iterator: Any iterator.
+        depth: Maximum number of items to retrieve before the caller asks for them.
+    """
+    if depth < 1:
+        raise ValueError("depth must be at least 1")
+
+    items: "queue.Queue[Tuple[str, Any]]" = queue.Queue()
+    slots = threading.Semaphore(depth)
+    stopped = threading.Event()
+
+    def _produce() -> None:
+        try:
+            while not stopped.is_set():
+                # Wait for the caller to consume an item before fetching another.
+                if not slots.acquire(timeout=0.1):
+                    continue
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    break
+                items.put(("item", item))
+        except BaseException as exc:
+            items.put(("error", exc))
+        else:
+            items.put(("done", None))
+
+    thread = threading.Thread(target=_produce, name="pyairtable-prefetch", daemon=True)
+    thread.start()
+    try:
+        while True:
+            kind, value = items.get()
+            if kind == "done":
+                return
+            if kind == "error":
+                raise value
+            slots.release()
+            yield value
+    finally:
+        stopped.set()
+
+
+def _find_json_loads() -> Callable[[Union[bytes, str]], Any]:
+    try:
+        import orjson
+    except ImportError:
+        return json.loads
+    return orjson.loads
+
+
+_json_loads = _find_json_loads()
+
+
+def json_loads(data: Union[bytes, str]) -> Any:
+    """
+    Decode a JSON document. Uses `orjson <https://github.com/ijl/orjson>`__
+    if it is installed, and falls back to the standard library otherwise.
+
+    Accepts ``bytes`` so that response bodies can be decoded directly,
+    without first being converted to ``str``.
+
+    Raises:
+        ValueError: if the document is not valid JSON.
+    """
+    return _json_loads(data)
 
 
 def is_airtable_id(value: Any, prefix: str = "") -> bool:
@@ -10,6 +10,7 @@ from mock import Mock
 from requests import HTTPError
 
 from pyairtable import Api, Base, Table, Workspace
+from pyairtable.testing import fake_record
 
 
 @pytest.fixture
@@ -126,6 +127,40 @@ def mock_response_iterator(mock_response_list):
     return _response_iterator
 
 
+@pytest.fixture
+def mock_batches(table: Table, requests_mock):
+    """
+    Respond to batch creates, updates, upserts, and deletes on ``table``
+    by echoing back the records in each request. Any request which contains
+    a record with a truthy ``"fail"`` field will be rejected with a 422 error.
+    """
+
+    def _records(request, context):
+        records = [
+            fake_record(record["fields"], id=record.get("id"))
+            for record in request.json()["records"]
+        ]
+        if any(r["fields"].get("fail") for r in records):
+            context.status_code = 422
+            return {"error": {"type": "INVALID_VALUE_FOR_COLUMN"}}
+        return {
+            "records": records,
+            "createdRecords": [r["id"] for r in records],
+            "updatedRecords": [],
+        }
+
+    def _deleted(request, context):
+        return {
+            "records": [{"id": i, "deleted": True} for i in request.qs["records[]"]]
+        }
+
+    return {
+        "POST": requests_mock.post(table.url, json=_records),
+        "PATCH": requests_mock.patch(table.url, json=_records),
+        "DELETE": requests_mock.delete(table.url, json=_deleted),
+    }
+
+
 def http_error():
     raise HTTPError("Not Found")
 
@@ -0,0 +1,251 @@
+import asyncio
+import json
+from unittest import mock
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+import requests
+
+from pyairtable.api.ratelimit import RateLimiter
+from pyairtable.api.retrying import retry_strategy
+from pyairtable.testing import fake_id, fake_record
+
+httpx = pytest.importorskip("httpx")
+
+from pyairtable.api.aio import AsyncApi, AsyncTable  # noqa: E402
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+@pytest.fixture
+def calls():
+    return []
+
+
+@pytest.fixture
+def respond(calls):
+    """
+    Returns a function which configures the responses our mock transport will send.
+    """
+    responses = []
+
+    def _respond(*items):
+        responses.extend(items)
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        status, payload, *headers = responses.pop(0)
+        return httpx.Response(status, json=payload, headers=dict(*headers))
+
+    _respond.handler = _handler
+    return _respond
+
+
+@pytest.fixture
+def async_api(constants, respond):
+    client = httpx.AsyncClient(transport=httpx.MockTransport(respond.handler))
+    return AsyncApi(
+        constants["API_KEY"],
+        client=client,
+        retry_strategy=retry_strategy(backoff_factor=0),
+    )
+
+
+@pytest.fixture
+def async_table(async_api, constants) -> AsyncTable:
+    return async_api.table(constants["BASE_ID"], constants["TABLE_NAME"])
+
+
+def test_url(async_table, table):
+    assert async_table.url == table.url
+    assert async_table.record_url("rec") == table.record_url("rec")
+
+
+def test_get(async_table, respond, calls):
+    record = fake_record()
+    respond((200, record))
+    assert run(async_table.get(record["id"])) == record
+    assert calls[0].method == "GET"
+    assert calls[0].url == async_table.record_url(record["id"])
+    assert calls[0].headers["Authorization"] == "Bearer FakeApiKey"
+
+
+def test_iterate(async_table, respond, calls, mock_response_list):
+    respond(*[(200, page) for page in mock_response_list])
+
+    async def _collect():
+        return [page async for page in async_table.iterate(view="Grid view")]
+
+    pages = run(_collect())
+    assert pages == [page["records"] for page in mock_response_list]
+    assert len(calls) == 2
+    query = parse_qs(urlparse(str(calls[1].url)).query)
+    assert query == {"view": ["Grid view"], "offset": [mock_response_list[0]["offset"]]}
+
+
+def test_all__long_url_fallback(async_api, async_table, respond, calls):
+    """
+    Test that AsyncTable uses the same GET-to-POST conversion as Table.
+    """
+    respond((200, {"records": []}))
+    async_api.sync.MAX_URL_LENGTH = 100
+    assert run(async_table.all(formula="x" * 100)) == []
+    assert calls[0].method == "POST"
+    assert calls[0].url == f"{async_table.url}/listRecords"
+    assert json.loads(calls[0].content) == {"filterByFormula": "x" * 100}
+
+
+def test_first(async_table, respond, calls):
+    record = fake_record()
+    respond((200, {"records": [record]}))
+    assert run(async_table.first()) == record
+    query = parse_qs(urlparse(str(calls[0].url)).query)
+    assert query == {"pageSize": ["1"], "maxRecords": ["1"]}
+
+
+def test_batch_create(async_table, respond, calls):
+    records = [fake_record({"n": n}) for n in range(15)]
+    respond(
+        (200, {"records": records[:10]}),
+        (200, {"records": records[10:]}),
+    )
+    result = run(async_table.batch_create(r["fields"] for r in records))
+    assert result == records
+    assert [len(json.loads(c.content)["records"]) for c in calls] == [10, 5]
+
+
+def test_batch_update(async_table, respond, calls):
+    records = [fake_record({"n": n}) for n in range(3)]
+    respond((200, {"records": records}))
+    assert run(async_table.batch_update(records, replace=True)) == records
+    assert calls[0].method == "PUT"
+
+
+def test_batch_upsert(async_table, respond, calls):
+    record = fake_record({"Name": "Alice"})
+    respond(
+        (
+            200,
+            {
+                "createdRecords": [record["id"]],
+                "updatedRecords": [],
+                "records": [record],
+            },
+        )
+    )
+    result = run(async_table.batch_upsert([{"fields": {"Name": "Alice"}}], ["Name"]))
+    assert result["createdRecords"] == [record["id"]]
+    assert json.loads(calls[0].content)["performUpsert"] == {
+        "fieldsToMergeOn": ["Name"]
+    }
+
+
+def test_batch_upsert__missing_key_field(async_table, calls):
+    with pytest.raises(ValueError):
+        run(async_table.batch_upsert([{"fields": {"Age": 1}}], ["Name"]))
+    assert not calls
+
+
+def test_batch_delete(async_table, respond, calls):
+    ids = [fake_id() for _ in range(12)]
+    respond(
+        (200, {"records": [{"id": i, "deleted": True} for i in ids[:10]]}),
+        (200, {"records": [{"id": i, "deleted": True} for i in ids[10:]]}),
+    )
+    result = run(async_table.batch_delete(ids))
+    assert [r["id"] for r in result] == ids
+    assert all(c.method == "DELETE" for c in calls)
+
+
+def test_concurrent_requests(async_table, respond):
+    """
+    Test that many table operations can be awaited concurrently on one loop.
+    """
+    records = [fake_record() for _ in range(20)]
+    respond(*[(200, record) for record in records])
+
+    async def _gather():
+        return await asyncio.gather(*[async_table.get(r["id"]) for r in records])
+
+    assert len(run(_gather())) == 20
+
+
+def test_retry(async_table, respond, calls):
+    record = fake_record()
+    respond((429, {}), (200, record))
+    assert run(async_table.get(record["id"])) == record
+    assert len(calls) == 2
+
+
+def test_retry__exceeded(async_api, async_table, respond):
+    async_api.retry_strategy = retry_strategy(total=1, backoff_factor=0)
+    respond((429, {}), (429, {}))
+    with pytest.raises(requests.exceptions.RetryError):
+        run(async_table.get("rec"))
+
+
+@pytest.mark.parametrize(
+    "headers,expected",
+    [
+        ({}, 4),
+        ({"Retry-After": "1"}, 1),
+    ],
+)
+def test_retry__sleep_time(async_api, async_table, respond, headers, expected):
+    """
+    Test that we wait exactly as long as the synchronous client would,
+    preferring Retry-After over the strategy's backoff.
+    """
+    async_api.retry_strategy = retry_strategy(backoff_factor=4, jitter=0)
+    respond((429, {}, headers), (200, fake_record()))
+    with mock.patch("asyncio.sleep", new=mock.AsyncMock()) as m:
+        run(async_table.get("rec"))
+    m.assert_called_once_with(expected)
+
+    sync_retry = async_api.retry_strategy.increment("GET", "/")
+    with mock.patch("time.sleep") as m:
+        sync_retry.sleep(mock.Mock(headers=headers))
+    m.assert_called_once_with(expected)
+
+
+def test_json_decoder(constants, respond):
+    record = fake_record()
+    decoder = mock.Mock(return_value=record)
+    client = httpx.AsyncClient(transport=httpx.MockTransport(respond.handler))
+    api = AsyncApi(constants["API_KEY"], client=client, json_decoder=decoder)
+    assert api.json_decoder is decoder
+    respond((200, {}))
+    assert run(api.table("app", "tbl").get(record["id"])) == record
+    decoder.assert_called_once_with(b"{}")
+
+
+def test_http_error(async_table, respond):
+    """
+    Test that errors are surfaced the same way as the synchronous API.
+    """
+    respond((404, {"error": {"type": "NOT_FOUND"}}))
+    with pytest.raises(requests.exceptions.HTTPError) as exc_info:
+        run(async_table.get("rec"))
+    assert exc_info.value.response.status_code == 404
+    assert "NOT_FOUND" in str(exc_info.value)
+
+
+def test_aclose(constants):
+    async def _test():
+        async with AsyncApi(constants["API_KEY"]) as api:
+            client = api.client
+        return client
+
+    assert run(_test()).is_closed
+
+
+def test_rate_limit(async_api, async_table, respond):
+    """
+    Test that AsyncApi shares the synchronous rate limiting configuration.
+    """
+    async_api.sync.rate_limiter = RateLimiter(1000)
+    respond((200, fake_record()))
+    run(async_table.get("rec"))
+    assert async_api.rate_limiter.stats(async_table.base.id).granted == 1
@@ -125,6 +125,23 @@ def test_iterate_requests__invalid_type(api: Api, requests_mock):
     assert responses == [response["json"] for response in response_list]
 
 
+def test_json_decoder(requests_mock):
+    """
+    Test that responses are decoded from bytes using the configured decoder.
+    """
+    decoder = mock.Mock(return_value={"id": "usrX"})
+    api = Api("apikey", json_decoder=decoder)
+    requests_mock.get(api.build_url("meta/whoami"), content=b'{"id": "usrX"}')
+    assert api.whoami() == {"id": "usrX"}
+    decoder.assert_called_once_with(b'{"id": "usrX"}')
+
+
+def test_empty_response(api: Api, requests_mock):
+    url = "https://example.com"
+    requests_mock.get(url, content=b"")
+    assert api.request("GET", url) is None
+
+
 def test_workspace(api):
     assert api.workspace("wspFake").id == "wspFake"
 
@@ -0,0 +1,115 @@
+import json
+
+import pytest
+from requests import HTTPError
+
+from pyairtable.api.journal import Journal
+
+
+def test_journal(tmp_path):
+    path = tmp_path / "journal.jsonl"
+    journal = Journal(path)
+    assert 0 not in journal
+    journal.add(0, [{"n": 1}], ["recA"])
+    assert 0 in journal
+    assert journal.result(0) == ["recA"]
+
+    # a new instance reads what was written, ignoring any truncated lines
+    with open(path, "a") as fp:
+        fp.write('{"chunk": 1, "dig')
+    journal = Journal(path)
+    assert 0 in journal
+    assert 1 not in journal
+    journal.check(0, [{"n": 1}])
+    journal.check(1, [{"n": 2}])
+    with pytest.raises(ValueError):
+        journal.check(0, [{"n": 2}])
+
+
+@pytest.mark.parametrize(
+    "line",
+    [
+        '{"chunk": 1, "digest": "abc"}',
+        '{"chunk": 1, "result": []}',
+        '["chunk", 1]',
+        "null",
+    ],
+)
+def test_journal__invalid_entry(tmp_path, line):
+    """
+    Test that lines which are valid JSON but not valid entries are ignored.
+    """
+    path = tmp_path / "journal.jsonl"
+    Journal(path).add(0, [{"n": 1}], ["recA"])
+    with open(path, "a") as fp:
+        fp.write(line + "\n")
+    journal = Journal(path)
+    assert 0 in journal
+    assert 1 not in journal
+
+
+def test_journal__truncated(tmp_path):
+    """
+    Test that an incomplete last line is removed when the journal is opened,
+    so that the next entry is not appended to it.
+    """
+    path = tmp_path / "journal.jsonl"
+    Journal(path).add(0, [{"n": 1}], ["recA"])
+    complete = path.read_bytes()
+    with open(path, "a") as fp:
+        fp.write('{"chunk": 1, "dig')
+
+    journal = Journal(path)
+    assert path.read_bytes() == complete
+    journal.add(1, [{"n": 2}], ["recB"])
+    journal = Journal(path)
+    assert journal.result(0) == ["recA"]
+    assert journal.result(1) == ["recB"]
+
+
+def test_batch_create__resume(table, mock_batches, tmp_path):
+    """
+    Test that re-running a failed batch operation with resume= skips
+    the chunks which were already sent, and returns all results in order.
+    """
+    path = tmp_path / "journal.jsonl"
+    m = mock_batches["POST"]
+    fields = [{"n": n} for n in range(30)]
+    fields[25]["fail"] = True
+
+    with pytest.raises(HTTPError):
+        table.batch_create(fields, resume=path)
+    assert m.call_count == 3
+    assert [json.loads(line)["chunk"] for line in open(path)] == [0, 1]
+
+    del fields[25]["fail"]
+    result = table.batch_create(fields, resume=path)
+    assert m.call_count == 4
+    assert m.last_request.json()["records"][0] == {"fields": {"n": 20}}
+    assert [r["fields"] for r in result] == fields
+
+    # running it again sends nothing at all
+    assert table.batch_create(fields, resume=path) == result
+    assert m.call_count == 4
+
+
+def test_batch_create__resume__workers(table, mock_batches, tmp_path):
+    path = tmp_path / "journal.jsonl"
+    m = mock_batches["POST"]
+    fields = [{"n": n} for n in range(30)]
+    table.batch_create(fields[:10], resume=path)
+    result = table.batch_create(fields, resume=path, workers=2)
+    assert m.call_count == 3
+    assert [r["fields"] for r in result] == fields
+
+
+def test_batch_create__resume__mismatch(table, mock_batches, tmp_path):
+    """
+    Test that we refuse to resume from a journal written for different input.
+    """
+    path = tmp_path / "journal.jsonl"
+    m = mock_batches["POST"]
+    table.batch_create([{"n": 1}], resume=path)
+    with pytest.raises(ValueError):
+        table.batch_create([{"n": 2}], resume=path)
+    assert m.call_count == 1
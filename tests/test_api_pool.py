@@ -0,0 +1,70 @@
+import socket
+
+from pyairtable import Api
+from pyairtable.api.pool import PoolingAdapter, PoolStats
+from pyairtable.api.retrying import AdaptiveRetry
+
+
+def test_api_defaults():
+    api = Api("apikey")
+    adapter = api.session.get_adapter(api.endpoint_url)
+    assert isinstance(adapter, PoolingAdapter)
+    assert isinstance(adapter.max_retries, AdaptiveRetry)
+    assert api.pool_stats == PoolStats()
+    assert "socket_options" not in adapter.poolmanager.connection_pool_kw
+
+
+def test_api_pool_options():
+    api = Api(
+        "apikey",
+        pool_connections=2,
+        pool_maxsize=50,
+        pool_block=True,
+        tcp_keepalive=True,
+        retry_strategy=None,
+    )
+    adapter = api.session.get_adapter(api.endpoint_url)
+    assert adapter.max_retries.total == 0
+    pool = adapter.poolmanager.connection_from_url(api.endpoint_url)
+    assert pool.pool.maxsize == 50
+    assert pool.block is True
+    options = adapter.poolmanager.connection_pool_kw["socket_options"]
+    assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) in options
+
+
+def test_pool_stats():
+    """
+    Test that checking connections in and out of the pool is recorded.
+    """
+    api = Api("apikey")
+    adapter = api.session.get_adapter(api.endpoint_url)
+    pool = adapter.poolmanager.connection_from_url(api.endpoint_url)
+    conns = [pool._get_conn(), pool._get_conn()]
+    assert api.pool_stats.checked_out == 2
+    for conn in conns:
+        pool._put_conn(conn)
+    pool._put_conn(pool._get_conn())
+    assert api.pool_stats == PoolStats(
+        checked_out=0,
+        peak_checked_out=2,
+        checkouts=3,
+        wait_time=api.pool_stats.wait_time,
+    )
+
+
+def test_shared_session(requests_mock):
+    """
+    Test that instances sharing a session each send their own token.
+    """
+    api1 = Api("token1")
+    api2 = Api("token2", session=api1.session)
+    assert api2.session is api1.session
+    assert api1.session.headers["Authorization"] == "Bearer token1"
+
+    m = requests_mock.get(api1.build_url("meta/whoami"), json={"id": "usrX"})
+    api1.whoami()
+    api2.whoami()
+    assert [r.headers["Authorization"] for r in m.request_history] == [
+        "Bearer token1",
+        "Bearer token2",
+    ]
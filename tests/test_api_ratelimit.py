@@ -0,0 +1,201 @@
+import threading
+from unittest import mock
+
+import pytest
+
+from pyairtable import Api
+from pyairtable.api.ratelimit import RateLimiter, RateLimitStats, base_id_from_url
+from pyairtable.testing import fake_record
+
+
+@pytest.fixture
+def clock():
+    """
+    Replace time.monotonic and time.sleep with a fake clock that only
+    advances when something sleeps.
+    """
+    now = [1000.0]
+
+    def _sleep(seconds):
+        now[0] += seconds
+
+    with mock.patch("pyairtable.api.ratelimit.time") as m:
+        m.monotonic.side_effect = lambda: now[0]
+        m.sleep.side_effect = _sleep
+        yield m
+
+
+@pytest.mark.parametrize(
+    "url,expected",
+    [
+        ("https://api.airtable.com/v0/appLkNDICXNqxSDhG/Contacts", "appLkNDICXNqxSDhG"),
+        ("https://api.airtable.com/v0/appLkNDICXNqxSDhG", "appLkNDICXNqxSDhG"),
+        (
+            "https://api.airtable.com/v0/meta/bases/appLkNDICXNqxSDhG/tables",
+            "appLkNDICXNqxSDhG",
+        ),
+        ("https://api.airtable.com/v0/appLkNDICXNqxSDhG?x=1", "appLkNDICXNqxSDhG"),
+        ("https://api.airtable.com/v0/meta/whoami", None),
+        ("https://api.airtable.com/v0/appleTable/rec", None),
+    ],
+)
+def test_base_id_from_url(url, expected):
+    assert base_id_from_url(url) == expected
+
+
+def test_reserve(clock):
+    """
+    Test that a bucket spaces out requests, and other bases are not affected.
+    """
+    limiter = RateLimiter(5)
+    assert limiter.reserve("app1") == 0
+    assert limiter.reserve("app1") == pytest.approx(0.2)
+    assert limiter.reserve("app1") == pytest.approx(0.4)
+    # other bases are not affected
+    assert limiter.reserve("app2") == 0
+    # after waiting, tokens are replenished
+    clock.sleep(10)
+    assert limiter.reserve("app1") == 0
+
+
+@pytest.mark.parametrize("requests_per_second", [5, 2, 10])
+def test_reserve__window(clock, requests_per_second):
+    """
+    Test that no one-second window ever has more than requests_per_second grants,
+    including when requests start after the limiter has been idle.
+    """
+    limiter = RateLimiter(requests_per_second)
+    granted = []
+    for n in range(40):
+        if n % 15 == 0:
+            clock.sleep(3)  # go idle, so the bucket can refill
+        limiter.acquire("app1")
+        granted.append(clock.monotonic())
+
+    for start in granted:
+        in_window = [t for t in granted if start <= t < start + 1 - 1e-9]
+        assert len(in_window) <= requests_per_second
+
+
+def test_burst(clock):
+    limiter = RateLimiter(5, burst=3)
+    assert [limiter.reserve("app1") for _ in range(3)] == [0] * 3
+    assert limiter.reserve("app1") == pytest.approx(0.2)
+
+
+def test_acquire(clock):
+    limiter = RateLimiter(2, burst=1)
+    assert limiter.acquire("app1") == 0
+    assert limiter.acquire("app1") == pytest.approx(0.5)
+    clock.sleep.assert_called_once_with(pytest.approx(0.5))
+
+
+def test_stats(clock):
+    limiter = RateLimiter(5, burst=1)
+    limiter.acquire("app1")
+    limiter.acquire("app1")
+    limiter.acquire("app2")
+    assert limiter.stats() == RateLimitStats(3, 1, pytest.approx(0.2))
+    assert limiter.stats("app1") == RateLimitStats(2, 1, pytest.approx(0.2))
+    assert limiter.stats("app2") == RateLimitStats(1, 0, 0)
+    assert limiter.stats("app3") == RateLimitStats()
+
+
+def test_invalid_rate():
+    with pytest.raises(ValueError):
+        RateLimiter(0)
+
+
+def test_thread_safety(clock):
+    """
+    Test that concurrent callers never receive the same slot.
+    """
+    limiter = RateLimiter(1000, burst=1)
+    delays = []
+    lock = threading.Lock()
+
+    def _reserve():
+        for _ in range(100):
+            delay = limiter.reserve("app1")
+            with lock:
+                delays.append(delay)
+
+    threads = [threading.Thread(target=_reserve) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert limiter.stats().granted == 400
+    # Every caller after the first should have been given a distinct slot.
+    assert sorted(delays) == [pytest.approx(n / 1000) for n in range(400)]
+
+
+@pytest.mark.parametrize(
+    "kwarg,expected",
+    [
+        (None, None),
+        (False, None),
+        (True, 5.0),
+        (2, 2.0),
+        (RateLimiter(3), 3.0),
+    ],
+)
+def test_api_rate_limit(kwarg, expected):
+    api = Api("apikey", rate_limit=kwarg)
+    if expected is None:
+        assert api.rate_limiter is None
+    else:
+        assert api.rate_limiter.requests_per_second == expected
+
+
+def test_api_request(api, requests_mock, table, clock):
+    """
+    Test that Api.request acquires a token for the base being requested,
+    and that all tables created from the same Api share a limiter.
+    """
+    api.rate_limiter = RateLimiter(5, burst=1)
+    other_table = api.table(table.base.id, "Other Table")
+    record = fake_record()
+    requests_mock.get(table.record_url(record["id"]), json=record)
+    requests_mock.get(other_table.record_url(record["id"]), json=record)
+    requests_mock.get(api.build_url("meta/whoami"), json={"id": "usrX"})
+
+    table.get(record["id"])
+    api.whoami()  # not associated with a base, so does not use a token
+    assert api.rate_limiter.stats() == RateLimitStats(1, 0, 0)
+
+    other_table.get(record["id"])
+    assert api.rate_limiter.stats(table.base.id) == RateLimitStats(
+        2, 1, pytest.approx(0.2)
+    )
+
+
+def test_api_request__workers(api, requests_mock, table, clock):
+    """
+    Test that requests sent concurrently via workers= are rate limited
+    even if the Api has no rate limiter, but other requests are not.
+    """
+    assert api.rate_limiter is None
+    records = [fake_record() for _ in range(30)]
+    requests_mock.post(table.url, json={"records": records[:10]})
+    requests_mock.get(table.record_url(records[0]["id"]), json=records[0])
+
+    table.batch_create([r["fields"] for r in records], workers=3)
+    stats = api._default_rate_limiter.stats(table.base.id)
+    assert stats.granted == 3
+    assert stats.delayed > 0
+
+    table.get(records[0]["id"])
+    assert api._default_rate_limiter.stats().granted == 3
+
+
+def test_api_request__workers__configured(api, requests_mock, table, clock):
+    """
+    Test that workers= uses the Api's own rate limiter if it has one.
+    """
+    api.rate_limiter = RateLimiter(5, burst=1)
+    requests_mock.post(table.url, json={"records": []})
+    table.batch_create([{}] * 30, workers=3)
+    assert api.rate_limiter.stats(table.base.id).granted == 3
+    assert api._default_rate_limiter.stats().granted == 0
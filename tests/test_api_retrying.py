@@ -9,14 +9,16 @@ import threading
 import time
 from collections import deque
 from http import HTTPStatus
+from unittest import mock
 from urllib.parse import urljoin
 from wsgiref.simple_server import WSGIRequestHandler, make_server
 
 import pytest
 import requests
+from urllib3.exceptions import ProtocolError
 
 from pyairtable.api import Api
-from pyairtable.api.retrying import retry_strategy
+from pyairtable.api.retrying import AdaptiveRetry, retry_strategy
 from pyairtable.testing import fake_record
 
 
@@ -255,3 +257,141 @@ def test_retry_during_iterate(table_with_retry_strategy, mock_endpoint):
 
     records = table.all()
     assert len(records) == page_count * per_page
+
+
+def test_retry_server_error__idempotent(
+    table_with_retry_strategy,
+    mock_endpoint,
+    mock_response_single,
+):
+    """
+    Test that the default strategy retries server errors on GET requests.
+    """
+    table = table_with_retry_strategy(retry_strategy(backoff_factor=0))
+    mock_endpoint.canned_responses = [
+        (502, None),
+        (503, None),
+        (200, mock_response_single),
+    ]
+    assert table.get("record") == mock_response_single
+
+
+@pytest.mark.parametrize("replace", [False, True])
+def test_retry_server_error__update(
+    table_with_retry_strategy,
+    mock_endpoint,
+    mock_response_single,
+    replace,
+):
+    """
+    Test that the default strategy retries server errors on updates,
+    whether they are sent with PATCH or PUT.
+    """
+    table = table_with_retry_strategy(retry_strategy(backoff_factor=0))
+    mock_endpoint.canned_responses = [
+        (502, None),
+        (200, mock_response_single),
+    ]
+    assert table.update("record", {}, replace=replace) == mock_response_single
+
+
+def test_retry_server_error__not_idempotent(
+    table_with_retry_strategy,
+    mock_endpoint,
+    mock_response_single,
+):
+    """
+    Test that the default strategy does not repeat a POST after a server error,
+    since we can't know whether the record was created.
+    """
+    table = table_with_retry_strategy(retry_strategy(backoff_factor=0))
+    mock_endpoint.canned_responses = [
+        (500, None),
+        (200, mock_response_single),
+    ]
+    with pytest.raises(requests.exceptions.HTTPError):
+        table.create({})
+
+
+def test_retry_rate_limit__not_idempotent(
+    table_with_retry_strategy,
+    mock_endpoint,
+    mock_response_single,
+):
+    """
+    Test that the default strategy retries a POST which was rate limited.
+    """
+    table = table_with_retry_strategy(retry_strategy(backoff_factor=0))
+    mock_endpoint.canned_responses = [
+        (429, None),
+        (200, mock_response_single),
+    ]
+    assert table.create({}) == mock_response_single
+
+
+def test_adaptive_retry__new():
+    """
+    Test that our extra parameters survive Retry.increment()
+    """
+    retry = retry_strategy(jitter=0.25, always_retry=[418])
+    retry = retry.increment("GET", "/")
+    assert isinstance(retry, AdaptiveRetry)
+    assert retry.jitter == 0.25
+    assert retry.always_retry == {418}
+    assert len(retry.history) == 1
+
+
+@pytest.mark.parametrize(
+    "method,status,expected",
+    [
+        ("GET", 429, True),
+        ("POST", 429, True),
+        ("PATCH", 429, True),
+        ("GET", 500, True),
+        ("DELETE", 503, True),
+        ("POST", 500, False),
+        ("PATCH", 502, True),
+        ("PUT", 500, True),
+        ("GET", 404, False),
+    ],
+)
+def test_adaptive_retry__is_retry(method, status, expected):
+    assert retry_strategy().is_retry(method, status) is expected
+
+
+def test_adaptive_retry__read_error():
+    """
+    Test that dropped connections are only retried for idempotent methods.
+    """
+    retry = retry_strategy()
+    error = ProtocolError("Connection aborted.", ConnectionResetError())
+    assert retry.increment("GET", "/", error=error).total == retry.total - 1
+    with pytest.raises(ProtocolError):
+        retry.increment("POST", "/", error=error)
+
+
+@pytest.mark.parametrize("jitter", [0, 0.5])
+def test_adaptive_retry__backoff(jitter):
+    retry = retry_strategy(backoff_factor=1, jitter=jitter)
+    assert retry.get_backoff_time() == 0
+
+    with mock.patch("random.uniform", side_effect=lambda a, b: b) as m:
+        backoffs = []
+        for _ in range(4):
+            retry = retry.increment("GET", "/")
+            backoffs.append(retry.get_backoff_time())
+
+    assert backoffs == [n * (1 + jitter) for n in (1, 2, 4, 8)]
+    assert m.call_count == (4 if jitter else 0)
+
+
+def test_adaptive_retry__retry_after():
+    """
+    Test that we honor Retry-After and never sleep for less than requested.
+    """
+    retry = retry_strategy(backoff_factor=1, jitter=0.5)
+    response = mock.Mock(headers={"Retry-After": "3"})
+    with mock.patch("random.uniform", side_effect=lambda a, b: b):
+        with mock.patch("time.sleep") as m:
+            retry.sleep(response)
+    m.assert_called_once_with(3.5)
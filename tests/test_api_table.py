@@ -1,12 +1,20 @@
+import json
+import re
+import string
+import time
 from posixpath import join as urljoin
 from unittest import mock
 
 import pytest
-from requests import Request
+from requests import HTTPError, Request
 from requests_mock import Mocker
 
 from pyairtable import Api, Base, Table
-from pyairtable.formulas import AND, EQ, Field
+from pyairtable._compat import pydantic
+from pyairtable.api.params import estimate_url_length
+from pyairtable.api.table import StreamProgress, _record_id_partitions, _sort_key
+from pyairtable.exceptions import BatchError, InvalidParameterError
+from pyairtable.formulas import AND, EQ, Field, Formula, to_formula_str
 from pyairtable.models.schema import TableSchema
 from pyairtable.testing import fake_id, fake_record
 from pyairtable.utils import chunked
@@ -277,6 +285,233 @@ def test_iterate__formula_conversion(table):
     )
 
 
+def test_iterate__prefetch(table: Table, requests_mock, mock_response_iterator):
+    """
+    Test that .iterate(prefetch=1) requests the next page before the caller asks for it.
+    """
+    m = requests_mock.get(table.url, json=mock_response_iterator)
+    pages = table.iterate(prefetch=1)
+    first = next(pages)
+    # Give the background thread a chance to fetch the second page
+    for _ in range(100):
+        if m.call_count == 2:
+            break
+        time.sleep(0.01)
+    assert m.call_count == 2
+    assert len(first) == 2
+    assert len(next(pages)) == 1
+    assert list(pages) == []
+
+
+@pytest.mark.parametrize(
+    "mode,records,expected",
+    [
+        ("full", [{}, fake_record()], False),
+        ("full", [fake_record(), {}], False),
+        ("sample", [{}, fake_record()], False),
+        ("sample", [fake_record(), {}], True),
+        ("off", [{}, {}], True),
+    ],
+)
+def test_iterate__validate_responses(table, requests_mock, mode, records, expected):
+    """
+    Test that Api(validate_responses=...) controls how much of each page is checked.
+    """
+    table.api.validate_responses = mode
+    requests_mock.get(table.url, json={"records": records})
+    try:
+        pages = list(table.iterate())
+    except pydantic.ValidationError:
+        assert not expected
+    else:
+        assert expected
+        assert pages == [records]
+
+
+def test_validate_responses__invalid():
+    with pytest.raises(ValueError):
+        Api("apikey", validate_responses="sometimes")
+
+
+def test_stream(table: Table, requests_mock, mock_response_list, mock_records):
+    """
+    Test that .stream() yields individual records and reports progress per page.
+    """
+    bodies = [json.dumps(page).encode() for page in mock_response_list]
+    m = requests_mock.get(table.url, [{"content": body} for body in bodies])
+    progress = []
+    records = table.stream(progress=progress.append)
+    assert m.call_count == 0  # nothing happens until we start iterating
+
+    assert dict_equals(next(records), mock_records[0])
+    assert len(progress) == 1
+    assert seq_equals(list(records), mock_records[1:])
+    assert m.call_count == len(mock_response_list)
+    assert m.request_history[1].qs["offset"] == [mock_response_list[0]["offset"]]
+    assert progress == [
+        StreamProgress(
+            pages=n,
+            records=sum(len(page["records"]) for page in mock_response_list[:n]),
+            bytes=sum(len(body) for body in bodies[:n]),
+        )
+        for n in range(1, len(mock_response_list) + 1)
+    ]
+
+
+def test_stream__formula_conversion(table: Table):
+    """
+    Test that .stream() will convert a Formula to a str.
+    """
+    with mock.patch("pyairtable.Api._iterate_responses") as m:
+        list(table.stream(formula=EQ(Field("Name"), "Alice")))
+
+    m.assert_called_once_with(
+        method="get",
+        url=table.url,
+        fallback=mock.ANY,
+        options={"formula": "{Name}='Alice'"},
+    )
+
+
+def test_stream__prefetch(table: Table, requests_mock, mock_response_iterator):
+    requests_mock.get(table.url, json=mock_response_iterator)
+    progress = []
+    records = list(table.stream(prefetch=1, progress=progress.append))
+    assert len(records) == 3
+    assert progress[-1] == StreamProgress(pages=2, records=3, bytes=progress[-1].bytes)
+
+
+def test_all__parallel(table: Table, requests_mock):
+    """
+    Test that .all(parallel=N) requests N disjoint partitions of the table
+    and returns the results grouped by partition.
+    """
+    partitions = _record_id_partitions(3)
+    records = [fake_record(id=n) for n in range(6)]
+    responses = {
+        to_formula_str(AND(EQ(Field("Name"), "x"), partition)): records[
+            n * 2 : n * 2 + 2
+        ]
+        for n, partition in enumerate(partitions)
+    }
+
+    def _respond(request, context):
+        return {"records": responses[request.qs["filterByFormula"][0]]}
+
+    requests_mock.get(table.url, json=_respond)
+    # requests_mock lowercases query strings by default
+    requests_mock.case_sensitive = True
+    result = table.all(parallel=3, formula=EQ(Field("Name"), "x"), view="Grid")
+    assert result == records
+    assert requests_mock.call_count == 3
+    for request in requests_mock.request_history:
+        assert request.qs["view"] == ["Grid"]
+
+
+def test_all__parallel__string_formula(table: Table):
+    with mock.patch("pyairtable.Table.iterate", return_value=iter([])) as m:
+        table.all(parallel=2, formula="{Name}='x'")
+    formulas = sorted(str(c.kwargs["formula"]) for c in m.call_args_list)
+    assert formulas == sorted(
+        str(AND(Formula("{Name}='x'"), p)) for p in _record_id_partitions(2)
+    )
+
+
+def test_all__parallel__unsupported(table: Table):
+    with pytest.raises(InvalidParameterError):
+        table.all(parallel=2, max_records=5)
+
+
+def test_all__parallel__sort(table: Table, requests_mock):
+    """
+    Test that .all(parallel=N, sort=...) merges the sorted partitions in order,
+    and that the partitions are rate limited even without Api(rate_limit=...).
+    """
+    partitions = [
+        [
+            fake_record(Name="b", Age=1),
+            fake_record(Name="b", Age=1),
+            fake_record(Name="c", Age=3),
+        ],
+        [fake_record(Age=5), fake_record(Name="a", Age=2), fake_record(Name="b")],
+        [fake_record(Name="b", Age=4), fake_record(Name="d")],
+    ]
+    responses = {
+        to_formula_str(partition): records
+        for partition, records in zip(_record_id_partitions(3), partitions)
+    }
+
+    def _respond(request, context):
+        assert request.qs["sort[0][field]"] == ["Name"]
+        assert request.qs["sort[1][direction]"] == ["desc"]
+        return {"records": responses[request.qs["filterByFormula"][0]]}
+
+    requests_mock.get(table.url, json=_respond)
+    requests_mock.case_sensitive = True
+    result = table.all(parallel=3, sort=["Name", "-Age"])
+    assert [(r["fields"].get("Name"), r["fields"].get("Age")) for r in result] == [
+        (None, 5),
+        ("a", 2),
+        ("b", 4),
+        ("b", 1),
+        ("b", 1),
+        ("b", None),
+        ("c", 3),
+        ("d", None),
+    ]
+    assert table.api._default_rate_limiter.stats(table.base.id).granted == 3
+
+
+def test_sort_key():
+    records = [
+        {"fields": {"Name": "b", "Age": 1}},
+        {"fields": {"Age": 2}},
+        {"fields": {"Name": "a"}},
+        {"fields": {"Name": "b", "Age": 3}},
+    ]
+    assert sorted(records, key=_sort_key(["Name", "-Age"])) == [
+        records[1],
+        records[2],
+        records[3],
+        records[0],
+    ]
+
+
+@pytest.mark.parametrize("count", [1, 2, 5, 62, 100])
+def test_record_id_partitions(count):
+    """
+    Test that every possible record ID suffix lands in exactly one partition.
+    """
+    regexes = [re.compile(p.args[1]) for p in _record_id_partitions(count)]
+    assert len(regexes) == min(count, 62)
+    for char in string.digits + string.ascii_letters:
+        assert sum(1 for r in regexes if r.search(f"rec{char * 14}")) == 1
+
+
+def test_iterate__via_post(table: Table, requests_mock, mock_response_list):
+    """
+    Test that when the URL is too long, every page is requested via POST,
+    and we only need to decide that once.
+    """
+    formula = f"RECORD_ID() != '{'x' * 17000}'"
+    m = requests_mock.post(
+        table.url + "/listRecords",
+        [{"json": page} for page in mock_response_list],
+    )
+    with mock.patch(
+        "pyairtable.api.api.estimate_url_length",
+        side_effect=estimate_url_length,
+    ) as estimate:
+        pages = list(table.iterate(formula=formula))
+
+    assert estimate.call_count == 1
+    assert len(pages) == m.call_count == len(mock_response_list)
+    for n, request in enumerate(m.request_history):
+        assert request.json() == {"filterByFormula": formula}
+        expected = [mock_response_list[n - 1]["offset"]] if n else []
+        assert request.qs.get("offset", []) == expected
+
+
 def test_create(table: Table, mock_response_single):
     with Mocker() as mock:
         post_data = mock_response_single["fields"]
@@ -372,6 +607,78 @@ def test_batch_upsert(table: Table, container, replace, http_method, monkeypatch
     }
 
 
+@pytest.mark.parametrize("workers", [0, 1, 4])
+def test_batch_create__workers(table: Table, mock_batches, workers):
+    """
+    Test that batch_create(workers=N) returns records in their original order.
+    """
+    m = mock_batches["POST"]
+    fields = [{"n": n} for n in range(45)]
+    result = table.batch_create(fields, workers=workers)
+    assert [r["fields"] for r in result] == fields
+    assert m.call_count == 5
+
+
+@pytest.mark.parametrize("workers", [0, 4])
+def test_batch_update__workers(table: Table, mock_batches, workers):
+    m = mock_batches["PATCH"]
+    records = [fake_record(n=n) for n in range(25)]
+    result = table.batch_update(records, workers=workers)
+    assert [r["id"] for r in result] == [r["id"] for r in records]
+    assert m.call_count == 3
+
+
+def test_batch_upsert__workers(table: Table, mock_batches):
+    records = [{"fields": {"Name": str(n)}} for n in range(25)]
+    result = table.batch_upsert(records, key_fields=["Name"], workers=3)
+    assert [r["fields"] for r in result["records"]] == [r["fields"] for r in records]
+    assert result["createdRecords"] == [r["id"] for r in result["records"]]
+
+
+def test_batch_delete__workers(table: Table, mock_batches):
+    m = mock_batches["DELETE"]
+    # requests_mock lowercases query strings by default
+    record_ids = [fake_id().lower() for _ in range(25)]
+    result = table.batch_delete(record_ids, workers=2)
+    assert [r["id"] for r in result] == record_ids
+    assert m.call_count == 3
+
+
+def test_batch_create__workers__partial_failure(table: Table, mock_batches):
+    """
+    Test that with workers=N, every chunk is attempted, and failures
+    are reported together instead of stopping at the first one.
+    """
+    m = mock_batches["POST"]
+    fields = [{"n": n} for n in range(30)]
+    fields[5]["fail"] = fields[25]["fail"] = True
+
+    with pytest.raises(BatchError) as exc_info:
+        table.batch_create(fields, workers=2)
+
+    assert m.call_count == 3
+    exc = exc_info.value
+    assert str(exc) == "2 of 3 batches failed"
+    assert sorted(exc.errors) == [0, 2]
+    assert all(isinstance(e, HTTPError) for e in exc.errors.values())
+    assert isinstance(exc.__cause__, HTTPError)
+    assert [r["fields"] for r in exc.results[1]] == fields[10:20]
+    assert exc.succeeded == fields[10:20]
+    assert exc.failed == fields[:10] + fields[20:]
+
+
+def test_batch_create__no_workers__failure(table: Table, mock_batches):
+    """
+    Test that without workers=N, we stop at the first failure.
+    """
+    m = mock_batches["POST"]
+    fields = [{"n": n} for n in range(30)]
+    fields[5]["fail"] = True
+    with pytest.raises(HTTPError):
+        table.batch_create(fields)
+    assert m.call_count == 1
+
+
 def test_batch_upsert__missing_field(table: Table, requests_mock):
     """
     Test that batch_upsert raises an exception if a record in the input
@@ -382,6 +689,166 @@ def test_batch_upsert__missing_field(table: Table, requests_mock):
         table.batch_upsert([{"fields": {"Name": "Alice"}}], key_fields=["Email"])
 
 
+def test_iter_batch_create(table: Table, mock_batches):
+    """
+    Test that iter_batch_create consumes its input one batch at a time
+    and yields the records created by each request.
+    """
+    m = mock_batches["POST"]
+    consumed = []
+
+    def _fields():
+        for n in range(25):
+            consumed.append(n)
+            yield {"n": n}
+
+    results = table.iter_batch_create(_fields())
+    assert m.call_count == 0
+    assert [r["fields"] for r in next(results)] == [{"n": n} for n in range(10)]
+    assert m.call_count == 1
+    assert consumed == list(range(10))
+    assert [len(created) for created in results] == [10, 5]
+    assert m.call_count == 3
+
+
+def test_iter_batch_upsert(table: Table, mock_batches):
+    m = mock_batches["PATCH"]
+    records = ({"fields": {"Name": str(n)}} for n in range(15))
+    results = list(table.iter_batch_upsert(records, key_fields=["Name"]))
+    assert [len(result["records"]) for result in results] == [10, 5]
+    assert results[1]["createdRecords"] == [r["id"] for r in results[1]["records"]]
+    assert m.call_count == 2
+    assert m.last_request.json()["performUpsert"] == {"fieldsToMergeOn": ["Name"]}
+
+
+def test_iter_batch_upsert__missing_field(table: Table, mock_batches):
+    """
+    Test that iter_batch_upsert validates each batch before sending it,
+    which means earlier batches will already have been sent.
+    """
+    m = mock_batches["PATCH"]
+    records = [{"fields": {"Name": str(n)}} for n in range(15)]
+    del records[12]["fields"]["Name"]
+    results = table.iter_batch_upsert(records, key_fields=["Name"])
+    next(results)
+    with pytest.raises(ValueError):
+        next(results)
+    assert m.call_count == 1
+
+
+@pytest.fixture
+def mock_sync(table: Table, requests_mock, mock_batches):
+    """
+    Set up a table with three existing records, keyed on "Email".
+    """
+    existing = [
+        fake_record(Email="alice@example.com", Name="Alice", Age=30),
+        fake_record(Email="bob@example.com", Name="Bob"),
+        fake_record(Email="carol@example.com", Name="Carol"),
+    ]
+    return {
+        "existing": existing,
+        "GET": requests_mock.get(table.url, json={"records": existing}),
+        **mock_batches,
+    }
+
+
+SYNC_RECORDS = [
+    {"Email": "alice@example.com", "Name": "Alice", "Age": 31},
+    {"Email": "bob@example.com", "Name": "Bob", "Notes": ""},
+    {"Email": "dave@example.com", "Name": "Dave"},
+]
+
+
+def test_sync(table: Table, mock_sync):
+    """
+    Test that sync() only sends records which have changed, and only
+    the fields which have changed.
+    """
+    alice, bob, carol = mock_sync["existing"]
+    result = table.sync(SYNC_RECORDS, key_fields=["Email"], delete_missing=True)
+    assert mock_sync["GET"].last_request.qs["fields[]"] == [
+        "Age",
+        "Email",
+        "Name",
+        "Notes",
+    ]
+    assert result.created == [SYNC_RECORDS[2]]
+    assert result.updated == [{"id": alice["id"], "fields": {"Age": 31}}]
+    assert result.deleted == [carol["id"]]
+    assert result.unchanged == 1
+    assert [r["fields"] for r in result.records] == [SYNC_RECORDS[2], {"Age": 31}]
+    assert mock_sync["POST"].last_request.json()["records"] == [
+        {"fields": SYNC_RECORDS[2]}
+    ]
+    assert mock_sync["PATCH"].last_request.json()["records"] == [
+        {"id": alice["id"], "fields": {"Age": 31}}
+    ]
+    assert mock_sync["DELETE"].last_request.qs["records[]"] == [carol["id"]]
+
+
+def test_sync__dry_run(table: Table, mock_sync):
+    result = table.sync(SYNC_RECORDS, key_fields=["Email"], dry_run=True)
+    assert result.dry_run
+    assert len(result.created) == len(result.updated) == 1
+    assert result.deleted == []
+    assert result.records == []
+    assert mock_sync["GET"].call_count == 1
+    assert mock_sync["POST"].call_count == 0
+    assert mock_sync["PATCH"].call_count == 0
+    assert mock_sync["DELETE"].call_count == 0
+
+
+def test_sync__options(table: Table, mock_sync):
+    """
+    Test that extra options are used when fetching existing records.
+    """
+    table.sync([], key_fields=["Email"], view="Active", dry_run=True)
+    assert mock_sync["GET"].last_request.qs["view"] == ["Active"]
+    assert mock_sync["GET"].last_request.qs["fields[]"] == ["Email"]
+    table.sync([], key_fields=["Email"], fields=["Name", "Email"], dry_run=True)
+    assert mock_sync["GET"].last_request.qs["fields[]"] == ["Email", "Name"]
+
+
+@pytest.mark.parametrize(
+    "records",
+    [
+        [{"Name": "Alice"}],
+        [{"Email": "dave@example.com"}, {"Email": "dave@example.com"}],
+        [{"Email": "", "Name": "Nobody"}],
+    ],
+)
+def test_sync__invalid_input(table: Table, mock_sync, records):
+    with pytest.raises(ValueError):
+        table.sync(records, key_fields=["Email"])
+    assert mock_sync["POST"].call_count == 0
+
+
+def test_sync__duplicate_existing(table: Table, requests_mock):
+    records = [fake_record(Email="a@example.com"), fake_record(Email="a@example.com")]
+    requests_mock.get(table.url, json={"records": records})
+    with pytest.raises(ValueError):
+        table.sync([{"Email": "a@example.com"}], key_fields=["Email"])
+
+
+def test_sync__blank_existing(table: Table, requests_mock):
+    """
+    Test that existing records with no value for key_fields (like the blank rows
+    in a new table) are ignored, rather than treated as duplicates or deleted.
+    """
+    keyed = fake_record(Email="a@example.com")
+    records = [fake_record(), fake_record(Name="No email"), keyed]
+    requests_mock.get(table.url, json={"records": records})
+    result = table.sync(
+        [{"Email": "a@example.com"}],
+        key_fields=["Email"],
+        delete_missing=True,
+        dry_run=True,
+    )
+    assert result.unchanged == 1
+    assert result.created == result.updated == result.deleted == []
+
+
 def test_delete(table: Table, mock_response_single):
     id_ = mock_response_single["id"]
     expected = {"deleted": True, "id": id_}
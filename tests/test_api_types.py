@@ -1,3 +1,5 @@
+from unittest import mock
+
 import pytest
 
 from pyairtable._compat import pydantic
@@ -47,6 +49,7 @@ def test_assert_typed_dict(cls, value):
         (T.RecordDeletedDict, {}),
         (T.RecordDict, {}),
         (T.UpdateRecordDict, {}),
+        (T.UpsertResultDict, {}),
     ],
 )
 def test_assert_not_typed_dict(cls, value):
@@ -71,6 +74,67 @@ def test_assert_typed_dict__wrong_type():
         T.assert_typed_dicts(T.RecordDict, object())
 
 
+@pytest.mark.parametrize(
+    "cls,value",
+    [
+        (T.RecordDict, fake_record()),
+        (T.RecordDeletedDict, {"id": fake_id(), "deleted": True}),
+        (
+            T.UpsertResultDict,
+            {
+                "createdRecords": [fake_id()],
+                "updatedRecords": [],
+                "records": [fake_record()],
+            },
+        ),
+    ],
+)
+def test_assert_typed_dict__structural_check(cls, value):
+    """
+    Test that common response types are validated without building a pydantic model.
+    """
+    with mock.patch("pyairtable.api.types._create_model_from_typeddict") as m:
+        assert T.assert_typed_dict(cls, value) is value
+    m.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        {**fake_record(), "id": 1},  # pydantic will coerce this to str
+        {**fake_record(), "fields": []},
+        {"id": fake_id()},
+    ],
+)
+def test_assert_typed_dict__structural_check_fallback(value):
+    """
+    Test that objects which fail the structural check get the same
+    result from pydantic as they did before the structural check existed.
+    """
+    model = T._create_model_from_typeddict(T.RecordDict)
+    try:
+        model(**value)
+    except pydantic.ValidationError:
+        with pytest.raises(pydantic.ValidationError):
+            T.assert_typed_dict(T.RecordDict, value)
+    else:
+        T.assert_typed_dict(T.RecordDict, value)
+
+
+def test_assert_typed_dicts__mode():
+    records = [fake_record(), {}, {}]
+    with pytest.raises(pydantic.ValidationError):
+        T.assert_typed_dicts(T.RecordDict, records, mode="full")
+    assert T.assert_typed_dicts(T.RecordDict, records, mode="sample") is records
+    assert T.assert_typed_dicts(T.RecordDict, records[::-1], mode="off")
+    with pytest.raises(pydantic.ValidationError):
+        T.assert_typed_dicts(T.RecordDict, records[::-1], mode="sample")
+    # we always check that we got a list
+    with pytest.raises(TypeError):
+        T.assert_typed_dicts(T.RecordDict, -1, mode="off")
+    assert T.assert_typed_dict(T.RecordDict, -1, mode="off") == -1
+
+
 @pytest.mark.parametrize(
     "value,is_error",
     [
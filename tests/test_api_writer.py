@@ -0,0 +1,113 @@
+import pytest
+from requests import HTTPError
+
+from pyairtable.testing import fake_id
+
+
+def test_buffered_writer(table, mock_batches):
+    """
+    Test that changes are held until the writer is closed, then sent in batches.
+    """
+    record_ids = [fake_id() for _ in range(3)]
+    with table.buffered_writer(flush_interval=60) as writer:
+        created = [writer.create({"n": n}) for n in range(15)]
+        updated = writer.update(record_ids[0], {"a": 1})
+        deleted = [writer.delete(record_id) for record_id in record_ids[1:]]
+
+    assert [f.result()["fields"] for f in created] == [{"n": n} for n in range(15)]
+    assert updated.result()["id"] == record_ids[0]
+    assert [f.result() for f in deleted] == [
+        {"id": record_id, "deleted": True} for record_id in record_ids[1:]
+    ]
+    assert mock_batches["POST"].call_count == 2
+    assert mock_batches["PATCH"].call_count == 1
+    assert mock_batches["DELETE"].call_count == 1
+
+
+def test_buffered_writer__full_batch(table, mock_batches):
+    """
+    Test that a full batch is sent without waiting for flush_interval.
+    """
+    with table.buffered_writer(flush_interval=60, max_batch=2) as writer:
+        futures = [writer.create({"n": n}) for n in range(2)]
+        assert futures[1].result(timeout=5)["fields"] == {"n": 1}
+        assert mock_batches["POST"].call_count == 1
+
+
+def test_buffered_writer__flush_interval(table, mock_batches):
+    with table.buffered_writer(flush_interval=0.01) as writer:
+        future = writer.create({"n": 1})
+        assert future.result(timeout=5)["fields"] == {"n": 1}
+
+
+def test_buffered_writer__merge_updates(table, mock_batches):
+    """
+    Test that successive updates to the same record are sent as one.
+    """
+    record_id = fake_id()
+    with table.buffered_writer(flush_interval=60) as writer:
+        first = writer.update(record_id, {"a": 1, "b": 1})
+        second = writer.update(record_id, {"b": 2})
+        writer.delete(record_id)
+        writer.delete(record_id)
+
+    assert mock_batches["PATCH"].call_count == 1
+    assert mock_batches["PATCH"].last_request.json()["records"] == [
+        {"id": record_id, "fields": {"a": 1, "b": 2}}
+    ]
+    assert first.result() == second.result()
+    assert mock_batches["DELETE"].last_request.qs["records[]"] == [record_id]
+
+
+def test_buffered_writer__failure(table, mock_batches):
+    """
+    Test that a failed request is reported to each future in that batch,
+    without affecting other batches.
+    """
+    with table.buffered_writer(flush_interval=60, max_batch=2) as writer:
+        writer.flush()  # nothing happens
+        futures = [writer.create({"n": n, "fail": n == 3}) for n in range(4)]
+
+    assert [f.result()["fields"]["n"] for f in futures[:2]] == [0, 1]
+    for future in futures[2:]:
+        with pytest.raises(HTTPError):
+            future.result()
+
+
+def test_buffered_writer__cancel(table, mock_batches):
+    with table.buffered_writer(flush_interval=60) as writer:
+        cancelled = writer.create({"n": 1})
+        assert cancelled.cancel()
+        writer.create({"n": 2})
+
+    assert mock_batches["POST"].last_request.json()["records"] == [{"fields": {"n": 2}}]
+
+
+def test_buffered_writer__closed(table, mock_batches):
+    writer = table.buffered_writer()
+    writer.close()
+    with pytest.raises(RuntimeError):
+        writer.create({})
+
+
+@pytest.mark.parametrize("max_batch", [-1, 0, 11])
+def test_buffered_writer__invalid_max_batch(table, max_batch):
+    with pytest.raises(ValueError):
+        table.buffered_writer(max_batch=max_batch)
+
+
+def test_buffered_writer__order(table, mock_batches, requests_mock):
+    """
+    Test that each flush sends creates, then updates, then deletes,
+    regardless of the order in which they were queued.
+    """
+    record_id = fake_id()
+    with table.buffered_writer(flush_interval=60) as writer:
+        writer.delete(record_id)
+        writer.update(record_id, {"a": 1})
+        writer.create({"n": 1})
+    assert [r.method for r in requests_mock.request_history] == [
+        "POST",
+        "PATCH",
+        "DELETE",
+    ]
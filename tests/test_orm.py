@@ -209,7 +209,7 @@ def test_linked_record_can_be_saved(requests_mock, access_linked_records):
     if access_linked_records:
         assert contact.address[0].id == address_id
 
-    contact.save()
+    contact.save(force=True)
     assert mock_save.last_request.json() == {
         "fields": {
             "Email": "alice@example.com",
@@ -288,6 +288,7 @@ def test_batch_save(mock_update, mock_create):
             "fields": {"Number": 789, "Street": "Fake St"},
         }
     )
+    addr3.street = "Real St"
 
     mock_create.return_value = [
         fake_record(id="abc", Number=123, Street="Fake St"),
@@ -311,7 +312,7 @@ def test_batch_save(mock_update, mock_create):
         [
             {
                 "id": "recExistingRecord",
-                "fields": {"Number": 789, "Street": "Fake St"},
+                "fields": {"Street": "Real St"},
             },
         ],
         typecast=True,
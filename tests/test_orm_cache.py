@@ -0,0 +1,187 @@
+from unittest import mock
+
+import pytest
+
+from pyairtable.orm import Model
+from pyairtable.orm import fields as f
+from pyairtable.orm.cache import CacheStats, IdentityMap
+from pyairtable.testing import fake_meta, fake_record
+
+
+@pytest.fixture
+def clock():
+    with mock.patch("time.monotonic", return_value=1000.0) as m:
+        yield m
+
+
+def test_identity_map():
+    cache = IdentityMap()
+    cache["rec1"] = obj = object()
+    assert cache["rec1"] is obj
+    assert "rec1" in cache
+    with pytest.raises(KeyError):
+        cache["rec2"]
+    assert "rec2" not in cache
+    assert cache.get("rec2") is None
+    assert list(cache) == ["rec1"]
+    assert cache.stats == CacheStats(hits=1, misses=2)
+
+
+def test_identity_map__max_size():
+    """
+    Test that the least recently used instance is discarded first.
+    """
+    cache = IdentityMap(max_size=2)
+    cache["rec1"] = 1
+    cache["rec2"] = 2
+    assert cache["rec1"] == 1
+    cache["rec3"] = 3
+    assert list(cache) == ["rec1", "rec3"]
+    assert cache.stats.evictions == 1
+
+
+def test_identity_map__ttl(clock):
+    cache = IdentityMap(ttl=60)
+    cache["rec1"] = 1
+    clock.return_value += 30
+    cache["rec2"] = 2
+    assert cache["rec1"] == 1
+    clock.return_value += 30
+    assert "rec1" not in cache
+    assert len(cache) == 1
+    clock.return_value += 30
+    with pytest.raises(KeyError):
+        cache["rec2"]
+    assert cache.stats == CacheStats(hits=1, misses=1, expirations=2)
+
+
+def test_identity_map__bool(clock):
+    """
+    Test that checking whether the map is empty does not expire every entry.
+    """
+    cache = IdentityMap(ttl=60)
+    assert not cache
+    cache["rec1"] = 1
+    assert cache
+    clock.return_value += 60
+    with mock.patch.object(cache, "_expire") as m:
+        assert cache
+    m.assert_not_called()
+    assert cache.stats.expirations == 0
+
+
+def test_model_from_ids__empty_identity_map(requests_mock):
+    """
+    Test that from_ids() does not count lookups in an empty identity map as misses.
+    """
+
+    class Contact(Model):
+        Meta = fake_meta()
+        name = f.TextField("Name")
+
+    record = fake_record(Name="Alice")
+    requests_mock.get(Contact.meta.table.url, json={"records": [record]})
+    with mock.patch.object(IdentityMap, "__len__") as m:
+        assert Contact.from_ids([record["id"]])[0].name == "Alice"
+    m.assert_not_called()
+    assert Contact.meta.identity_map.stats == CacheStats()
+
+
+def test_identity_map__ttl__same_instance(clock):
+    """
+    Test that storing the same instance again does not extend its lifetime,
+    but storing a new instance does.
+    """
+    cache = IdentityMap(ttl=60)
+    cache["rec1"] = obj = object()
+    clock.return_value += 45
+    cache["rec1"] = obj
+    clock.return_value += 30
+    assert "rec1" not in cache
+
+    cache["rec1"] = obj
+    clock.return_value += 45
+    cache["rec1"] = other = object()
+    clock.return_value += 30
+    assert cache["rec1"] is other
+
+
+def test_model_from_id__ttl(clock, requests_mock):
+    """
+    Test that a memoized instance expires on schedule,
+    no matter how often it is read with from_id().
+    """
+
+    class M(Model):
+        Meta = fake_meta(memoize=True, memoize_ttl=60)
+        name = f.TextField("Name")
+
+    record = fake_record(Name="Alice")
+    m = requests_mock.get(M.meta.table.record_url(record["id"]), json=record)
+    obj = M.from_id(record["id"])
+    for _ in range(8):
+        clock.return_value += 10
+        M.from_id(record["id"])
+    assert m.call_count == 2
+    assert M.from_id(record["id"]) is not obj
+    assert M.meta.identity_map.stats.expirations == 1
+
+
+def test_identity_map__invalidate():
+    cache = IdentityMap()
+    cache.update({"rec1": 1, "rec2": 2, "rec3": 3})
+    cache.invalidate("rec1", "rec2", "rec4")
+    assert list(cache) == ["rec3"]
+    cache.clear()
+    assert not cache
+
+
+def test_identity_map__invalid_max_size():
+    with pytest.raises(ValueError):
+        IdentityMap(max_size=0)
+
+
+def test_model_meta():
+    """
+    Test that models build their identity map from Meta.
+    """
+
+    class Bounded(Model):
+        Meta = fake_meta(memoize=True, memoize_max_size=2, memoize_ttl=5)
+        name = f.TextField("Name")
+
+    identity_map = IdentityMap()
+
+    class Custom(Model):
+        Meta = fake_meta(identity_map=identity_map)
+
+    assert Bounded.meta.identity_map.max_size == 2
+    assert Bounded.meta.identity_map.ttl == 5
+    assert Custom.meta.identity_map is identity_map
+
+    objs = [Bounded.from_record(fake_record()) for _ in range(3)]
+    assert list(Bounded.meta.identity_map) == [obj.id for obj in objs[1:]]
+    assert Bounded.from_id(objs[2].id) is objs[2]
+    assert Bounded.meta.identity_map.stats.hits == 1
+
+
+def test_model_delete__invalidates():
+    class M(Model):
+        Meta = fake_meta(memoize=True)
+
+    obj = M.from_record(fake_record())
+    with mock.patch("pyairtable.Table.delete", return_value={"deleted": True}):
+        obj.delete()
+    assert obj.id not in M.meta.identity_map
+
+    objs = [M.from_record(fake_record()) for _ in range(2)]
+    with mock.patch("pyairtable.Table.batch_delete"):
+        M.batch_delete(objs)
+    assert not M.meta.identity_map
+
+
+def test_model_meta__invalid_identity_map():
+    with pytest.raises(TypeError):
+
+        class M(Model):
+            Meta = fake_meta(identity_map={})
@@ -823,15 +823,24 @@ def test_single_link_field__multiple_values():
     book = Book.from_record(fake_record(Author=[a1, a2, a3]))
     with mock.patch("pyairtable.Table.all", return_value=records) as m:
         book.author
-        m.assert_called_once_with(formula=OR(RECORD_ID().eq(records[0]["id"])))
+        m.assert_called_once_with(
+            formula=OR(RECORD_ID().eq(records[0]["id"])),
+            fields=["Name"],
+            **Author.meta.request_kwargs,
+        )
 
     assert book.author.id == a1
     assert book.author.name == "Author 1"
     assert book._fields["Author"][1:] == [a2, a3]  # not converted to models
 
-    # if book.author.__set__ not called, the entire list will be sent back to the API
+    # if book.author.__set__ not called, the field is unchanged and not sent...
     with mock.patch("pyairtable.Table.update", return_value=book.to_record()) as m:
         book.save()
+        m.assert_not_called()
+
+    # ...unless we force it, in which case the entire list will be sent back to the API
+    with mock.patch("pyairtable.Table.update", return_value=book.to_record()) as m:
+        book.save(force=True)
         m.assert_called_once_with(book.id, {"Author": [a1, a2, a3]}, typecast=True)
 
     # if we modify the field value, it will drop items 2-N
@@ -972,7 +981,7 @@ def test_datetime_timezones(requests_mock):
     # Test that we parse the "Z" into UTC correctly
     assert obj.dt.date() == datetime.date(2024, 2, 29)
     assert obj.dt.tzinfo is datetime.timezone.utc
-    obj.save()
+    obj.save(force=True)
     assert m.last_request.json()["fields"]["dt"] == "2024-02-29T12:34:56.000Z"
 
     # Test that we can set a UTC timezone and it will be saved as-is.
@@ -1016,5 +1025,5 @@ def test_select_field(fields, expected):
     assert obj.the_field == expected
 
     with mock.patch("pyairtable.Table.update", return_value=obj.to_record()) as m:
-        obj.save()
+        obj.save(force=True)
         m.assert_called_once_with(obj.id, fields, typecast=True)
@@ -1,11 +1,20 @@
+import datetime
+import re
+import threading
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
 from functools import partial
 from unittest import mock
 
 import pytest
+import requests
 from requests_mock import Mocker
 
+from pyairtable.exceptions import BatchError
 from pyairtable.orm import Model
 from pyairtable.orm import fields as f
+from pyairtable.orm.model import _MISSING, _record_id_formulas
 from pyairtable.testing import fake_id, fake_meta, fake_record
 
 
@@ -224,7 +233,9 @@ def test_from_ids(mock_api):
         options={
             "formula": (
                 "OR(%s)" % ", ".join(f"RECORD_ID()='{id}'" for id in sorted(fake_ids))
-            )
+            ),
+            "fields": ["one", "two"],
+            **FakeModel.meta.request_kwargs,
         },
     )
     assert len(contacts) == len(fake_records)
@@ -239,6 +250,65 @@ def test_from_ids__invalid_id(mock_all):
     mock_all.assert_called_once()
 
 
+def test_record_id_formulas():
+    record_ids = [fake_id() for _ in range(5)]
+    formulas = _record_id_formulas(record_ids, max_length=70)
+    assert [str(formula) for formula in formulas] == [
+        f"OR(RECORD_ID()='{record_ids[0]}', RECORD_ID()='{record_ids[1]}')",
+        f"OR(RECORD_ID()='{record_ids[2]}', RECORD_ID()='{record_ids[3]}')",
+        f"OR(RECORD_ID()='{record_ids[4]}')",
+    ]
+
+
+@pytest.mark.parametrize("workers", [0, 4])
+def test_from_ids__many(requests_mock, workers):
+    """
+    Test that from_ids() splits a large number of IDs into several
+    queries and returns the instances in the order requested.
+    """
+    records = {(r := fake_record())["id"]: r for _ in range(600)}
+
+    def _list_records(request, context):
+        formula = request.qs["filterByFormula"][0]
+        return {"records": [records[i] for i in re.findall(r"rec\w{14}", formula)]}
+
+    m = requests_mock.get(FakeModel.meta.table.url, json=_list_records)
+    record_ids = list(records)[::-1]
+    limiter = FakeModel.meta.api._default_rate_limiter
+    granted = limiter.stats().granted
+    instances = FakeModel.from_ids(record_ids, workers=workers)
+    assert [instance.id for instance in instances] == record_ids
+    assert m.call_count == 3
+    assert all(len(r.qs["filterByFormula"][0]) <= 8000 for r in m.request_history)
+    # concurrent queries are rate limited by default
+    assert limiter.stats().granted - granted == (3 if workers else 0)
+
+
+def test_from_ids__individually(requests_mock):
+    """
+    Test that from_ids() retrieves records individually if there are few enough
+    to send all at once, and still raises KeyError if any are missing.
+    """
+    records = [fake_record() for _ in range(3)]
+    mocks = [
+        requests_mock.get(FakeModel.meta.table.record_url(record["id"]), json=record)
+        for record in records
+    ]
+    missing_id = fake_id()
+    requests_mock.get(
+        FakeModel.meta.table.record_url(missing_id),
+        status_code=404,
+        json={"error": "NOT_FOUND"},
+    )
+    record_ids = [r["id"] for r in records]
+    assert [m.id for m in FakeModel.from_ids(record_ids, workers=3)] == record_ids
+    assert all(m.call_count == 1 for m in mocks)
+
+    with pytest.raises(KeyError):
+        FakeModel.from_ids([*record_ids[:2], missing_id], workers=3)
+    assert [m.call_count for m in mocks] == [2, 2, 1]
+
+
 @mock.patch("pyairtable.Table.all")
 def test_from_ids__no_fetch(mock_all):
     fake_ids = [fake_id() for _ in range(10)]
@@ -272,7 +342,437 @@ def test_passthrough(methodname, returns):
         user_locale=None,
         time_zone=None,
         cell_format="json",
+        fields=["one", "two"],
+    )
+
+
+def test_stream():
+    """
+    Test that .stream() passes through request kwargs and yields model instances.
+    """
+    records = [fake_record(), fake_record()]
+    with mock.patch("pyairtable.Table.stream", return_value=iter(records)) as m:
+        results = FakeModel.stream(a=1)
+        m.assert_not_called()
+        results = list(results)
+
+    m.assert_called_once_with(
+        a=1,
+        use_field_ids=getattr(FakeModel.Meta, "use_field_ids", False),
+        user_locale=None,
+        time_zone=None,
+        cell_format="json",
+        fields=["one", "two"],
+    )
+    assert [r.id for r in results] == [r["id"] for r in records]
+    assert all(isinstance(r, FakeModel) for r in results)
+
+
+class ProjectedModel(Model):
+    Meta = fake_meta()
+    name = f.TextField("Name")
+    when = f.DatetimeField("When")
+    tags = f.MultipleSelectField("Tags")
+
+
+@pytest.mark.parametrize("methodname", ["all", "from_ids"])
+def test_deferred_fields(requests_mock, methodname):
+    """
+    Test that fields which were not requested are retrieved the first time
+    any of them is accessed, without overwriting values set in the meantime.
+    """
+    record = fake_record(Name="Alice", When="2024-02-29T12:34:56.000Z", Tags=["a"])
+    m_list = requests_mock.get(
+        ProjectedModel.meta.table.url,
+        json={"records": [{**record, "fields": {"Name": "Alice"}}]},
+    )
+    m_get = requests_mock.get(
+        ProjectedModel.meta.table.record_url(record["id"]), json=record
+    )
+
+    if methodname == "all":
+        obj = ProjectedModel.all(fields=["Name"])[0]
+    else:
+        obj = ProjectedModel.from_ids([record["id"]], fields=["Name"])[0]
+    assert m_list.last_request.qs["fields[]"] == ["Name"]
+    assert obj.name == "Alice"
+    assert obj._deferred == {"When", "Tags"}
+    assert obj.to_record()["fields"] == {"Name": "Alice"}
+    assert m_get.call_count == 0
+
+    obj.tags = ["b"]
+    assert obj.when.year == 2024
+    assert obj.tags == ["b"]
+    assert m_get.call_count == 1
+    assert not obj._deferred
+    assert obj.dirty_fields() == {"tags"}
+
+
+def test_deferred_fields__default(requests_mock):
+    """
+    Test that only the fields defined by the model are requested by default.
+    """
+    m = requests_mock.get(ProjectedModel.meta.table.url, json={"records": []})
+    ProjectedModel.all()
+    assert m.last_request.qs["fields[]"] == ["Name", "When", "Tags"]
+
+
+@pytest.mark.parametrize("methodname", ["all", "from_ids"])
+def test_deferred_fields__use_field_ids(requests_mock, methodname):
+    """
+    Test that models which use field IDs request them when retrieving
+    records by ID and when retrieving deferred fields.
+    """
+    record = fake_record(fld1VnoyuotSTyxW1="Alice", fld2VnoyuotSTy4g6=25)
+    m_list = requests_mock.get(
+        FakeModelByIds.meta.table.url,
+        json={"records": [{**record, "fields": {"fld1VnoyuotSTyxW1": "Alice"}}]},
+    )
+    m_get = requests_mock.get(
+        FakeModelByIds.meta.table.record_url(record["id"]), json=record
+    )
+
+    if methodname == "all":
+        obj = FakeModelByIds.all(fields=["fld1VnoyuotSTyxW1"])[0]
+    else:
+        obj = FakeModelByIds.from_ids([record["id"]], fields=["fld1VnoyuotSTyxW1"])[0]
+    assert m_list.last_request.qs["returnFieldsByFieldId"] == ["1"]
+    assert obj.Name == "Alice"
+    assert obj.Age == 25
+    assert m_get.call_count == 1
+    assert m_get.last_request.qs["returnFieldsByFieldId"] == ["1"]
+
+
+class DirtyModel(Model):
+    Meta = fake_meta()
+    name = f.TextField("Name")
+    tags = f.MultipleSelectField("Tags")
+    notes = f.TextField("Notes")
+    created = f.CreatedTimeField("Created")
+
+
+def test_dirty_fields():
+    """
+    Test that save() only sends fields which were changed since the model
+    was fetched or last saved, and sends nothing if the model is unchanged.
+    """
+    record = fake_record(
+        Name="Alice", Tags=["a"], Notes="...", Created=fake_record()["createdTime"]
+    )
+    obj = DirtyModel.from_record(record)
+    assert not obj.is_dirty()
+    assert obj.dirty_fields() == set()
+
+    with mock.patch("pyairtable.Table.update", return_value=record) as m:
+        assert obj.save() is False
+        m.assert_not_called()
+
+        obj.name = "Bob"
+        assert obj.is_dirty()
+        assert obj.dirty_fields() == {"name"}
+        obj.save()
+        m.assert_called_once_with(record["id"], {"Name": "Bob"}, typecast=True)
+        assert not obj.is_dirty()
+
+        m.reset_mock()
+        obj.save()
+        m.assert_not_called()
+
+        obj.save(force=True)
+        m.assert_called_once_with(
+            record["id"],
+            {"Name": "Bob", "Tags": ["a"], "Notes": "..."},
+            typecast=True,
+        )
+
+
+def test_dirty_fields__modified_in_place():
+    """
+    Test that changes to a list are detected even if it is modified in place,
+    including after the model has been saved.
+    """
+    record = fake_record(Tags=["a"])
+    obj = DirtyModel.from_record(record)
+    tags = obj.tags
+    assert not obj.is_dirty()
+
+    with mock.patch("pyairtable.Table.update", return_value=record) as m:
+        tags.append("b")
+        assert obj.dirty_fields() == {"tags"}
+        obj.save()
+        m.assert_called_once_with(record["id"], {"Tags": ["a", "b"]}, typecast=True)
+
+        m.reset_mock()
+        tags.remove("a")
+        obj.save()
+        m.assert_called_once_with(record["id"], {"Tags": ["b"]}, typecast=True)
+
+
+def test_dirty_fields__unsaved():
+    obj = DirtyModel(name="Alice")
+    assert obj.is_dirty()
+    assert obj.dirty_fields() == {"name"}
+    assert DirtyModel().is_dirty()
+    assert not DirtyModel(id=fake_id()).is_dirty()
+
+
+def test_dirty_fields__fetch():
+    """
+    Test that fetching a model discards the record of which fields changed.
+    """
+    obj = DirtyModel(id=fake_id(), name="Alice")
+    with mock.patch("pyairtable.Table.get", return_value=fake_record(Name="Bob")):
+        obj.fetch()
+    assert not obj.is_dirty()
+
+
+def test_batch_save__dirty_fields():
+    """
+    Test that batch_save() only sends changed fields, and skips unchanged models.
+    """
+    records = [fake_record(Name=str(n), Notes="...") for n in range(3)]
+    objs = [DirtyModel.from_record(record) for record in records]
+    objs[1].name = "changed"
+
+    with mock.patch("pyairtable.Table.batch_update") as m_update, mock.patch(
+        "pyairtable.Table.batch_create", return_value=[]
+    ):
+        DirtyModel.batch_save(objs)
+        m_update.assert_called_once_with(
+            [{"id": objs[1].id, "fields": {"Name": "changed"}}],
+            typecast=True,
+        )
+
+    assert not any(obj.is_dirty() for obj in objs)
+
+
+@pytest.fixture
+def mock_batch_save(requests_mock):
+    """
+    Respond to batch creates and updates by echoing back their records,
+    failing any request which includes a record named "fail".
+    """
+
+    def _records(request, context):
+        records = [
+            fake_record(record["fields"], id=record.get("id"))
+            for record in request.json()["records"]
+        ]
+        if any(r["fields"].get("Name") == "fail" for r in records):
+            context.status_code = 422
+            return {"error": "INVALID_VALUE_FOR_COLUMN"}
+        return {"records": records}
+
+    url = DirtyModel.meta.table.url
+    return {
+        "POST": requests_mock.post(url, json=_records),
+        "PATCH": requests_mock.patch(url, json=_records),
+    }
+
+
+def test_batch_save__workers(mock_batch_save):
+    """
+    Test that batch_save() can send creates and updates concurrently,
+    and saves every chunk it can even if some of them fail.
+    """
+    existing = [DirtyModel.from_record(fake_record(Name=str(n))) for n in range(15)]
+    for obj in existing:
+        obj.notes = "changed"
+    new = [DirtyModel(name=str(n)) for n in range(25)]
+    new[22].name = "fail"
+    limiter = DirtyModel.meta.api._default_rate_limiter
+    granted = limiter.stats().granted
+
+    with pytest.raises(BatchError) as exc_info:
+        DirtyModel.batch_save(existing + new, workers=4)
+
+    assert mock_batch_save["PATCH"].call_count == 2
+    assert mock_batch_save["POST"].call_count == 3
+    assert limiter.stats().granted - granted == 5
+    assert exc_info.value.failed == new[20:]
+    assert exc_info.value.succeeded == existing + new[:20]
+    assert all(obj.id and not obj.is_dirty() for obj in existing + new[:20])
+    assert not any(obj.id for obj in new[20:])
+
+    new[22].name = "ok"
+    DirtyModel.batch_save(exc_info.value.failed, workers=4)
+    assert all(obj.id and obj.created_time for obj in new)
+
+
+def test_batch_save__partial_failure(mock_batch_save):
+    """
+    Test that without workers, batch_save() stops at the first failure,
+    but keeps the IDs of any records which were already created.
+    """
+    new = [DirtyModel(name=str(n)) for n in range(15)]
+    new[12].name = "fail"
+    with pytest.raises(requests.HTTPError):
+        DirtyModel.batch_save(new)
+    assert all(obj.id for obj in new[:10])
+    assert not any(obj.id for obj in new[10:])
+
+
+class LazyModel(Model):
+    Meta = fake_meta(lazy_conversion=True)
+    name = f.TextField("Name")
+    when = f.DatetimeField("When")
+    tags = f.MultipleSelectField("Tags")
+
+
+def test_lazy_conversion():
+    """
+    Test that Meta.lazy_conversion defers converting each field value
+    until the first time it is accessed, and only converts it once.
+    """
+    record = fake_record(Name="Alice", When="2024-02-29T12:34:56.000Z", Tags=["a"])
+    with mock.patch.object(
+        f.DatetimeField,
+        "to_internal_value",
+        autospec=True,
+        side_effect=f.DatetimeField.to_internal_value,
+    ) as m:
+        obj = LazyModel.from_record(record)
+        assert m.call_count == 0
+        assert obj.when == datetime.datetime(
+            2024, 2, 29, 12, 34, 56, tzinfo=datetime.timezone.utc
+        )
+        assert obj.when is obj.when
+        assert m.call_count == 1
+
+    assert obj.name == "Alice"
+    assert obj.tags == ["a"]
+    assert not obj.is_dirty()
+
+
+def test_lazy_conversion__threads():
+    """
+    Test that concurrent readers of the same field convert it only once,
+    and none of them sees the value from the API.
+    """
+    record = fake_record(When="2024-02-29T12:34:56.000Z")
+    obj = LazyModel.from_record(record)
+    start = threading.Barrier(8)
+    convert = f.DatetimeField.to_internal_value
+
+    def _slowly(field, value):
+        time.sleep(0.01)
+        return convert(field, value)
+
+    def _read(_):
+        start.wait()
+        return obj.when
+
+    with mock.patch.object(
+        f.DatetimeField, "to_internal_value", autospec=True, side_effect=_slowly
+    ) as m:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(_read, range(8)))
+
+    assert m.call_count == 1
+    assert all(result is results[0] for result in results)
+    assert isinstance(results[0], datetime.datetime)
+
+
+def test_lazy_conversion__to_record():
+    """
+    Test that values which were never accessed are sent back to the API as-is,
+    and values which were accessed or changed are converted as usual.
+    """
+    record = fake_record(When="2024-02-29T12:34:56Z", Tags=["a"])
+    obj = LazyModel.from_record(record)
+    assert obj.to_record()["fields"] == {"When": "2024-02-29T12:34:56Z", "Tags": ["a"]}
+
+    obj.when
+    obj.tags.append("b")
+    assert obj.dirty_fields() == {"tags"}
+    assert obj.to_record()["fields"] == {
+        "When": "2024-02-29T12:34:56.000Z",
+        "Tags": ["a", "b"],
+    }
+
+    obj = LazyModel.from_record(record)
+    obj.when = datetime.datetime(2024, 3, 1, tzinfo=datetime.timezone.utc)
+    assert obj.when.month == 3
+    assert obj.to_record()["fields"]["When"] == "2024-03-01T00:00:00.000Z"
+
+
+class CompactModel(Model):
+    Meta = fake_meta(compact=True)
+    name = f.TextField("Name")
+    when = f.DatetimeField("When")
+    tags = f.MultipleSelectField("Tags")
+    count = f.CountField("Count")
+
+
+def test_compact(requests_mock):
+    """
+    Test that Meta.compact stores field values in a list,
+    without changing how the model behaves.
+    """
+    record = fake_record(Name="Alice", When="2024-02-29T12:34:56.000Z", Extra=1)
+    obj = CompactModel.from_record(record)
+    assert obj._fields == {"Name": "Alice", "When": obj.when}
+    assert obj._fields._values[2:] == [_MISSING, _MISSING]
+    assert obj.tags == []
+    assert obj.count is None
+    assert obj.to_record()["fields"] == {
+        "Name": "Alice",
+        "When": "2024-02-29T12:34:56.000Z",
+        "Tags": [],
+    }
+
+    obj.tags.append("a")
+    obj.name = "Bob"
+    assert obj.dirty_fields() == {"name", "tags"}
+    m = requests_mock.patch(CompactModel.meta.table.record_url(obj.id), json=record)
+    assert obj.save() is False
+    assert m.last_request.json()["fields"] == {"Name": "Bob", "Tags": ["a"]}
+
+    del obj._fields["Name"]
+    assert obj.name == ""
+    with pytest.raises(KeyError):
+        del obj._fields["Name"]
+
+
+def test_compact__memory():
+    """
+    Test that compact instances of a model with many fields
+    use substantially less memory than regular ones.
+    """
+    records = [fake_record({f"Field {n}": "x" for n in range(20)}) for _ in range(100)]
+
+    def measure(compact):
+        # Descriptors are bound to the class they are defined on,
+        # so each model needs its own field instances.
+        fields = {f"f{n}": f.TextField(f"Field {n}") for n in range(20)}
+        model = type("M", (Model,), {"Meta": fake_meta(compact=compact), **fields})
+        model.from_record(records[0])  # don't measure anything built once per class
+        tracemalloc.start()
+        try:
+            instances = [model.from_record(record) for record in records]
+            return tracemalloc.get_traced_memory()[0] / len(instances)
+        finally:
+            tracemalloc.stop()
+
+    assert measure(compact=True) < 0.8 * measure(compact=False)
+
+
+def test_descriptor_maps():
+    """
+    Test that descriptor maps and converters are built once per class,
+    and only include converters for fields which need them.
+    """
+    assert (
+        LazyModel._attribute_descriptor_map() is LazyModel._attribute_descriptor_map()
     )
+    assert LazyModel._field_name_descriptor_map() == {
+        "Name": LazyModel.name,
+        "When": LazyModel.when,
+        "Tags": LazyModel.tags,
+    }
+    assert set(LazyModel._internal_converters) == {"When"}
+    assert set(LazyModel._record_converters) == {"When"}
+    assert set(DirtyModel._writable_field_names) == {"Name", "Tags", "Notes"}
 
 
 @pytest.fixture
@@ -291,7 +791,8 @@ def test_get_fields_by_id(fake_records_by_id):
     """
     with Mocker() as mock:
         mock.get(
-            f"{FakeModelByIds.meta.table.url}?&returnFieldsByFieldId=1&cellFormat=json",
+            f"{FakeModelByIds.meta.table.url}?&returnFieldsByFieldId=1&cellFormat=json"
+            "&fields[]=fld1VnoyuotSTyxW1&fields[]=fld2VnoyuotSTy4g6",
             json=fake_records_by_id,
             complete_qs=True,
             status_code=200,
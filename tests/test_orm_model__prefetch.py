@@ -0,0 +1,115 @@
+import pytest
+
+from pyairtable.orm import Model
+from pyairtable.orm import fields as f
+from pyairtable.testing import fake_meta, fake_record
+
+
+class Publisher(Model):
+    Meta = fake_meta()
+    name = f.TextField("Name")
+
+
+class Book(Model):
+    Meta = fake_meta()
+    title = f.TextField("Title")
+    publisher = f.SingleLinkField("Publisher", Publisher)
+
+
+class Author(Model):
+    Meta = fake_meta()
+    name = f.TextField("Name")
+    books = f.LinkField("Books", Book)
+
+
+@pytest.fixture
+def mock_tables(requests_mock):
+    """
+    Set up three authors who share a publisher and have two books each,
+    one of which was co-written by all three.
+    """
+    publisher = fake_record(Name="Penguin")
+    shared = fake_record(Title="Anthology", Publisher=[publisher["id"]])
+    books = [
+        fake_record(Title=f"Book {n}", Publisher=[publisher["id"]]) for n in range(3)
+    ]
+    authors = [
+        fake_record(Name=f"Author {n}", Books=[book["id"], shared["id"]])
+        for n, book in enumerate(books)
+    ]
+    return {
+        "authors": requests_mock.get(Author.meta.table.url, json={"records": authors}),
+        "books": requests_mock.get(
+            Book.meta.table.url, json={"records": [*books, shared]}
+        ),
+        "publishers": requests_mock.get(
+            Publisher.meta.table.url, json={"records": [publisher]}
+        ),
+    }
+
+
+def test_prefetch(mock_tables):
+    """
+    Test that prefetch() retrieves linked records for every instance
+    with one request per link field, and wires them into each instance.
+    """
+    authors = Author.all()
+    Author.prefetch(authors, "books", "books.publisher")
+    assert mock_tables["books"].call_count == 1
+    assert mock_tables["publishers"].call_count == 1
+
+    # Accessing linked records will not make any more API calls.
+    assert [book.title for book in authors[0].books] == ["Book 0", "Anthology"]
+    assert authors[0].books[1] is authors[2].books[1]
+    assert {book.publisher.name for a in authors for book in a.books} == {"Penguin"}
+    assert mock_tables["books"].call_count == 1
+    assert mock_tables["publishers"].call_count == 1
+
+    # Prefetching does not count as changing the instances.
+    assert not any(author.is_dirty() for author in authors)
+
+
+def test_all__prefetch(mock_tables):
+    authors = Author.all(prefetch=["books"])
+    assert mock_tables["books"].call_count == 1
+    assert all(isinstance(book, Book) for a in authors for book in a.books)
+    assert mock_tables["publishers"].call_count == 0
+
+
+def test_all__prefetch__deferred(mock_tables):
+    """
+    Test that prefetching a link field which was left out of the projection
+    retrieves it for every instance at once, not with one request per instance.
+    """
+    authors = Author.all(fields=["Name"], prefetch=["books"])
+    assert mock_tables["authors"].call_count == 2
+    assert mock_tables["authors"].last_request.qs["fields[]"] == ["Books"]
+    assert mock_tables["books"].call_count == 1
+    assert [book.title for book in authors[0].books] == ["Book 0", "Anthology"]
+    assert mock_tables["authors"].call_count == 2
+    assert not any(author.is_dirty() for author in authors)
+
+
+def test_prefetch__already_populated(mock_tables):
+    """
+    Test that prefetch() skips links which are already instances,
+    but still prefetches the next level of the path.
+    """
+    authors = Author.all()
+    authors[0].books
+    assert mock_tables["books"].call_count == 1
+    assert not authors[0].is_dirty()
+    Author.prefetch(authors[:1], "books.publisher")
+    assert mock_tables["books"].call_count == 1
+    assert mock_tables["publishers"].call_count == 1
+
+
+@pytest.mark.parametrize("path", ["name", "missing", "books.title"])
+def test_prefetch__invalid_path(mock_tables, path):
+    with pytest.raises(ValueError):
+        Author.prefetch(Author.all(), path)
+
+
+def test_prefetch__invalid_instance():
+    with pytest.raises(TypeError):
+        Author.prefetch([Book()], "publisher")
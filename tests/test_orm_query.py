@@ -0,0 +1,177 @@
+import pytest
+
+from pyairtable.orm import Model
+from pyairtable.orm import fields as f
+from pyairtable.orm.query import QuerySet
+from pyairtable.testing import fake_meta, fake_record
+
+
+class Contact(Model):
+    Meta = fake_meta()
+    name = f.TextField("Name")
+    email = f.EmailField("Email")
+    age = f.IntegerField("Age")
+
+
+@pytest.fixture
+def records():
+    return [fake_record(Name=f"Person {n}", Age=n) for n in range(5)]
+
+
+@pytest.fixture
+def mock_list(requests_mock, records):
+    """
+    Respond to list requests with two pages, ignoring any limits in the request.
+    """
+    url = Contact.meta.table.url
+    return requests_mock.get(
+        url,
+        [
+            {"json": {"records": records[:3], "offset": "page2"}},
+            {"json": {"records": records[3:]}},
+        ],
+    )
+
+
+def test_lazy(mock_list):
+    """
+    Test that building a query set does not send any requests.
+    """
+    query = Contact.objects.filter(age=1).order_by("name").only("name")[:3]
+    assert isinstance(query, QuerySet)
+    assert query.model is Contact
+    assert mock_list.call_count == 0
+
+
+def test_options():
+    query = (
+        Contact.objects.filter(Contact.age.gt(30))
+        .filter(name="Alice")
+        .order_by("-name", "age")
+        .only("name", "email")
+    )
+    options = query._options()
+    assert str(options["formula"]) == "AND({Age}>30, {Name}='Alice')"
+    assert options["sort"] == ["-Name", "Age"]
+    assert options["fields"] == ["Name", "Email"]
+    assert "max_records" not in options
+    assert str(Contact.objects.filter(age=1)._options()["formula"]) == "{Age}=1"
+
+
+@pytest.mark.parametrize("method", ["filter", "order_by", "only"])
+def test_invalid_name(method):
+    args, kwargs = (("bogus",), {}) if method != "filter" else ((), {"bogus": 1})
+    with pytest.raises(ValueError):
+        getattr(Contact.objects, method)(*args, **kwargs)
+
+
+def test_iterator(mock_list, records):
+    query = Contact.objects.filter(Contact.age.gte(0)).order_by("-age")
+    contacts = list(query.iterator(chunk_size=3))
+    assert [c.id for c in contacts] == [r["id"] for r in records]
+    assert mock_list.call_count == 2
+    assert mock_list.last_request.qs["pageSize"] == ["3"]
+    assert mock_list.last_request.qs["filterByFormula"] == ["{Age}>=0"]
+    assert mock_list.last_request.qs["sort[0][field]"] == ["Age"]
+    assert mock_list.last_request.qs["sort[0][direction]"] == ["desc"]
+
+
+def test_iterator__stops_early(mock_list, records):
+    """
+    Test that records are not retrieved until they are needed.
+    """
+    it = iter(Contact.objects)
+    assert next(it).id == records[0]["id"]
+    assert mock_list.call_count == 1
+
+
+def test_all(mock_list, records):
+    assert [c.name for c in Contact.objects.all()] == [
+        r["fields"]["Name"] for r in records
+    ]
+
+
+@pytest.mark.parametrize(
+    "key,max_records,expected",
+    [
+        (slice(None, 2), "2", [0, 1]),
+        (slice(1, 3), "3", [1, 2]),
+        (slice(3, None), None, [3, 4]),
+    ],
+)
+def test_slice(mock_list, records, key, max_records, expected):
+    """
+    Test that slicing maps to maxRecords and skips records before the start.
+    """
+    query = Contact.objects[key]
+    assert mock_list.call_count == 0
+    # our mock doesn't respect maxRecords, so limit the results ourselves
+    contacts = list(query)[: len(expected)]
+    assert [c.id for c in contacts] == [records[n]["id"] for n in expected]
+    assert mock_list.request_history[0].qs.get("maxRecords", [None])[0] == max_records
+
+
+def test_slice__nested():
+    query = Contact.objects[2:10][1:4]
+    assert (query.start, query.stop) == (3, 6)
+    query = Contact.objects[2:4][1:10]
+    assert (query.start, query.stop) == (3, 4)
+
+
+def test_slice__empty(mock_list):
+    assert list(Contact.objects[3:3]) == []
+    assert list(Contact.objects[5:2]) == []
+    assert mock_list.call_count == 0
+
+
+@pytest.mark.parametrize("key", [slice(None, None, 2), slice(-1, None), -1])
+def test_slice__invalid(key):
+    with pytest.raises(ValueError):
+        Contact.objects[key]
+
+
+def test_index(mock_list, records):
+    assert Contact.objects[4].id == records[4]["id"]
+    assert mock_list.last_request.qs["maxRecords"] == ["5"]
+
+
+def test_index__missing(requests_mock):
+    requests_mock.get(Contact.meta.table.url, json={"records": []})
+    with pytest.raises(IndexError):
+        Contact.objects[0]
+
+
+def test_first(mock_list, records):
+    assert Contact.objects.order_by("name").first().id == records[0]["id"]
+    assert mock_list.last_request.qs["maxRecords"] == ["1"]
+
+
+@pytest.mark.parametrize("only,expected", [((), "Name"), (("age", "name"), "Age")])
+def test_count(mock_list, only, expected):
+    """
+    Test that count() only retrieves one field of each record.
+    """
+    assert Contact.objects.only(*only).count() == 5
+    assert mock_list.last_request.qs["fields[]"] == [expected]
+
+
+def test_exists(mock_list, requests_mock):
+    assert Contact.objects.filter(age=3).exists() is True
+    assert mock_list.call_count == 1
+    assert mock_list.last_request.qs["maxRecords"] == ["1"]
+
+    requests_mock.get(Contact.meta.table.url, json={"records": []})
+    assert Contact.objects.exists() is False
+
+
+def test_only__deferred(mock_list, records, requests_mock):
+    """
+    Test that fields left out by only() are retrieved when they are accessed.
+    """
+    record = records[0]
+    m = requests_mock.get(Contact.meta.table.record_url(record["id"]), json=record)
+    contact = Contact.objects.only("name")[0]
+    assert mock_list.last_request.qs["fields[]"] == ["Name"]
+    assert m.call_count == 0
+    assert contact.age == 0
+    assert m.call_count == 1
@@ -4,6 +4,7 @@ from requests_mock import Mocker
 
 from pyairtable.api.params import (
     dict_list_to_request_params,
+    estimate_url_length,
     field_names_to_sorting_dict,
     options_to_json_and_params,
     options_to_params,
@@ -205,3 +206,24 @@ def test_field_names_to_sorting_dict():
             "direction": "desc",
         },
     ]
+
+
+@pytest.mark.parametrize("url", ["https://example.com/v0/app/tbl", "https://x/?a=1"])
+@pytest.mark.parametrize(
+    "options",
+    [
+        {},
+        {"view": "Grid view"},
+        {"fields": ["Name", "Émoji 🙂", "a&b=c"], "sort": ["-Age"]},
+        {"formula": "AND({Name}='x', {Age} > 1)", "max_records": 5},
+        {"cell_format": "string", "user_locale": None},
+        {"use_field_ids": True},
+    ],
+)
+def test_estimate_url_length(url, options):
+    """
+    Test that our estimate matches the URL that requests would build.
+    """
+    params = options_to_params(options)
+    prepared = requests.Request("GET", url, params=params).prepare()
+    assert estimate_url_length(url, params) == len(prepared.url)
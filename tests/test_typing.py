@@ -88,6 +88,10 @@ if TYPE_CHECKING:
     assert_type(movie.prequels, List[Movie])
     assert_type(movie.prequel, Optional[Movie])
     assert_type(movie.actors[0].name, str)
+    assert_type(Movie.objects.filter(name="Jaws"), orm.query.QuerySet[Movie])
+    assert_type(Movie.objects.first(), Optional[Movie])
+    assert_type(Movie.objects[0], Movie)
+    assert_type(list(Movie.objects[:5]), List[Movie])
 
     class EveryField(orm.Model):
         aitext = orm.fields.AITextField("AI Generated Text")
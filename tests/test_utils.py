@@ -1,3 +1,6 @@
+import json
+import sys
+import time
 from datetime import date, datetime, timezone
 from functools import partial
 
@@ -94,3 +97,94 @@ def test_converter(func, input, expected):
         return
 
     assert func(input) == expected
+
+
+@pytest.mark.parametrize("depth", [1, 3])
+def test_prefetch(depth):
+    consumed = []
+
+    def _items():
+        for n in range(5):
+            consumed.append(n)
+            yield n
+
+    assert list(utils.prefetch(_items(), depth)) == [0, 1, 2, 3, 4]
+    assert consumed == [0, 1, 2, 3, 4]
+
+
+def test_prefetch__depth():
+    """
+    Test that the background thread does not get more than ``depth`` items ahead.
+    """
+    consumed = []
+
+    def _items():
+        for n in range(10):
+            consumed.append(n)
+            yield n
+
+    it = utils.prefetch(_items(), 2)
+    assert next(it) == 0
+    time.sleep(0.2)
+    # one item handed to the caller, two more waiting in the queue
+    assert consumed == [0, 1, 2]
+    it.close()
+
+
+def test_prefetch__exception():
+    def _items():
+        yield 1
+        raise ValueError("oops")
+
+    it = utils.prefetch(_items())
+    assert next(it) == 1
+    with pytest.raises(ValueError, match="oops"):
+        next(it)
+
+
+def test_prefetch__invalid_depth():
+    with pytest.raises(ValueError):
+        list(utils.prefetch(iter([]), 0))
+
+
+@pytest.mark.parametrize("data", [b'{"a": [1, "\xc3\xa9"]}', '{"a": [1, "é"]}'])
+def test_json_loads(data):
+    assert utils.json_loads(data) == {"a": [1, "é"]}
+
+
+def test_json_loads__invalid():
+    with pytest.raises(ValueError):
+        utils.json_loads(b"{")
+
+
+def test_json_loads__fallback(monkeypatch):
+    """
+    Test that we use the standard library if orjson is not installed.
+    """
+    monkeypatch.setitem(sys.modules, "orjson", None)
+    assert utils._find_json_loads() is json.loads
+
+
+def test_chunked():
+    assert list(utils.chunked([1, 2, 3, 4, 5], 2)) == [[1, 2], [3, 4], [5]]
+    assert list(utils.chunked(iter([1, 2, 3, 4, 5]), 2)) == [[1, 2], [3, 4], [5]]
+    assert list(utils.chunked(iter([]), 2)) == []
+
+
+def test_chunked__lazy():
+    """
+    Test that chunked() does not consume an iterator beyond the current chunk.
+    """
+    consumed = []
+
+    def _numbers():
+        n = 0
+        while True:
+            consumed.append(n)
+            yield n
+            n += 1
+
+    chunks = utils.chunked(_numbers(), 3)
+    assert next(chunks) == [0, 1, 2]
+    assert next(chunks) == [3, 4, 5]
+    assert consumed == [0, 1, 2, 3, 4, 5]